@@ -107,13 +107,23 @@ class DNSConfig(PluginConfig):
         "dnssec_parent_ds_ttl": 86400,  # P1D
         "dnssec_parent_propagation_delay": 3600,  # PT1H
         "dnssec_dnskey_ttl": 3600,  # PT1H
+        "change_feed_enabled": False,
+        "change_feed_retention": 604800,  # P7D
+        "change_feed_max_timeout": 30,  # PT30S
+        "changelog_managed_records": "full",
+        "search_exclude_managed_records": False,
+        "unique_records_constraint": False,
+        "cascade_trace": False,
+        "cascade_trace_retention": 3600,  # PT1H
     }
     base_url = "netbox-dns"
+    middleware = ["netbox_dns.middleware.CascadeTraceMiddleware"]
 
     def ready(self):
         super().ready()
 
         import netbox_dns.signals.dnssec  # noqa: F401
+        import netbox_dns.signals.change_feed  # noqa: F401
 
         if not get_plugin_config("netbox_dns", "dnssync_disabled"):
             import netbox_dns.signals.ipam_dnssync  # noqa: F401
@@ -130,6 +140,15 @@ class DNSConfig(PluginConfig):
         ):
             _check_list(setting)
 
+        if get_plugin_config("netbox_dns", "changelog_managed_records") not in (
+            "full",
+            "compact",
+            "none",
+        ):
+            raise ImproperlyConfigured(
+                "changelog_managed_records must be 'full', 'compact' or 'none'"
+            )
+
 
 #
 # Initialize plugin config
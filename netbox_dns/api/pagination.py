@@ -0,0 +1,79 @@
+from django.utils.translation import gettext as _
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from netbox.api.pagination import OptionalLimitOffsetPagination
+
+from netbox_dns.utilities import encode_record_cursor, get_record_cursor_segments
+
+
+__all__ = ("RecordCursorPagination",)
+
+
+class RecordCursorPagination(OptionalLimitOffsetPagination):
+    """
+    Limit/offset pagination with an additional keyset mode that is enabled by
+    the 'cursor' query parameter. In keyset mode the records are ordered by
+    (fqdn, pk) and each page starts after the record denoted by the cursor,
+    which avoids both the offset scan and the total count on large tables.
+    Pass an empty cursor to retrieve the first page.
+    """
+
+    cursor_query_param = "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.cursor_mode = False
+            return super().paginate_queryset(queryset, request, view)
+
+        self.cursor_mode = True
+        self.request = request
+        self.limit = self.get_limit(request) or self.default_limit
+
+        try:
+            segments = get_record_cursor_segments(
+                queryset, request.query_params[self.cursor_query_param]
+            )
+        except ValueError:
+            raise serializers.ValidationError(
+                {self.cursor_query_param: _("Invalid cursor")}
+            )
+
+        results = []
+        for segment in segments:
+            results += segment[: self.limit + 1 - len(results)]
+            if len(results) > self.limit:
+                break
+        self.has_next = len(results) > self.limit
+        results = results[: self.limit]
+
+        self.next_cursor = encode_record_cursor(results[-1]) if results else None
+
+        return results
+
+    def get_next_link(self):
+        if not self.cursor_mode:
+            return super().get_next_link()
+
+        if not self.has_next:
+            return None
+
+        url = replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+        return replace_query_param(url, self.limit_query_param, self.limit)
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "cursor": self.next_cursor if self.has_next else None,
+                "results": data,
+            }
+        )
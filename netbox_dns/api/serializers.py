@@ -8,6 +8,7 @@ from .serializers_.zone_template import *
 from .serializers_.record_template import *
 from .serializers_.dnssec_key_template import *
 from .serializers_.dnssec_policy import *
+from .serializers_.change_feed import *
 
 from .serializers_.prefix import *
 
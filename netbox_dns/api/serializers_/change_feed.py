@@ -0,0 +1,61 @@
+from django.utils.translation import gettext as _
+from rest_framework import serializers
+
+from netbox_dns.models import ChangeFeedEntry
+
+
+__all__ = (
+    "ChangeFeedEntrySerializer",
+    "ChangeFeedQuerySerializer",
+)
+
+
+CHANGE_FEED_MAX_LIMIT = 1000
+CHANGE_FEED_MAX_TIMEOUT = 60
+
+
+class ChangeFeedEntrySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ChangeFeedEntry
+        fields = (
+            "id",
+            "time",
+            "action",
+            "object_type",
+            "object_id",
+            "zone_id",
+            "data",
+        )
+
+
+class ChangeFeedQuerySerializer(serializers.Serializer):
+    cursor = serializers.IntegerField(
+        required=False,
+        default=0,
+        min_value=0,
+        help_text=_("Return changes with an ID greater than the cursor"),
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        default=100,
+        min_value=1,
+        max_value=CHANGE_FEED_MAX_LIMIT,
+        help_text=_("Maximum number of changes to return"),
+    )
+    timeout = serializers.IntegerField(
+        required=False,
+        default=0,
+        min_value=0,
+        max_value=CHANGE_FEED_MAX_TIMEOUT,
+        help_text=_("Seconds to wait for new changes if there are none"),
+    )
+    zone_id = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        help_text=_("Only return changes for these zones"),
+    )
+    object_type = serializers.ChoiceField(
+        choices=("zone", "record"),
+        required=False,
+        help_text=_("Only return changes for zones or records"),
+    )
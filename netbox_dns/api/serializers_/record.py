@@ -4,14 +4,24 @@ from rest_framework import serializers
 from netbox.api.serializers import NetBoxModelSerializer
 from ipam.api.serializers import IPAddressSerializer
 from tenancy.api.serializers import TenantSerializer
+from tenancy.models import Tenant
 
-from netbox_dns.models import Record
+from netbox_dns.models import Record, Zone
+from netbox_dns.choices import RecordTypeChoices, RecordStatusChoices
 
-from ..nested_serializers import NestedZoneSerializer, NestedRecordSerializer
+from ..nested_serializers import (
+    NestedZoneSerializer,
+    NestedRecordSerializer,
+    NestedRecordTemplateSerializer,
+)
 from ..field_serializers import TimePeriodField
 
 
-__all__ = ("RecordSerializer",)
+__all__ = (
+    "RecordSerializer",
+    "RecordUpsertSerializer",
+    "RRSetSerializer",
+)
 
 
 class RecordSerializer(NetBoxModelSerializer):
@@ -50,6 +60,13 @@ class RecordSerializer(NetBoxModelSerializer):
         allow_null=True,
         help_text=_("IPAddress linked to the record"),
     )
+    record_template = NestedRecordTemplateSerializer(
+        many=False,
+        read_only=True,
+        required=False,
+        allow_null=True,
+        help_text=_("Record template the record was created from"),
+    )
     tenant = TenantSerializer(nested=True, required=False, allow_null=True)
 
     class Meta:
@@ -78,6 +95,7 @@ class RecordSerializer(NetBoxModelSerializer):
             "tenant",
             "ipam_ip_address",
             "absolute_value",
+            "record_template",
         )
         brief_fields = (
             "id",
@@ -94,3 +112,58 @@ class RecordSerializer(NetBoxModelSerializer):
             "managed",
             "active",
         )
+
+
+class RRSetRecordSerializer(serializers.Serializer):
+    value = serializers.CharField()
+    status = serializers.ChoiceField(choices=RecordStatusChoices, required=False)
+    disable_ptr = serializers.BooleanField(required=False)
+    description = serializers.CharField(required=False, allow_blank=True)
+    tenant = serializers.PrimaryKeyRelatedField(
+        queryset=Tenant.objects.all(),
+        required=False,
+        allow_null=True,
+    )
+
+
+class RecordUpsertItemSerializer(RRSetRecordSerializer):
+    name = serializers.CharField()
+    type = serializers.ChoiceField(choices=RecordTypeChoices)
+    ttl = TimePeriodField(required=False, allow_null=True)
+
+
+class RecordUpsertSerializer(serializers.Serializer):
+    zone = serializers.PrimaryKeyRelatedField(
+        queryset=Zone.objects.all(),
+        help_text=_("Zone the records belong to"),
+    )
+    name = serializers.CharField(
+        required=False,
+        help_text=_("Restrict the operation to records with this name"),
+    )
+    type = serializers.ChoiceField(
+        choices=RecordTypeChoices,
+        required=False,
+        help_text=_("Restrict the operation to records of this type"),
+    )
+    delete = serializers.BooleanField(
+        default=True,
+        help_text=_("Delete records in scope that are not in the desired set"),
+    )
+    records = RecordUpsertItemSerializer(
+        many=True,
+        help_text=_("Desired set of records"),
+    )
+
+
+class RRSetSerializer(serializers.Serializer):
+    ttl = TimePeriodField(
+        required=False,
+        allow_null=True,
+        help_text=_("TTL of all records in the RRset"),
+    )
+    records = RRSetRecordSerializer(
+        many=True,
+        allow_empty=False,
+        help_text=_("Records in the RRset"),
+    )
@@ -119,6 +119,13 @@ class ZoneSerializer(NetBoxModelSerializer):
         default=None,
         help_text=_("Template to apply to the zone"),
     )
+    zone_template = ZoneTemplateSerializer(
+        nested=True,
+        read_only=True,
+        required=False,
+        allow_null=True,
+        help_text=_("Zone template that was last applied to the zone"),
+    )
     active = serializers.BooleanField(
         required=False,
         read_only=True,
@@ -202,6 +209,7 @@ class ZoneSerializer(NetBoxModelSerializer):
             "custom_fields",
             "tenant",
             "template",
+            "zone_template",
         )
         brief_fields = (
             "id",
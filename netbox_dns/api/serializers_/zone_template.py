@@ -4,7 +4,7 @@ from rest_framework import serializers
 from netbox.api.serializers import NetBoxModelSerializer
 from tenancy.api.serializers_.tenants import TenantSerializer
 
-from netbox_dns.models import ZoneTemplate
+from netbox_dns.models import Zone, ZoneTemplate
 from netbox_dns.api.nested_serializers import NestedRecordTemplateSerializer
 
 from .nameserver import NameServerSerializer
@@ -13,7 +13,11 @@ from .registration_contact import RegistrationContactSerializer
 from .dnssec_policy import DNSSECPolicySerializer
 
 
-__all__ = ("ZoneTemplateSerializer",)
+__all__ = (
+    "ZoneTemplateSerializer",
+    "ZoneTemplateApplySerializer",
+    "ZoneTemplateSyncSerializer",
+)
 
 
 class ZoneTemplateSerializer(NetBoxModelSerializer):
@@ -147,3 +151,22 @@ class ZoneTemplateSerializer(NetBoxModelSerializer):
             "display",
             "description",
         )
+
+
+class ZoneTemplateApplySerializer(serializers.Serializer):
+    zones = serializers.PrimaryKeyRelatedField(
+        queryset=Zone.objects.all(),
+        many=True,
+        help_text=_("Zones the template is applied to"),
+    )
+
+
+class ZoneTemplateSyncSerializer(serializers.Serializer):
+    zones = serializers.PrimaryKeyRelatedField(
+        queryset=Zone.objects.all(),
+        many=True,
+        required=False,
+        help_text=_(
+            "Zones to synchronize with the template, defaults to all zones the template was applied to"
+        ),
+    )
@@ -0,0 +1,72 @@
+import csv
+import json
+
+from django.db.models import F
+from django.db.models.functions import Coalesce
+
+
+__all__ = (
+    "FLAT_RECORD_FIELDS",
+    "get_flat_records",
+    "stream_json_lines",
+    "stream_csv",
+)
+
+
+FLAT_RECORD_FIELDS = (
+    "id",
+    "zone",
+    "view",
+    "fqdn",
+    "type",
+    "ttl",
+    "value",
+    "status",
+)
+
+
+def get_flat_records(queryset, chunk_size=2000):
+    """
+    Return an iterator over the rows of a record queryset as tuples in the
+    order of FLAT_RECORD_FIELDS, without instantiating any model objects. The
+    TTL is the effective TTL, i.e. the zone's default TTL for records without
+    a TTL of their own.
+    """
+    return (
+        queryset.prefetch_related(None)
+        .order_by("fqdn", "pk")
+        .annotate(
+            flat_zone=F("zone__name"),
+            flat_view=F("zone__view__name"),
+            flat_ttl=Coalesce("ttl", "zone__default_ttl"),
+        )
+        .values_list(
+            "pk",
+            "flat_zone",
+            "flat_view",
+            "fqdn",
+            "type",
+            "flat_ttl",
+            "value",
+            "status",
+        )
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def stream_json_lines(rows):
+    for row in rows:
+        yield json.dumps(dict(zip(FLAT_RECORD_FIELDS, row))) + "\n"
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    writer = csv.writer(_Echo())
+
+    yield writer.writerow(FLAT_RECORD_FIELDS)
+    for row in rows:
+        yield writer.writerow(row)
@@ -1,3 +1,5 @@
+from django.urls import path
+
 from netbox.api.routers import NetBoxRouter
 
 from netbox_dns.api.views import (
@@ -6,6 +8,9 @@ from netbox_dns.api.views import (
     ZoneViewSet,
     NameServerViewSet,
     RecordViewSet,
+    RRSetView,
+    ChangeFeedView,
+    TraceView,
     RegistrarViewSet,
     RegistrationContactViewSet,
     ZoneTemplateViewSet,
@@ -31,4 +36,12 @@ router.register("dnssecpolicies", DNSSECPolicyViewSet)
 
 router.register("prefixes", PrefixViewSet)
 
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    path(
+        "rrsets/<int:zone_id>/<str:name>/<str:type>/",
+        RRSetView.as_view(),
+        name="rrset",
+    ),
+    path("changes/", ChangeFeedView.as_view(), name="changefeed"),
+    path("traces/<str:trace_id>/", TraceView.as_view(), name="trace"),
+]
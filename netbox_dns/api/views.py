@@ -1,23 +1,45 @@
+from time import monotonic, sleep
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext as _
-from rest_framework import serializers
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.response import Response
 from rest_framework.routers import APIRootView
+from rest_framework.views import APIView
+
+from core.api.serializers import JobSerializer
 
 from ipam.models import Prefix
 from ipam.filtersets import PrefixFilterSet
 
+from netbox.api.authentication import TokenPermissions
 from netbox.api.viewsets import NetBoxModelViewSet
+from netbox.authentication import ObjectPermissionBackend
+from netbox.plugins.utils import get_plugin_config
+from utilities.permissions import permission_is_exempt
 
 from netbox_dns.api.serializers import (
     ViewSerializer,
     ZoneSerializer,
     NameServerSerializer,
     RecordSerializer,
+    RecordUpsertSerializer,
+    RRSetSerializer,
     RegistrarSerializer,
     RegistrationContactSerializer,
     ZoneTemplateSerializer,
+    ZoneTemplateApplySerializer,
+    ZoneTemplateSyncSerializer,
     RecordTemplateSerializer,
     DNSSECKeyTemplateSerializer,
     DNSSECPolicySerializer,
+    ChangeFeedEntrySerializer,
+    ChangeFeedQuerySerializer,
     PrefixSerializer,
 )
 from netbox_dns.filtersets import (
@@ -43,7 +65,13 @@ from netbox_dns.models import (
     RecordTemplate,
     DNSSECKeyTemplate,
     DNSSECPolicy,
+    ChangeFeedEntry,
 )
+from netbox_dns.api.pagination import RecordCursorPagination
+from netbox_dns.api.streaming import get_flat_records, stream_csv, stream_json_lines
+from netbox_dns.jobs import ApplyZoneTemplateJob, SyncZoneTemplateJob
+from netbox_dns.middleware import get_trace_cache_key, may_trace
+from netbox_dns.utilities import zone_deletion_plan
 
 
 class NetBoxDNSRootView(APIRootView):
@@ -63,12 +91,15 @@ class ZoneViewSet(NetBoxModelViewSet):
         "nameservers",
         "tags",
         "soa_mname",
-        "records",
         "tenant",
     )
     serializer_class = ZoneSerializer
     filterset_class = ZoneFilterSet
 
+    def perform_bulk_destroy(self, objects):
+        with zone_deletion_plan(objects):
+            super().perform_bulk_destroy(objects)
+
 
 class NameServerViewSet(NetBoxModelViewSet):
     queryset = NameServer.objects.prefetch_related("zones", "tenant")
@@ -80,6 +111,61 @@ class RecordViewSet(NetBoxModelViewSet):
     queryset = Record.objects.prefetch_related("zone", "zone__view", "tenant")
     serializer_class = RecordSerializer
     filterset_class = RecordFilterSet
+    pagination_class = RecordCursorPagination
+
+    @action(detail=False, methods=["get"], url_path="flat")
+    def flat(self, request):
+        output = request.query_params.get("output", "jsonl")
+        if output not in ("jsonl", "csv"):
+            raise serializers.ValidationError(
+                {"output": _("Output format must be 'jsonl' or 'csv'")}
+            )
+
+        rows = get_flat_records(self.filter_queryset(self.queryset))
+
+        if output == "csv":
+            response = StreamingHttpResponse(stream_csv(rows), content_type="text/csv")
+            response["Content-Disposition"] = 'attachment; filename="records.csv"'
+        else:
+            response = StreamingHttpResponse(
+                stream_json_lines(rows), content_type="application/jsonl"
+            )
+
+        return response
+
+    @action(detail=False, methods=["post"], url_path="upsert")
+    def upsert(self, request):
+        serializer = RecordUpsertSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        actions = ["add", "change"]
+        if data["delete"]:
+            actions.append("delete")
+        for perm_action in actions:
+            if not request.user.has_perm(f"netbox_dns.{perm_action}_record"):
+                raise PermissionDenied(
+                    _("Permission to {action} records is required").format(
+                        action=perm_action
+                    )
+                )
+
+        zone = get_object_or_404(
+            Zone.objects.restrict(request.user, "change"), pk=data["zone"].pk
+        )
+
+        try:
+            result = zone.upsert_records(
+                data["records"],
+                name=data.get("name"),
+                type=data.get("type"),
+                delete=data["delete"],
+                user=request.user,
+            )
+        except ValidationError as exc:
+            raise serializers.ValidationError(exc.messages)
+
+        return Response(result)
 
     def create(self, request, *args, **kwargs):
         data = request.data
@@ -117,6 +203,206 @@ class RecordViewSet(NetBoxModelViewSet):
         return super().update(request, *args, **kwargs)
 
 
+class RRSetView(APIView):
+    """
+    Retrieve, replace or delete the RRset with a given name and type in a zone
+    as a whole.
+    """
+
+    queryset = Record.objects.all()
+
+    def get_view_name(self):
+        return "RRSet"
+
+    def _get_zone(self, request, zone_id, action):
+        return get_object_or_404(
+            Zone.objects.restrict(request.user, action), pk=zone_id
+        )
+
+    def _get_rrset(self, request, zone, name, type):
+        try:
+            return zone.get_rrset(name, type).restrict(request.user, "view")
+        except ValidationError as exc:
+            raise serializers.ValidationError(exc.messages)
+
+    def _get_response_data(self, request, zone, name, type):
+        records = self._get_rrset(request, zone, name, type).prefetch_related(
+            "zone", "zone__view", "tenant"
+        )
+        if not records:
+            raise NotFound(_("RRset not found"))
+
+        ttls = {record.ttl for record in records}
+
+        return {
+            "zone": zone.pk,
+            "name": records[0].name,
+            "type": records[0].type,
+            "ttl": ttls.pop() if len(ttls) == 1 else None,
+            "records": RecordSerializer(
+                records, many=True, context={"request": request}
+            ).data,
+        }
+
+    def _check_permissions(self, request, actions):
+        for perm_action in actions:
+            if not request.user.has_perm(f"netbox_dns.{perm_action}_record"):
+                raise PermissionDenied(
+                    _("Permission to {action} records is required").format(
+                        action=perm_action
+                    )
+                )
+
+    def get(self, request, zone_id, name, type):
+        zone = self._get_zone(request, zone_id, "view")
+
+        return Response(self._get_response_data(request, zone, name, type))
+
+    def put(self, request, zone_id, name, type):
+        self._check_permissions(request, ("add", "change", "delete"))
+        zone = self._get_zone(request, zone_id, "change")
+
+        serializer = RRSetSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            zone.replace_rrset(
+                name,
+                type,
+                serializer.validated_data["records"],
+                ttl=serializer.validated_data.get("ttl"),
+                user=request.user,
+            )
+        except ValidationError as exc:
+            raise serializers.ValidationError(exc.messages)
+
+        return Response(self._get_response_data(request, zone, name, type))
+
+    def delete(self, request, zone_id, name, type):
+        self._check_permissions(request, ("delete",))
+        zone = self._get_zone(request, zone_id, "change")
+
+        try:
+            deleted = zone.delete_rrset(name, type, user=request.user)
+        except ValidationError as exc:
+            raise serializers.ValidationError(exc.messages)
+
+        if not deleted:
+            raise NotFound(_("RRset not found"))
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ChangeFeedView(APIView):
+    """
+    Return the changes to zones and records after a cursor, optionally waiting
+    for new changes if there are none yet.
+    """
+
+    queryset = Record.objects.all()
+
+    POLL_INTERVAL = 1
+
+    def get_view_name(self):
+        return "Change Feed"
+
+    @staticmethod
+    def _may_view_all_zones(user):
+        """
+        Return whether 'user' is permitted to view all zones, i.e. is a
+        superuser, is exempt from the view permission or has the permission
+        without constraints.
+        """
+        if user.is_superuser or permission_is_exempt("netbox_dns.view_zone"):
+            return True
+
+        return any(
+            not constraints
+            for constraints in ObjectPermissionBackend()
+            .get_all_permissions(user)
+            .get("netbox_dns.view_zone", ())
+        )
+
+    def _restrict_entries(self, request, entries):
+        # +
+        # Entries for deleted zones cannot be checked against constrained
+        # permissions, so they are only returned to users permitted to view
+        # all zones. For other users they are excluded by the restriction to
+        # existing zones.
+        # -
+        if self._may_view_all_zones(request.user):
+            return entries
+
+        return entries.filter(
+            zone_id__in=Zone.objects.restrict(request.user, "view").values("pk")
+        )
+
+    def get(self, request):
+        for model_name in ("zone", "record"):
+            if not request.user.has_perm(f"netbox_dns.view_{model_name}"):
+                raise PermissionDenied(
+                    _("Permission to view {model_name}s is required").format(
+                        model_name=model_name
+                    )
+                )
+
+        serializer = ChangeFeedQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        entries = self._restrict_entries(
+            request, ChangeFeedEntry.objects.filter(pk__gt=params["cursor"])
+        )
+        if zone_ids := params.get("zone_id"):
+            entries = entries.filter(zone_id__in=zone_ids)
+        if object_type := params.get("object_type"):
+            entries = entries.filter(object_type=object_type)
+
+        # +
+        # Each waiting request occupies a worker, so the timeout is capped by
+        # the 'change_feed_max_timeout' setting.
+        # -
+        timeout = min(
+            params["timeout"],
+            get_plugin_config("netbox_dns", "change_feed_max_timeout", 30),
+        )
+        deadline = monotonic() + timeout
+        while True:
+            changes = list(entries[: params["limit"]])
+            if changes or monotonic() >= deadline:
+                break
+            sleep(self.POLL_INTERVAL)
+
+        return Response(
+            {
+                "cursor": changes[-1].pk if changes else params["cursor"],
+                "changes": ChangeFeedEntrySerializer(changes, many=True).data,
+            }
+        )
+
+
+class TraceView(APIView):
+    """
+    Return a cascade trace recorded for a request.
+    """
+
+    queryset = Zone.objects.all()
+
+    def get_view_name(self):
+        return "Cascade Trace"
+
+    def get(self, request, trace_id):
+        if not may_trace(request.user):
+            raise PermissionDenied(
+                _("Only staff users and superusers can retrieve traces")
+            )
+
+        if (trace_data := cache.get(get_trace_cache_key(trace_id))) is None:
+            raise NotFound(_("Trace {trace_id} not found").format(trace_id=trace_id))
+
+        return Response(trace_data)
+
+
 class RegistrarViewSet(NetBoxModelViewSet):
     queryset = Registrar.objects.all()
     serializer_class = RegistrarSerializer
@@ -129,11 +415,129 @@ class RegistrationContactViewSet(NetBoxModelViewSet):
     filterset_class = RegistrationContactFilterSet
 
 
+class ZoneTemplateActionPermissions(TokenPermissions):
+    """
+    Applying and synchronizing a zone template changes zones and records, but
+    not the template itself, so the POST actions only require permission to
+    view the template. The actions check the permissions for the zones and
+    records themselves.
+    """
+
+    perms_map = TokenPermissions.perms_map | {
+        "POST": ["%(app_label)s.view_%(model_name)s"],
+    }
+
+
 class ZoneTemplateViewSet(NetBoxModelViewSet):
     queryset = ZoneTemplate.objects.all()
     serializer_class = ZoneTemplateSerializer
     filterset_class = ZoneTemplateFilterSet
 
+    @staticmethod
+    def _check_permissions(request, permissions, message):
+        if not all(
+            request.user.has_perm(f"netbox_dns.{permission}")
+            for permission in permissions
+        ):
+            raise PermissionDenied(message)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="apply",
+        permission_classes=[ZoneTemplateActionPermissions],
+    )
+    def apply(self, request, pk=None):
+        self._check_permissions(
+            request,
+            ("change_zone", "add_record"),
+            _(
+                "Applying a zone template requires permission to change zones and to add records"
+            ),
+        )
+
+        template = get_object_or_404(
+            ZoneTemplate.objects.restrict(request.user, "view"), pk=pk
+        )
+
+        serializer = ZoneTemplateApplySerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        zones = Zone.objects.restrict(request.user, "change").filter(
+            pk__in=[zone.pk for zone in serializer.validated_data["zones"]]
+        )
+        if len(zones) != len(serializer.validated_data["zones"]):
+            raise PermissionDenied(_("Permission to change all zones is required"))
+
+        job = ApplyZoneTemplateJob.enqueue(
+            instance=template,
+            user=request.user,
+            zones=[zone.pk for zone in zones],
+        )
+
+        return Response(
+            JobSerializer(job, context={"request": request}).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+    @action(detail=True, methods=["get"], url_path="drift")
+    def drift(self, request, pk=None):
+        template = get_object_or_404(
+            ZoneTemplate.objects.restrict(request.user, "view"), pk=pk
+        )
+
+        drift = template.get_drift(
+            template.zones.restrict(request.user, "view").only("pk")
+        )
+
+        return Response(
+            [
+                {"zone": zone_pk, **zone_drift}
+                for zone_pk, zone_drift in sorted(drift.items())
+            ]
+        )
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="sync",
+        permission_classes=[ZoneTemplateActionPermissions],
+    )
+    def sync(self, request, pk=None):
+        self._check_permissions(
+            request,
+            ("change_zone", "add_record", "change_record"),
+            _(
+                "Synchronizing a zone template requires permission to change zones and to add and change records"
+            ),
+        )
+
+        template = get_object_or_404(
+            ZoneTemplate.objects.restrict(request.user, "view"), pk=pk
+        )
+
+        serializer = ZoneTemplateSyncSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        zones = template.zones.all()
+        if (selected_zones := serializer.validated_data.get("zones")) is not None:
+            zones = zones.filter(pk__in=[zone.pk for zone in selected_zones])
+
+        zone_pks = list(zones.values_list("pk", flat=True))
+        if zones.restrict(request.user, "change").count() != len(zone_pks):
+            raise PermissionDenied(_("Permission to change all zones is required"))
+
+        job = SyncZoneTemplateJob.enqueue(
+            instance=template,
+            user=request.user,
+            zones=zone_pks,
+        )
+
+        return Response(
+            JobSerializer(job, context={"request": request}).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
 
 class RecordTemplateViewSet(NetBoxModelViewSet):
     queryset = RecordTemplate.objects.all()
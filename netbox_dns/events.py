@@ -0,0 +1,94 @@
+from core.events import OBJECT_CREATED, OBJECT_UPDATED, OBJECT_DELETED
+from core.models import ObjectType
+from extras.events import process_event_queue as netbox_process_event_queue
+from extras.events import serialize_for_event
+
+from netbox_dns.models import Zone, Record
+
+
+__all__ = (
+    "coalesce_events",
+    "process_event_queue",
+)
+
+
+RECORD_CHANGE_KEYS = {
+    OBJECT_CREATED: "created",
+    OBJECT_UPDATED: "updated",
+    OBJECT_DELETED: "deleted",
+}
+
+RECORD_CHANGE_FIELDS = (
+    "id",
+    "name",
+    "type",
+    "value",
+)
+
+
+def coalesce_events(events):
+    """
+    Replace the events for zones and records in a list of queued events by one
+    event per zone. The event for a zone is the zone's own event if there is
+    one, otherwise an update event for the zone. Its data contains a compact
+    summary of the created, updated and deleted records in the zone in the key
+    'record_changes'. All other events are returned unchanged.
+    """
+    zone_type = ObjectType.objects.get_for_model(Zone)
+    record_type = ObjectType.objects.get_for_model(Record)
+
+    coalesced_events = []
+    zone_events = {}
+    first_events = {}
+    record_changes = {}
+
+    for event in events:
+        if event["object_type"] == zone_type:
+            zone_pk = event["object_id"]
+            zone_events[zone_pk] = event
+        elif event["object_type"] == record_type:
+            zone_pk = event["data"]["zone"]["id"]
+            changes = record_changes.setdefault(
+                zone_pk, {key: [] for key in RECORD_CHANGE_KEYS.values()}
+            )
+            changes[RECORD_CHANGE_KEYS[event["event_type"]]].append(
+                {field: event["data"].get(field) for field in RECORD_CHANGE_FIELDS}
+            )
+        else:
+            coalesced_events.append(event)
+            continue
+
+        first_events.setdefault(zone_pk, event)
+
+    zones = Zone.objects.in_bulk(
+        [zone_pk for zone_pk in first_events if zone_pk not in zone_events]
+    )
+
+    for zone_pk, event in first_events.items():
+        if (zone_event := zone_events.get(zone_pk)) is not None:
+            event = zone_event | {"data": dict(zone_event["data"])}
+        else:
+            zone = zones.get(zone_pk)
+            event = event | {
+                "object_type": zone_type,
+                "object_id": zone_pk,
+                "event_type": OBJECT_UPDATED,
+                "data": serialize_for_event(zone) if zone else {"id": zone_pk},
+                "snapshots": {"prechange": None, "postchange": None},
+            }
+
+        event["data"]["record_changes"] = record_changes.get(
+            zone_pk, {key: [] for key in RECORD_CHANGE_KEYS.values()}
+        )
+        coalesced_events.append(event)
+
+    return coalesced_events
+
+
+def process_event_queue(events):
+    """
+    Drop-in replacement for 'extras.events.process_event_queue' in the
+    EVENTS_PIPELINE setting that processes the event rules for one coalesced
+    event per zone instead of one event per zone and record.
+    """
+    netbox_process_event_queue(coalesce_events(events))
@@ -1,4 +1,5 @@
 import netaddr
+from dns.exception import DNSException
 
 import django_filters
 from django.db.models import Q
@@ -10,8 +11,9 @@ from utilities.filters import MultiValueCharFilter
 
 from ipam.models import IPAddress
 
-from netbox_dns.models import View, Zone, Record
+from netbox_dns.models import View, Zone, Record, RecordTemplate
 from netbox_dns.choices import RecordTypeChoices, RecordStatusChoices
+from netbox_dns.utilities import reverse_name_labels
 
 
 __all__ = ("RecordFilterSet",)
@@ -72,10 +74,24 @@ class RecordFilterSet(TenancyFilterSet, NetBoxModelFilterSet):
         to_field_name="id",
         label=_("IPAM IP Address"),
     )
+    record_template_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=RecordTemplate.objects.all(),
+        label=_("Record Template ID"),
+    )
+    record_template = django_filters.ModelMultipleChoiceFilter(
+        queryset=RecordTemplate.objects.all(),
+        field_name="record_template__name",
+        to_field_name="name",
+        label=_("Record Template"),
+    )
     ip_address = MultiValueCharFilter(
         method="filter_ip_address",
         label=_("IP Address"),
     )
+    subtree = MultiValueCharFilter(
+        method="filter_subtree",
+        label=_("Name or Subdomain of"),
+    )
     active = django_filters.BooleanFilter(
         label=_("Record is active"),
     )
@@ -121,6 +137,25 @@ class RecordFilterSet(TenancyFilterSet, NetBoxModelFilterSet):
         except (netaddr.AddrFormatError, ValueError):
             return queryset.none()
 
+    def filter_subtree(self, queryset, name, value):
+        if not value:
+            return queryset
+        try:
+            query = Q()
+            for item in value:
+                if not item.strip():
+                    continue
+                reversed_name = reverse_name_labels(item.strip())
+                query |= Q(reversed_fqdn=reversed_name) | Q(
+                    reversed_fqdn__startswith=f"{reversed_name}."
+                )
+            if not query:
+                return queryset
+            return queryset.filter(query)
+
+        except DNSException:
+            return queryset.none()
+
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
@@ -1,4 +1,5 @@
 import netaddr
+from dns.exception import DNSException
 
 import django_filters
 from django.db.models import Q
@@ -15,8 +16,10 @@ from netbox_dns.models import (
     RegistrationContact,
     NameServer,
     DNSSECPolicy,
+    ZoneTemplate,
 )
 from netbox_dns.choices import ZoneStatusChoices, ZoneEPPStatusChoices
+from netbox_dns.utilities import reverse_name_labels
 
 
 __all__ = ("ZoneFilterSet",)
@@ -68,6 +71,16 @@ class ZoneFilterSet(TenancyFilterSet, NetBoxModelFilterSet):
         to_field_name="name",
         label=_("DNSSEC Policy"),
     )
+    zone_template_id = django_filters.ModelMultipleChoiceFilter(
+        queryset=ZoneTemplate.objects.all(),
+        label=_("Zone Template ID"),
+    )
+    zone_template = django_filters.ModelMultipleChoiceFilter(
+        queryset=ZoneTemplate.objects.all(),
+        field_name="zone_template__name",
+        to_field_name="name",
+        label=_("Zone Template"),
+    )
     rfc2317_prefix = MultiValueCharFilter(
         method="filter_rfc2317_prefix",
         label=_("RFC2317 Prefix"),
@@ -145,6 +158,10 @@ class ZoneFilterSet(TenancyFilterSet, NetBoxModelFilterSet):
     active = django_filters.BooleanFilter(
         label=_("Zone is active"),
     )
+    subtree = MultiValueCharFilter(
+        method="filter_subtree",
+        label=_("Zone or Subzone of"),
+    )
 
     class Meta:
         model = Zone
@@ -195,6 +212,25 @@ class ZoneFilterSet(TenancyFilterSet, NetBoxModelFilterSet):
         except (netaddr.AddrFormatError, ValueError):
             return queryset.none()
 
+    def filter_subtree(self, queryset, name, value):
+        if not value:
+            return queryset
+        try:
+            query = Q()
+            for item in value:
+                if not item.strip():
+                    continue
+                reversed_name = reverse_name_labels(item.strip())
+                query |= Q(reversed_name=reversed_name) | Q(
+                    reversed_name__startswith=f"{reversed_name}."
+                )
+            if not query:
+                return queryset
+            return queryset.filter(query)
+
+        except DNSException:
+            return queryset.none()
+
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
@@ -1,7 +1,11 @@
+from copy import copy
+from functools import reduce
+from operator import or_
+
 from packaging.version import Version
 
 from django import forms
-from django.db import transaction
+from django.db.models import Q
 from django.conf import settings
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
@@ -13,7 +17,6 @@ from netbox.forms import (
     NetBoxModelImportForm,
     NetBoxModelForm,
 )
-from netbox.context import events_queue
 from utilities.forms.fields import (
     DynamicModelMultipleChoiceField,
     TagFilterField,
@@ -22,6 +25,7 @@ from utilities.forms.fields import (
     CSVModelMultipleChoiceField,
     DynamicModelChoiceField,
 )
+from netbox.plugins.utils import get_plugin_config
 from utilities.release import load_release_data
 from utilities.forms.widgets import BulkEditNullBooleanSelect, DatePicker
 from utilities.forms.rendering import FieldSet
@@ -32,14 +36,23 @@ from tenancy.forms import TenancyForm, TenancyFilterForm
 from netbox_dns.models import (
     View,
     Zone,
+    Record,
     NameServer,
     Registrar,
     RegistrationContact,
     ZoneTemplate,
     DNSSECPolicy,
 )
-from netbox_dns.choices import ZoneStatusChoices, ZoneEPPStatusChoices
-from netbox_dns.utilities import name_to_unicode, network_to_reverse
+from netbox_dns.choices import (
+    ZoneStatusChoices,
+    ZoneEPPStatusChoices,
+    RecordTypeChoices,
+)
+from netbox_dns.utilities import (
+    name_to_unicode,
+    network_to_reverse,
+    get_ip_addresses_by_zone,
+)
 from netbox_dns.fields import RFC2317NetworkFormField, TimePeriodField
 from netbox_dns.validators import validate_ipv4, validate_prefix, validate_rfc2317
 
@@ -54,11 +67,62 @@ __all__ = (
 QUICK_ADD = Version(load_release_data().version) >= Version("4.2.5")
 
 
-class RollbackTransaction(Exception):
-    pass
+class ZoneTemplateUpdateMixin:
+    def _get_template_zone(self):
+        """
+        Return an unsaved copy of the zone with the values from the form, and
+        the records in the zone the template's records are checked against.
+        """
+        zone = copy(self.instance)
+        for field in ("view", "name", "status"):
+            if self.cleaned_data.get(field) not in (None, ""):
+                setattr(zone, field, self.cleaned_data[field])
+
+        if zone.view_id is None:
+            zone.view = View.get_default_view()
+
+        template = self.cleaned_data.get("template")
+        names = {
+            record_template.record_name
+            for record_template in template.record_templates.all()
+        }
 
+        if self.instance.pk is not None:
+            records = (
+                list(
+                    Record.objects.filter(zone_id=self.instance.pk).filter(
+                        reduce(or_, (Q(name__iexact=name) for name in names))
+                    )
+                )
+                if names
+                else []
+            )
+        else:
+            records = [
+                Record(zone=zone, name="@", type=RecordTypeChoices.SOA, value="")
+            ] + [
+                Record(
+                    zone=zone,
+                    name="@",
+                    type=RecordTypeChoices.NS,
+                    value=f"{nameserver.name}.",
+                )
+                for nameserver in self.cleaned_data.get("nameservers") or []
+            ]
+
+            # +
+            # Address records for a new zone are created by DNSsync when the
+            # zone is saved, before the template's records are created.
+            # -
+            if names and not get_plugin_config("netbox_dns", "dnssync_disabled", False):
+                lower_names = {name.lower() for name in names}
+                for ip_address in get_ip_addresses_by_zone(zone):
+                    record = Record.create_from_ip_address(ip_address, zone)
+                    if record is not None and record.name.lower() in lower_names:
+                        records.append(record)
+
+        return zone, records
 
-class ZoneTemplateUpdateMixin:
     def _check_soa_mname(self):
         if (
             self.cleaned_data.get("soa_mname") is None
@@ -93,37 +157,10 @@ class ZoneTemplateUpdateMixin:
         if self.errors:
             return
 
-        saved_events_queue = events_queue.get()
+        zone, records = self._get_template_zone()
 
         try:
-            with transaction.atomic():
-                if self.instance.id is not None:
-                    zone = super().save(*args, **kwargs)
-                else:
-                    zone_data = self.cleaned_data.copy()
-
-                    custom_fields = {}
-                    for key, value in zone_data.copy().items():
-                        if key.startswith("cf_"):
-                            custom_fields[key[3:]] = value
-                            zone_data.pop(key)
-                    if custom_fields:
-                        zone_data["custom_field_data"] = custom_fields
-
-                    zone_data.pop("template", None)
-                    zone_data.pop("tenant_group", None)
-                    zone_data.pop("_init_time", None)
-
-                    nameservers = zone_data.pop("nameservers")
-                    tags = zone_data.pop("tags")
-
-                    zone = Zone.objects.create(**zone_data)
-
-                    zone.nameservers.set(nameservers)
-                    zone.tags.set(tags)
-
-                template.create_records(zone)
-                raise RollbackTransaction
+            template.validate_records(zone, records)
 
         except ValidationError as exc:
             if hasattr(exc, "error_dict"):
@@ -136,11 +173,6 @@ class ZoneTemplateUpdateMixin:
             for error in errors:
                 self.add_error("template", error)
 
-        except RollbackTransaction:
-            pass
-
-        events_queue.set(saved_events_queue)
-
         return self.cleaned_data
 
     def save(self, *args, **kwargs):
@@ -3,6 +3,9 @@ from typing import List
 import strawberry
 import strawberry_django
 
+from netbox_dns.models import Record
+from netbox_dns.utilities import filter_records_after_cursor
+
 from .types import (
     NetBoxDNSNameServerType,
     NetBoxDNSViewType,
@@ -40,7 +43,15 @@ class NetBoxDNSZoneQuery:
 @strawberry.type(name="Query")
 class NetBoxDNSRecordQuery:
     netbox_dns_record: NetBoxDNSRecordType = strawberry_django.field()
-    netbox_dns_record_list: List[NetBoxDNSRecordType] = strawberry_django.field()
+
+    @strawberry_django.field
+    def netbox_dns_record_list(
+        self, cursor: str | None = None
+    ) -> List[NetBoxDNSRecordType]:
+        if cursor is None:
+            return Record.objects.all()
+
+        return filter_records_after_cursor(Record.objects.all(), cursor)
 
 
 @strawberry.type(name="Query")
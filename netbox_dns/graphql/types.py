@@ -20,6 +20,8 @@ from netbox_dns.models import (
     ZoneTemplate,
     RecordTemplate,
 )
+from netbox_dns.utilities import encode_record_cursor
+
 from .filters import (
     NetBoxDNSNameServerFilter,
     NetBoxDNSViewFilter,
@@ -64,8 +66,9 @@ class NetBoxDNSZoneType(NetBoxObjectType):
     name: str
     description: str | None
     status: str
-    active: bool
-    view: Annotated["NetBoxDNSViewType", strawberry.lazy("netbox_dns.graphql.types")]
+    view: Annotated[
+        "NetBoxDNSViewType", strawberry.lazy("netbox_dns.graphql.types")
+    ] = strawberry_django.field(select_related=["view"])
     nameservers: List[
         Annotated[
             "NetBoxDNSNameServerType", strawberry.lazy("netbox_dns.graphql.types")
@@ -137,22 +140,33 @@ class NetBoxDNSZoneType(NetBoxObjectType):
     ]
     arpa_network: str | None
     tenant: Annotated["TenantType", strawberry.lazy("tenancy.graphql.types")] | None
+    zone_template: (
+        Annotated[
+            "NetBoxDNSZoneTemplateType", strawberry.lazy("netbox_dns.graphql.types")
+        ]
+        | None
+    )
+
+    @strawberry_django.field(only=["status"])
+    def active(self) -> bool:
+        return self.is_active
 
 
 @strawberry_django.type(Record, fields="__all__", filters=NetBoxDNSRecordFilter)
 class NetBoxDNSRecordType(NetBoxObjectType):
     name: str
-    zone: Annotated["NetBoxDNSZoneType", strawberry.lazy("netbox_dns.graphql.types")]
+    zone: Annotated[
+        "NetBoxDNSZoneType", strawberry.lazy("netbox_dns.graphql.types")
+    ] = strawberry_django.field(select_related=["zone"])
     type: str
     value: str
-    absolute_value: str
     status: str
     ttl: BigInt | None
     managed: bool
     ptr_record: (
         Annotated["NetBoxDNSRecordType", strawberry.lazy("netbox_dns.graphql.types")]
         | None
-    )
+    ) = strawberry_django.field(select_related=["ptr_record"])
     disable_ptr: bool
     description: str | None
     tenant: Annotated["TenantType", strawberry.lazy("tenancy.graphql.types")] | None
@@ -163,14 +177,34 @@ class NetBoxDNSRecordType(NetBoxObjectType):
     rfc2317_cname_record: (
         Annotated["NetBoxDNSRecordType", strawberry.lazy("netbox_dns.graphql.types")]
         | None
-    )
+    ) = strawberry_django.field(select_related=["rfc2317_cname_record"])
     address_record: (
         Annotated["NetBoxDNSRecordType", strawberry.lazy("netbox_dns.graphql.types")]
         | None
-    )
+    ) = strawberry_django.field(select_related=["address_record"])
     rfc2317_ptr_records: List[
         Annotated["NetBoxDNSRecordType", strawberry.lazy("netbox_dns.graphql.types")]
     ]
+    record_template: (
+        Annotated[
+            "NetBoxDNSRecordTemplateType", strawberry.lazy("netbox_dns.graphql.types")
+        ]
+        | None
+    )
+
+    @strawberry_django.field(only=["status", "zone__status"], select_related=["zone"])
+    def active(self) -> bool:
+        return self.is_active
+
+    @strawberry_django.field(
+        only=["type", "value", "zone__name"], select_related=["zone"]
+    )
+    def absolute_value(self) -> str:
+        return self.absolute_value
+
+    @strawberry_django.field(only=["fqdn"])
+    def cursor(self) -> str:
+        return encode_record_cursor(self)
 
 
 @strawberry_django.type(
@@ -329,6 +363,9 @@ class NetBoxDNSZoneTemplateType(NetBoxObjectType):
         ]
         | None
     )
+    zones: List[
+        Annotated["NetBoxDNSZoneType", strawberry.lazy("netbox_dns.graphql.types")]
+    ]
 
 
 @strawberry_django.type(
@@ -348,3 +385,6 @@ class NetBoxDNSRecordTemplateType(NetBoxObjectType):
             "NetBoxDNSZoneTemplateType", strawberry.lazy("netbox_dns.graphql.types")
         ]
     ]
+    records: List[
+        Annotated["NetBoxDNSRecordType", strawberry.lazy("netbox_dns.graphql.types")]
+    ]
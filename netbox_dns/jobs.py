@@ -0,0 +1,67 @@
+from netbox.context_managers import event_tracking
+from netbox.jobs import JobRunner
+from utilities.request import NetBoxFakeRequest
+
+from netbox_dns.models import Zone
+
+
+__all__ = (
+    "ApplyZoneTemplateJob",
+    "SyncZoneTemplateJob",
+)
+
+
+def _get_request(job):
+    """
+    Return a request for the job's user, so changes made by the job are
+    written to the change log and trigger events like changes made via the
+    UI or the REST API.
+    """
+    return NetBoxFakeRequest(
+        {
+            "META": {},
+            "POST": {},
+            "GET": {},
+            "FILES": {},
+            "user": job.user,
+            "path": "",
+            "id": job.job_id,
+        }
+    )
+
+
+class ApplyZoneTemplateJob(JobRunner):
+    """
+    Apply the zone template the job is assigned to to a list of zones. The
+    numbers of updated zones and created records are stored in the job data.
+    """
+
+    class Meta:
+        name = "Apply Zone Template"
+
+    def run(self, *args, zones=None, **kwargs):
+        template = self.job.object
+
+        with event_tracking(_get_request(self.job)):
+            self.job.data = template.apply_to_zones(
+                Zone.objects.filter(pk__in=zones or [])
+            )
+
+
+class SyncZoneTemplateJob(JobRunner):
+    """
+    Re-synchronize the zones created from the zone template the job is assigned
+    to with the template. The numbers of updated and created records are stored
+    in the job data.
+    """
+
+    class Meta:
+        name = "Synchronize Zone Template"
+
+    def run(self, *args, zones=None, **kwargs):
+        template = self.job.object
+
+        with event_tracking(_get_request(self.job)):
+            self.job.data = template.sync_zones(
+                Zone.objects.filter(pk__in=zones) if zones is not None else None
+            )
@@ -0,0 +1,283 @@
+import json
+from contextlib import contextmanager
+from statistics import median
+
+from rest_framework.test import APIClient
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from ipam.models import IPAddress
+from netbox.plugins.utils import get_plugin_config
+
+from netbox_dns import __version__
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.models import Zone, Record
+from netbox_dns.utilities import get_dataset_views, trace
+
+
+BENCHMARKS = (
+    "record_create",
+    "record_update",
+    "record_delete",
+    "zone_rename",
+    "reverse_zone_create",
+    "rebuild_dnssync",
+    "bulk_import",
+    "api_list",
+    "api_export",
+)
+
+
+class Command(BaseCommand):
+    help = "Run benchmarks against a dataset created by generate_dns_dataset"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--name",
+            default="bench",
+            help="Name of the dataset (default: bench)",
+        )
+        parser.add_argument(
+            "--benchmark",
+            choices=BENCHMARKS,
+            action="append",
+            help="Only run the specified benchmark (can be specified more than once)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=5,
+            help="Number of iterations per benchmark (default: 5)",
+        )
+        parser.add_argument(
+            "--import-size",
+            type=int,
+            default=1000,
+            help="Number of records in the bulk import benchmark (default: 1000)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the results to a file instead of the standard output",
+        )
+
+    @contextmanager
+    def measure(self):
+        with trace(self.benchmark) as step:
+            yield
+
+        self.step = step
+
+    def get_zone(self):
+        return Zone.objects.get(pk=self.zone_pk)
+
+    def get_address(self, index):
+        return f"10.{self.network}.127.{index % 254 + 1}"
+
+    def get_api_client(self):
+        user = get_user_model().objects.create(
+            username="netbox-dns-benchmark", is_superuser=True
+        )
+        host = next(
+            (host.lstrip(".") for host in settings.ALLOWED_HOSTS if host != "*"),
+            "localhost",
+        )
+
+        client = APIClient(HTTP_HOST=host)
+        client.force_authenticate(user)
+
+        return client
+
+    def benchmark_record_create(self):
+        record = self.get_zone().build_record(
+            name="benchmark", type=RecordTypeChoices.A, value=self.get_address(0)
+        )
+
+        with self.measure():
+            record.save()
+
+    def benchmark_record_update(self):
+        record = Record.objects.get(pk=self.record_pk)
+        record.value = self.get_address(1)
+
+        with self.measure():
+            record.save()
+
+    def benchmark_record_delete(self):
+        record = Record.objects.get(pk=self.record_pk)
+
+        with self.measure():
+            record.delete()
+
+    def benchmark_zone_rename(self):
+        zone = self.get_zone()
+        zone.name = f"renamed.{zone.name}"
+
+        with self.measure():
+            zone.save()
+
+    def benchmark_reverse_zone_create(self):
+        zone = self.get_zone()
+        reverse_zone = Zone(
+            view=zone.view,
+            name=f"0.{self.network}.10.in-addr.arpa",
+            soa_mname=zone.soa_mname,
+            soa_rname=zone.soa_rname,
+        )
+
+        with self.measure():
+            reverse_zone.save()
+
+    def benchmark_rebuild_dnssync(self):
+        if get_plugin_config("netbox_dns", "dnssync_disabled", False):
+            return
+
+        with self.measure():
+            call_command("rebuild_dnssync", verbosity=0)
+
+    def benchmark_bulk_import(self):
+        zone = self.get_zone()
+        records = [
+            (
+                {
+                    "name": f"import{index}",
+                    "type": RecordTypeChoices.A,
+                    "value": self.get_address(index),
+                }
+                if index % 2
+                else {
+                    "name": f"import{index}",
+                    "type": RecordTypeChoices.TXT,
+                    "value": f'"imported record {index}"',
+                }
+            )
+            for index in range(self.import_size)
+        ]
+
+        with self.measure():
+            zone.upsert_records(records, delete=False)
+
+    def benchmark_api_list(self):
+        client = self.get_api_client()
+
+        with self.measure():
+            response = client.get(
+                reverse("plugins-api:netbox_dns-api:record-list"),
+                {"zone_id": self.zone_pk, "limit": 100},
+            )
+
+        if response.status_code != 200:
+            raise CommandError(f"Record list failed: {response.status_code}")
+
+    def benchmark_api_export(self):
+        client = self.get_api_client()
+
+        with self.measure():
+            response = client.get(
+                reverse("plugins-api:netbox_dns-api:record-flat"),
+                {"view_id": self.view_pk, "output": "csv"},
+            )
+            b"".join(response.streaming_content)
+
+        if response.status_code != 200:
+            raise CommandError(f"Record export failed: {response.status_code}")
+
+    def run_benchmark(self, iterations):
+        method = getattr(self, f"benchmark_{self.benchmark}")
+        steps = []
+
+        for iteration in range(iterations):
+            self.step = None
+
+            # +
+            # Every iteration is rolled back, so all iterations and benchmarks
+            # run against the unchanged dataset.
+            # -
+            with transaction.atomic():
+                method()
+                transaction.set_rollback(True)
+
+            if self.step is None:
+                return None
+
+            steps.append(self.step)
+
+        durations = [step.duration for step in steps]
+        return {
+            "iterations": len(steps),
+            "duration": {
+                "min": min(durations),
+                "median": median(durations),
+                "max": max(durations),
+            },
+            "durations": durations,
+            "queries": [step.queries for step in steps],
+        }
+
+    def handle(self, *model_names, **options):
+        name = options.get("name")
+
+        views = get_dataset_views(name).order_by("pk")
+        if not views.exists():
+            raise CommandError(f"Dataset {name} does not exist.")
+
+        view = views.first()
+        zone = (
+            Zone.objects.filter(view=view, arpa_network__isnull=True)
+            .order_by("pk")
+            .first()
+        )
+        record = (
+            Record.objects.filter(zone=zone, type=RecordTypeChoices.A)
+            .order_by("pk")
+            .first()
+            if zone is not None
+            else None
+        )
+        if record is None:
+            raise CommandError(f"Dataset {name} does not contain any address records.")
+
+        self.view_pk = view.pk
+        self.network = int(record.value.split(".")[1])
+        self.zone_pk = zone.pk
+        self.record_pk = record.pk
+        self.import_size = options.get("import_size")
+
+        dataset_zones = Zone.objects.filter(view__in=views)
+        results = {
+            "netbox_dns_version": __version__,
+            "time": timezone.now().isoformat(),
+            "dataset": {
+                "name": name,
+                "views": views.count(),
+                "zones": dataset_zones.count(),
+                "records": Record.objects.filter(zone__in=dataset_zones).count(),
+                "ip_addresses": IPAddress.objects.filter(
+                    netbox_dns_records__zone__in=dataset_zones
+                )
+                .distinct()
+                .count(),
+            },
+            "benchmarks": {},
+        }
+
+        for benchmark in options.get("benchmark") or BENCHMARKS:
+            self.benchmark = benchmark
+
+            if options.get("verbosity") > 1:
+                self.stderr.write(f"Running benchmark {benchmark}")
+
+            if (result := self.run_benchmark(options.get("iterations"))) is not None:
+                results["benchmarks"][benchmark] = result
+
+        output = json.dumps(results, indent=2)
+        if options.get("output"):
+            with open(options.get("output"), "w") as output_file:
+                output_file.write(output + "\n")
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from netbox.plugins.utils import get_plugin_config
+
+from netbox_dns.models import ChangeFeedEntry
+
+
+class Command(BaseCommand):
+    help = "Delete change feed entries older than the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention",
+            type=int,
+            help="Retention period in seconds (default: 'change_feed_retention' setting)",
+        )
+
+    def handle(self, *model_names, **options):
+        retention = options.get("retention")
+        if retention is None:
+            retention = get_plugin_config("netbox_dns", "change_feed_retention")
+
+        deleted, _ = ChangeFeedEntry.objects.filter(
+            time__lt=timezone.now() - timedelta(seconds=retention)
+        ).delete()
+
+        self.stdout.write(f"{deleted} change feed entries have been deleted")
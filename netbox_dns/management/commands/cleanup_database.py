@@ -1,159 +1,363 @@
+from time import perf_counter
+
 from netaddr import IPAddress, IPNetwork, AddrFormatError
 
-from django.core.management.base import BaseCommand
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q, F, Value, Count, Exists, OuterRef, CharField
+from django.db.models.functions import Cast, Concat
+
+from core.choices import ObjectChangeActionChoices
 
-from netbox_dns.models import Zone, Record
+from netbox_dns.fields import AddressField
+from netbox_dns.models import ChangeFeedEntry, Zone, Record
 from netbox_dns.choices import ZoneStatusChoices, RecordTypeChoices
 
 
-def zone_rename_passive_status_to_parked(verbose=False):
-    passive_zones = Zone.objects.filter(status="passive")
-    if passive_zones:
-        if verbose:
-            print("Renaming 'passive' zone status to 'parked'")
+CHECKPOINT_CACHE_KEY = "netbox_dns.cleanup_database.checkpoint"
+
+
+def get_zone_rename_passive_status_to_parked():
+    return Zone.objects.filter(status="passive")
 
-        for zone in passive_zones:
-            zone.status = ZoneStatusChoices.STATUS_PARKED
-            zone.save()
 
+def zone_rename_passive_status_to_parked(zone, verbose=False):
+    if verbose:
+        print(f"Renaming 'passive' zone status to 'parked' for zone '{zone}'")
 
-def zone_cleanup_ns_records(verbose=False):
+    zone.status = ZoneStatusChoices.STATUS_PARKED
+    zone.save()
+
+
+def get_zone_cleanup_ns_records():
+    ns_records = Record.raw_objects.filter(name="@", type=RecordTypeChoices.NS)
+    zone_nameservers = Zone.nameservers.through.objects.annotate(
+        ns_value=Concat(F("nameserver__name"), Value("."))
+    )
+    is_nameserver = Exists(
+        zone_nameservers.filter(zone_id=OuterRef("zone_id"), ns_value=OuterRef("value"))
+    )
+
+    obsolete_ns = ns_records.exclude(is_nameserver)
+    missing_ns = zone_nameservers.exclude(
+        Exists(
+            ns_records.filter(zone_id=OuterRef("zone_id"), value=OuterRef("ns_value"))
+        )
+    )
+    duplicate_ns = (
+        ns_records.values("zone_id", "value")
+        .annotate(record_count=Count("pk"))
+        .filter(record_count__gt=1)
+    )
+    unmanaged_ns = ns_records.filter(is_nameserver).filter(
+        Q(ttl__isnull=False) | Q(managed=False)
+    )
+
+    return Zone.objects.filter(
+        Q(pk__in=obsolete_ns.values("zone_id"))
+        | Q(pk__in=missing_ns.values("zone_id"))
+        | Q(pk__in=duplicate_ns.values("zone_id"))
+        | Q(pk__in=unmanaged_ns.values("zone_id"))
+    )
+
+
+def zone_cleanup_ns_records(zone, verbose=False):
     ns_name = "@"
 
-    for zone in Zone.objects.all():
-        nameservers = zone.nameservers.all()
-        nameserver_names = [f'{ns.name.rstrip(".")}.' for ns in nameservers]
+    nameservers = zone.nameservers.all()
+    nameserver_names = [f'{ns.name.rstrip(".")}.' for ns in nameservers]
 
-        delete_ns = zone.records.filter(
-            name=ns_name, type=RecordTypeChoices.NS
-        ).exclude(value__in=nameserver_names)
+    delete_ns = zone.records.filter(name=ns_name, type=RecordTypeChoices.NS).exclude(
+        value__in=nameserver_names
+    )
+    for record in delete_ns:
+        if verbose:
+            print(f"Deleting obsolete NS record {record}")
+        record.delete()
+
+    for ns in nameserver_names:
+        ns_records = zone.records.filter(
+            name=ns_name,
+            type=RecordTypeChoices.NS,
+            value=ns,
+        )
+
+        delete_ns = ns_records[1:]
         for record in delete_ns:
             if verbose:
-                print(f"Deleting obsolete NS record {record}")
+                print(f"Deleting duplicate NS record {record}")
             record.delete()
 
-        for ns in nameserver_names:
-            ns_records = zone.records.filter(
+        try:
+            ns_record = zone.records.get(
                 name=ns_name,
                 type=RecordTypeChoices.NS,
                 value=ns,
             )
 
-            delete_ns = ns_records[1:]
-            for record in delete_ns:
+            if ns_record.ttl is not None or not ns_record.managed:
                 if verbose:
-                    print(f"Deleting duplicate NS record {record}")
-                record.delete()
-
-            try:
-                ns_record = zone.records.get(
-                    name=ns_name,
-                    type=RecordTypeChoices.NS,
-                    value=ns,
-                )
+                    print(f"Updating NS record '{ns_record}'")
+                ns_record.ttl = None
+                ns_record.managed = True
+                ns_record.save()
+
+        except Record.DoesNotExist:
+            if verbose:
+                print(f"Creating NS record for '{ns.rstrip('.')}' in zone '{zone}'")
+            Record.objects.create(
+                name=ns_name,
+                zone=zone,
+                type=RecordTypeChoices.NS,
+                value=ns,
+                ttl=None,
+                managed=True,
+            )
 
-                if ns_record.ttl is not None or not ns_record.managed:
-                    if verbose:
-                        print(f"Updating NS record '{ns_record}'")
-                    ns_record.ttl = None
-                    ns_record.managed = True
-                    ns_record.save()
 
-            except Record.DoesNotExist:
-                if verbose:
-                    print(f"Creating NS record for '{ns.rstrip('.')}' in zone '{zone}'")
-                Record.objects.create(
-                    name=ns_name,
-                    zone=zone,
-                    type=RecordTypeChoices.NS,
-                    value=ns,
-                    ttl=None,
-                    managed=True,
-                )
+def get_zone_update_soa_records():
+    soa_records = Record.raw_objects.filter(name="@", type=RecordTypeChoices.SOA)
+    duplicate_soa = (
+        soa_records.values("zone_id")
+        .annotate(record_count=Count("pk"))
+        .filter(record_count__gt=1)
+    )
+
+    # +
+    # The SOA value built here does not escape special characters in names,
+    # so it may report a zone as outdated that isn't. This only causes an
+    # unneeded check, as 'update_soa_record()' only saves changed records.
+    # -
+    return Zone.objects.annotate(
+        soa_value=Concat(
+            F("soa_mname__name"),
+            Value(". "),
+            F("soa_rname"),
+            Value(". "),
+            Cast("soa_serial", output_field=CharField()),
+            Value(" "),
+            Cast("soa_refresh", output_field=CharField()),
+            Value(" "),
+            Cast("soa_retry", output_field=CharField()),
+            Value(" "),
+            Cast("soa_expire", output_field=CharField()),
+            Value(" "),
+            Cast("soa_minimum", output_field=CharField()),
+            output_field=CharField(),
+        )
+    ).filter(
+        ~Exists(
+            soa_records.filter(
+                zone_id=OuterRef("pk"),
+                ttl=OuterRef("soa_ttl"),
+                value=OuterRef("soa_value"),
+            )
+        )
+        | Q(pk__in=duplicate_soa.values("zone_id"))
+    )
 
 
-def zone_update_soa_records(verbose=False):
+def zone_update_soa_records(zone, verbose=False):
     soa_name = "@"
 
-    for zone in Zone.objects.all():
-        delete_soa = zone.records.filter(name=soa_name, type=RecordTypeChoices.SOA)[1:]
-        for record in delete_soa:
-            if verbose:
-                print(f"Deleting duplicate SOA record {record}")
-            record.delete()
+    delete_soa = zone.records.filter(name=soa_name, type=RecordTypeChoices.SOA)[1:]
+    for record in delete_soa:
+        if verbose:
+            print(f"Deleting duplicate SOA record {record}")
+        record.delete()
 
-        zone.update_soa_record()
+    zone.update_soa_record()
 
 
-def zone_update_arpa_network(verbose=False):
-    for zone in Zone.objects.filter(name__endswith=".arpa"):
-        name = zone.name
+def get_zone_update_arpa_network():
+    return Zone.objects.filter(name__endswith=".arpa")
 
-        # TODO: Rewrite with utility function
-        if name.endswith(".in-addr.arpa"):
-            address = ".".join(reversed(name.replace(".in-addr.arpa", "").split(".")))
-            mask = len(address.split(".")) * 8
 
-            try:
-                prefix = IPNetwork(f"{address}/{mask}")
-            except AddrFormatError:
-                prefix = None
+def zone_update_arpa_network(zone, verbose=False):
+    name = zone.name
 
-        elif name.endswith("ip6.arpa"):
-            address = "".join(reversed(name.replace(".ip6.arpa", "").split(".")))
-            mask = len(address)
-            address = address + "0" * (32 - mask)
+    # TODO: Rewrite with utility function
+    if name.endswith(".in-addr.arpa"):
+        address = ".".join(reversed(name.replace(".in-addr.arpa", "").split(".")))
+        mask = len(address.split(".")) * 8
 
-            try:
-                prefix = IPNetwork(
-                    f"{':'.join([(address[i:i+4]) for i in range(0, 32, 4)])}/{mask*4}"
-                )
-            except AddrFormatError:
-                prefix = None
-        # TODO: End
+        try:
+            prefix = IPNetwork(f"{address}/{mask}")
+        except AddrFormatError:
+            prefix = None
 
-        if zone.arpa_network != prefix:
-            if verbose:
-                print(f"Updating ARPA prefix for zone '{zone}' to '{prefix}'")
-            zone.arpa_network = prefix
-            zone.save()
+    elif name.endswith("ip6.arpa"):
+        address = "".join(reversed(name.replace(".ip6.arpa", "").split(".")))
+        mask = len(address)
+        address = address + "0" * (32 - mask)
 
+        try:
+            prefix = IPNetwork(
+                f"{':'.join([(address[i:i+4]) for i in range(0, 32, 4)])}/{mask*4}"
+            )
+        except AddrFormatError:
+            prefix = None
+    # TODO: End
+
+    if zone.arpa_network != prefix:
+        if verbose:
+            print(f"Updating ARPA prefix for zone '{zone}' to '{prefix}'")
+        zone.arpa_network = prefix
+        zone.save()
 
-def record_cleanup_disable_ptr(verbose=False):
-    Record.objects.filter(
+
+def get_record_cleanup_disable_ptr():
+    return Record.objects.filter(
         disable_ptr=False,
-    ).exclude(
-        type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA)
-    ).update(disable_ptr=True)
+    ).exclude(type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA))
+
+
+def record_cleanup_disable_ptr(records, verbose=False):
+    records = Record.objects.filter(pk__in=[record.pk for record in records])
+    records.update(disable_ptr=True)
+    ChangeFeedEntry.log_queryset(records, ObjectChangeActionChoices.ACTION_UPDATE)
 
 
-def record_update_ptr_records(verbose=False):
-    for record in Record.objects.filter(
+def get_record_update_ptr_records():
+    ptr_zones = Zone.objects.filter(view_id=OuterRef("zone__view_id"))
+    ptr_zone_exists = Exists(
+        ptr_zones.filter(
+            Q(arpa_network__net_contains=OuterRef("ip_address"))
+            | Q(rfc2317_prefix__net_contains=OuterRef("ip_address"))
+        )
+    )
+    better_ptr_zone_exists = Exists(
+        ptr_zones.filter(
+            Q(
+                arpa_network__net_contains=OuterRef("ip_address"),
+                arpa_network__net_contained=OuterRef("ptr_record__zone__arpa_network"),
+            )
+            | Q(rfc2317_prefix__net_contains=OuterRef("ip_address"))
+        ).exclude(pk=OuterRef("ptr_record__zone_id"))
+    )
+
+    return Record.objects.filter(
         type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA)
-    ):
-        record.save(update_fields=["ptr_record"])
+    ).filter(
+        Q(
+            ptr_record__isnull=True,
+            disable_ptr=False,
+            active=True,
+            ip_address__isnull=True,
+        )
+        | Q(
+            ptr_zone_exists,
+            ptr_record__isnull=True,
+            disable_ptr=False,
+            active=True,
+        )
+        & ~Q(name__startswith="*")
+        | Q(ptr_record__isnull=False)
+        & (
+            Q(disable_ptr=True)
+            | Q(active=False)
+            | Q(name__startswith="*")
+            | ~Q(ptr_record__value=F("fqdn"))
+            | ~Q(ptr_record__ip_address=F("ip_address"))
+            | ~Q(ptr_record__zone__view_id=F("zone__view_id"))
+            | Q(ttl__isnull=True, ptr_record__ttl__isnull=False)
+            | Q(ttl__isnull=False, ptr_record__ttl__isnull=True)
+            | ~Q(ptr_record__ttl=F("ttl"))
+            | better_ptr_zone_exists
+        )
+    )
 
 
-def record_update_ip_address(verbose=False):
-    for record in Record.objects.filter(
-        type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA, RecordTypeChoices.PTR)
-    ):
-        if record.is_ptr_record:
-            if record.ip_address != record.address_from_name:
-                if verbose:
-                    print(
-                        f"Updating IP address of pointer record {record} to {record.address_from_name}"
-                    )
-                record.ip_address = record.address_from_name
-                record.save()
-        else:
-            if record.ip_address != IPAddress(record.value):
-                if verbose:
-                    print(
-                        f"Updating IP address of address record {record} to {IPAddress(record.value)}"
-                    )
-                record.ip_address = record.value
-                record.save()
+def record_update_ptr_records(record, verbose=False):
+    if verbose:
+        print(f"Updating PTR record for address record {record}")
+
+    record.save(update_fields=["ptr_record"])
+
+
+def get_record_update_ip_address():
+    return Record.objects.filter(
+        Q(type=RecordTypeChoices.PTR)
+        | Q(type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA))
+        & (
+            Q(ip_address__isnull=True)
+            | ~Q(ip_address=Cast("value", output_field=AddressField()))
+        )
+    ).select_related("zone")
+
+
+def record_update_ip_address(record, verbose=False):
+    if record.is_ptr_record:
+        if record.ip_address != record.address_from_name:
+            if verbose:
+                print(
+                    f"Updating IP address of pointer record {record} to {record.address_from_name}"
+                )
+            record.ip_address = record.address_from_name
+            record.save()
+    else:
+        if record.ip_address != IPAddress(record.value):
+            if verbose:
+                print(
+                    f"Updating IP address of address record {record} to {IPAddress(record.value)}"
+                )
+            record.ip_address = record.value
+            record.save()
+
+
+# +
+# Cleanup steps in the order they are run: (name, queryset, function, batch)
+#
+# The queryset function returns the objects that need to be processed by the
+# step, detecting outdated objects in the database where possible. The step
+# function is either called for each object, or for a complete batch of objects
+# if 'batch' is True.
+# -
+CLEANUP_STEPS = (
+    (
+        "zone_status",
+        get_zone_rename_passive_status_to_parked,
+        zone_rename_passive_status_to_parked,
+        False,
+    ),
+    (
+        "zone_ns_records",
+        get_zone_cleanup_ns_records,
+        zone_cleanup_ns_records,
+        False,
+    ),
+    (
+        "zone_soa_records",
+        get_zone_update_soa_records,
+        zone_update_soa_records,
+        False,
+    ),
+    (
+        "zone_arpa_network",
+        get_zone_update_arpa_network,
+        zone_update_arpa_network,
+        False,
+    ),
+    (
+        "record_disable_ptr",
+        get_record_cleanup_disable_ptr,
+        record_cleanup_disable_ptr,
+        True,
+    ),
+    (
+        "record_ptr_records",
+        get_record_update_ptr_records,
+        record_update_ptr_records,
+        False,
+    ),
+    (
+        "record_ip_address",
+        get_record_update_ip_address,
+        record_update_ip_address,
+        False,
+    ),
+)
 
 
 class Command(BaseCommand):
@@ -163,14 +367,89 @@ class Command(BaseCommand):
         parser.add_argument(
             "--verbose", action="store_true", help="Increase output verbosity"
         )
+        parser.add_argument(
+            "--step",
+            action="append",
+            choices=[step[0] for step in CLEANUP_STEPS],
+            help="Run only the specified cleanup step (can be used multiple times)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of objects processed per batch (default: 1000)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Resume an interrupted cleanup from the last saved checkpoint",
+        )
 
     def handle(self, *model_names, **options):
-        zone_rename_passive_status_to_parked(options["verbose"])
-        zone_cleanup_ns_records(options["verbose"])
-        zone_update_soa_records(options["verbose"])
-        zone_update_arpa_network(options["verbose"])
-        record_cleanup_disable_ptr(options["verbose"])
-        record_update_ptr_records(options["verbose"])
-        record_update_ip_address(options["verbose"])
+        if options["batch_size"] < 1:
+            raise CommandError("The batch size must be a positive integer")
+
+        steps = [
+            step
+            for step in CLEANUP_STEPS
+            if options["step"] is None or step[0] in options["step"]
+        ]
+
+        last_pk = 0
+        if options["resume"]:
+            checkpoint = cache.get(CHECKPOINT_CACHE_KEY)
+            if checkpoint is None:
+                self.stdout.write("No checkpoint found, starting from the beginning.")
+            else:
+                step_names = [step[0] for step in steps]
+                if checkpoint["step"] not in step_names:
+                    raise CommandError(
+                        f"The checkpoint step '{checkpoint['step']}' is not selected"
+                    )
+
+                steps = steps[step_names.index(checkpoint["step"]) :]
+                last_pk = checkpoint["last_pk"]
+                self.stdout.write(
+                    f"Resuming step '{checkpoint['step']}' after object {last_pk}."
+                )
+
+        for step in steps:
+            self.run_step(*step, last_pk=last_pk, **options)
+            last_pk = 0
+
+        cache.delete(CHECKPOINT_CACHE_KEY)
 
         self.stdout.write("Database cleanup completed.")
+
+    def run_step(self, name, get_queryset, function, batch, last_pk=0, **options):
+        """
+        Process the objects returned by the step's queryset in batches ordered by
+        primary key, saving a checkpoint after each batch.
+        """
+        queryset = get_queryset().order_by("pk")
+        batch_size = options["batch_size"]
+        verbose = options["verbose"]
+
+        count = 0
+        start = perf_counter()
+
+        while objects := list(queryset.filter(pk__gt=last_pk)[:batch_size]):
+            with transaction.atomic():
+                if batch:
+                    function(objects, verbose=verbose)
+                else:
+                    for obj in objects:
+                        function(obj, verbose=verbose)
+
+            last_pk = objects[-1].pk
+            count += len(objects)
+
+            cache.set(
+                CHECKPOINT_CACHE_KEY, {"step": name, "last_pk": last_pk}, timeout=None
+            )
+
+        elapsed = perf_counter() - start
+        self.stdout.write(
+            f"Step '{name}': {count} objects processed in {elapsed:.2f}s "
+            f"({count / elapsed if elapsed else 0:.1f} objects/s)"
+        )
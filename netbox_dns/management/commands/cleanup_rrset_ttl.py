@@ -1,8 +1,16 @@
+import uuid
+from time import perf_counter
+
 from django.core.management.base import BaseCommand
-from django.db.models import Max, Min
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, F
+from django.utils import timezone
+
+from core.choices import ObjectChangeActionChoices
 
-from netbox_dns.models import Record
+from netbox_dns.models import ChangeFeedEntry, Record, Zone
 from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import log_object_changes
 
 
 class Command(BaseCommand):
@@ -20,39 +28,156 @@ class Command(BaseCommand):
             action="store_true",
             help="Use the maximum TTL of an RRSet for all Records",
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show the TTL changes without updating any records",
+        )
 
     def handle(self, *model_names, **options):
-        self.cleanup_rrset_ttl(**options)
+        start = perf_counter()
 
-        self.stdout.write("RRSet cleanup completed.")
+        rrsets, records, zones = self.cleanup_rrset_ttl(**options)
 
-    def cleanup_rrset_ttl(self, **options):
-        ttl_records = (
-            Record.objects.filter(ttl__isnull=False)
-            .exclude(type=RecordTypeChoices.SOA)
-            .exclude(type=RecordTypeChoices.PTR, managed=True)
+        if options.get("dry_run"):
+            self.stdout.write(
+                f"RRSet cleanup dry run completed: {records} records in {rrsets} RRSets "
+                f"in {zones} zones would be updated ({perf_counter() - start:.2f}s)."
+            )
+        else:
+            self.stdout.write(
+                f"RRSet cleanup completed: {records} records in {rrsets} RRSets "
+                f"in {zones} zones updated ({perf_counter() - start:.2f}s)."
+            )
+
+    def get_rrset_records(self):
+        return Record.raw_objects.exclude(type=RecordTypeChoices.SOA).exclude(
+            type=RecordTypeChoices.PTR, managed=True
+        )
+
+    def get_divergent_rrsets(self):
+        """
+        Find all RRSets containing records with different TTLs, or with records
+        both with and without a TTL, in a single grouped query.
+        """
+        return (
+            self.get_rrset_records()
+            .values("zone_id", "zone__name", "name", "type")
+            .annotate(
+                record_count=Count("pk"),
+                ttl_count=Count("ttl"),
+                min_ttl=Min("ttl"),
+                max_ttl=Max("ttl"),
+            )
+            .filter(record_count__gt=1, min_ttl__isnull=False)
+            .filter(Q(min_ttl__lt=F("max_ttl")) | Q(ttl_count__lt=F("record_count")))
+            .order_by("zone__name", "name", "type")
         )
-        for record in ttl_records:
-            records = Record.objects.filter(
-                name=record.name,
-                zone=record.zone,
-                type=record.type,
-            ).exclude(type=RecordTypeChoices.PTR, maanged=True)
-
-            if records.count() == 1:
-                if options.get("verbosity") > 2:
-                    self.stdout.write(f"Ignoring single record {record.pk} ({record})")
+
+    def update_records(self, records, ttl, now, request_id):
+        """
+        Update the TTLs of the records of an RRSet in bulk. For address
+        records, the TTLs of their PTR records and of the RFC2317 CNAME
+        records pointing to these are updated as well, as saving the address
+        records would do. Return the number of records in the RRSet that were
+        updated and the primary keys of other zones containing updated records.
+        """
+        records = list(records.select_related("ptr_record__rfc2317_cname_record"))
+        ptr_records = [
+            record.ptr_record for record in records if record.ptr_record is not None
+        ]
+
+        changed_records = records + ptr_records
+        for record in changed_records:
+            record.snapshot()
+            record.ttl = ttl
+            record.last_updated = now
+
+        updated = Record.raw_objects.filter(
+            pk__in=[record.pk for record in records]
+        ).update(ttl=ttl, last_updated=now)
+        Record.raw_objects.filter(
+            pk__in=[ptr_record.pk for ptr_record in ptr_records]
+        ).update(ttl=ttl, last_updated=now)
+
+        cname_records = {
+            ptr_record.rfc2317_cname_record_id: ptr_record.rfc2317_cname_record
+            for ptr_record in ptr_records
+            if ptr_record.rfc2317_cname_record_id is not None
+        }
+        for cname_pk, cname_ttl in (
+            Record.raw_objects.filter(pk__in=cname_records)
+            .annotate(min_ttl=Min("rfc2317_ptr_records__ttl"))
+            .values_list("pk", "min_ttl")
+        ):
+            cname_record = cname_records[cname_pk]
+            if cname_record.ttl == cname_ttl:
                 continue
 
-            if options.get("max"):
-                ttl = records.aggregate(Max("ttl")).get("ttl__max")
-            else:
-                ttl = records.aggregate(Min("ttl")).get("ttl__min")
+            cname_record.snapshot()
+            cname_record.ttl = cname_ttl
+            cname_record.last_updated = now
+            Record.raw_objects.filter(pk=cname_pk).update(
+                ttl=cname_ttl, last_updated=now
+            )
+            changed_records.append(cname_record)
+
+        ChangeFeedEntry.log(changed_records, ObjectChangeActionChoices.ACTION_UPDATE)
+        log_object_changes(
+            changed_records, ObjectChangeActionChoices.ACTION_UPDATE, request_id
+        )
 
-            for record in records.exclude(ttl=ttl):
-                if options.get("verbosity") > 1:
+        return updated, {record.zone_id for record in changed_records}
+
+    def cleanup_rrset_ttl(self, **options):
+        verbosity = options.get("verbosity")
+        dry_run = options.get("dry_run")
+        now = timezone.now()
+
+        request_id = uuid.uuid4()
+
+        rrset_count = 0
+        record_count = 0
+        zone_pks = set()
+
+        with transaction.atomic():
+            for rrset in self.get_divergent_rrsets():
+                ttl = rrset["max_ttl"] if options.get("max") else rrset["min_ttl"]
+
+                records = self.get_rrset_records().filter(
+                    zone_id=rrset["zone_id"], name=rrset["name"], type=rrset["type"]
+                )
+                update_records = records.filter(Q(ttl__isnull=True) | ~Q(ttl=ttl))
+
+                if dry_run or verbosity > 1:
+                    ttls = sorted(
+                        set(records.values_list("ttl", flat=True)),
+                        key=lambda ttl: (ttl is not None, ttl),
+                    )
                     self.stdout.write(
-                        f"Updating TTL for record {record.pk} ({record}) to {ttl}"
+                        f"{rrset['name']} {rrset['type']} in zone {rrset['zone__name']}: "
+                        f"TTLs {', '.join(str(ttl) for ttl in ttls)} -> {ttl}"
+                    )
+                if verbosity > 2:
+                    for record in update_records:
+                        self.stdout.write(
+                            f"Updating TTL for record {record.pk} ({record}) to {ttl}"
+                        )
+
+                if dry_run:
+                    updated = update_records.count()
+                else:
+                    updated, updated_zone_pks = self.update_records(
+                        update_records, ttl, now, request_id
                     )
-                record.ttl = ttl
-                record.save(update_fields=["ttl"], update_rrset_ttl=False)
+                    zone_pks |= updated_zone_pks
+
+                rrset_count += 1
+                record_count += updated
+                zone_pks.add(rrset["zone_id"])
+
+            if not dry_run:
+                for zone in Zone.objects.filter(pk__in=zone_pks):
+                    zone.update_serial()
+
+        return rrset_count, record_count, len(zone_pks)
@@ -0,0 +1,86 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from core.models import ObjectChange, ObjectType
+
+from netbox_dns.models import Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import compact_change_data
+
+
+class Command(BaseCommand):
+    help = "Compact the change log entries for SOA records or all managed records"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--managed",
+            action="store_true",
+            help="Compact the change log entries for all managed records, not only SOA records",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of change log entries updated per transaction (default: 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the change log entries without changing them",
+        )
+
+    def get_object_changes(self, managed=False):
+        if managed:
+            query = Q(prechange_data__managed=True) | Q(postchange_data__managed=True)
+        else:
+            query = Q(prechange_data__type=RecordTypeChoices.SOA) | Q(
+                postchange_data__type=RecordTypeChoices.SOA
+            )
+
+        return ObjectChange.objects.filter(
+            query,
+            changed_object_type=ObjectType.objects.get_for_model(Record),
+        ).only("pk", "prechange_data", "postchange_data")
+
+    def handle(self, *model_names, **options):
+        batch_size = options.get("batch_size")
+        object_changes = self.get_object_changes(options.get("managed"))
+
+        if options.get("dry_run"):
+            self.stdout.write(
+                f"{object_changes.count()} change log entries would be compacted"
+            )
+            return
+
+        compacted = 0
+        batch = []
+        for object_change in object_changes.iterator(chunk_size=batch_size):
+            prechange_data, postchange_data = compact_change_data(
+                object_change.prechange_data, object_change.postchange_data
+            )
+            if (prechange_data, postchange_data) == (
+                object_change.prechange_data,
+                object_change.postchange_data,
+            ):
+                continue
+
+            object_change.prechange_data = prechange_data
+            object_change.postchange_data = postchange_data
+            batch.append(object_change)
+
+            if len(batch) >= batch_size:
+                compacted += self.update_object_changes(batch)
+                batch = []
+
+        compacted += self.update_object_changes(batch)
+
+        self.stdout.write(f"{compacted} change log entries have been compacted")
+
+    def update_object_changes(self, object_changes):
+        with transaction.atomic():
+            ObjectChange.objects.bulk_update(
+                object_changes, ["prechange_data", "postchange_data"]
+            )
+
+        return len(object_changes)
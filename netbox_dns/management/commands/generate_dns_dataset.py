@@ -0,0 +1,105 @@
+from time import perf_counter
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from netbox_dns.utilities import generate_dataset, delete_dataset
+
+
+class Command(BaseCommand):
+    help = "Generate a reproducible synthetic dataset for benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--name",
+            default="bench",
+            help="Name of the dataset, used for view and zone names (default: bench)",
+        )
+        parser.add_argument(
+            "--views",
+            type=int,
+            default=1,
+            help="Number of views (default: 1)",
+        )
+        parser.add_argument(
+            "--zones",
+            type=int,
+            default=10,
+            help="Number of forward zones per view (default: 10)",
+        )
+        parser.add_argument(
+            "--records",
+            type=int,
+            default=100,
+            help="Number of records per forward zone (default: 100)",
+        )
+        parser.add_argument(
+            "--no-reverse-zones",
+            action="store_true",
+            help="Do not create a reverse zone per view",
+        )
+        parser.add_argument(
+            "--rfc2317-zones",
+            type=int,
+            default=0,
+            help="Number of RFC2317 zones per view (default: 0, maximum: 4)",
+        )
+        parser.add_argument(
+            "--ip-addresses",
+            type=int,
+            default=0,
+            help="Number of IPAM IP addresses with DNSsync per view (default: 0)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed for the random record type selection (default: 0)",
+        )
+        parser.add_argument(
+            "--network",
+            type=int,
+            default=0,
+            help="Index of the first /16 network in 10.0.0.0/8 used by the dataset (default: 0)",
+        )
+        parser.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete the dataset instead of creating it",
+        )
+
+    def handle(self, *model_names, **options):
+        start = perf_counter()
+        name = options.get("name")
+
+        if options.get("delete"):
+            if not delete_dataset(name):
+                raise CommandError(f"Dataset {name} does not exist.")
+
+            self.stdout.write(
+                f"Dataset {name} has been deleted ({perf_counter() - start:.2f}s)."
+            )
+            return
+
+        try:
+            result = generate_dataset(
+                name=name,
+                views=options.get("views"),
+                zones=options.get("zones"),
+                records=options.get("records"),
+                reverse_zones=not options.get("no_reverse_zones"),
+                rfc2317_zones=options.get("rfc2317_zones"),
+                ip_addresses=options.get("ip_addresses"),
+                seed=options.get("seed"),
+                network=options.get("network"),
+            )
+        except ValidationError as exc:
+            raise CommandError(", ".join(exc.messages))
+
+        if options.get("verbosity") > 1:
+            for object_type, count in result.items():
+                self.stdout.write(f"{object_type}: {count}")
+
+        self.stdout.write(
+            f"Dataset {name} has been generated ({perf_counter() - start:.2f}s)."
+        )
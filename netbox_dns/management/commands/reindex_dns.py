@@ -0,0 +1,72 @@
+from time import perf_counter
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+
+from extras.models import CachedValue
+from netbox.plugins.utils import get_plugin_config
+
+from netbox_dns.models import Zone, Record
+from netbox_dns.utilities import update_search_cache
+
+
+class Command(BaseCommand):
+    help = "Rebuild the global search cache for zones and records"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            choices=("zone", "record"),
+            action="append",
+            help="Only rebuild the search cache for zones or records (can be specified more than once)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of objects indexed per batch (default: 1000)",
+        )
+
+    def get_querysets(self):
+        records = Record.objects.select_related("zone__view")
+        if get_plugin_config("netbox_dns", "search_exclude_managed_records", False):
+            records = records.filter(managed=False)
+
+        return {
+            "zone": Zone.objects.select_related("view"),
+            "record": records,
+        }
+
+    def handle(self, *model_names, **options):
+        start = perf_counter()
+        batch_size = options.get("batch_size")
+
+        for model_name, queryset in self.get_querysets().items():
+            if options.get("model") and model_name not in options.get("model"):
+                continue
+
+            model = queryset.model
+
+            # +
+            # Remove the entries for objects that no longer exist or are
+            # excluded from the search cache
+            # -
+            removed = (
+                CachedValue.objects.filter(
+                    object_type=ContentType.objects.get_for_model(model)
+                )
+                .exclude(object_id__in=queryset.values("pk"))
+                .delete()[0]
+            )
+
+            cached = update_search_cache(queryset, batch_size=batch_size)
+
+            if options.get("verbosity") > 1:
+                self.stdout.write(
+                    f"{model._meta.verbose_name_plural}: {cached} values cached, "
+                    f"{removed} stale values removed"
+                )
+
+        self.stdout.write(
+            f"The search cache has been rebuilt ({perf_counter() - start:.2f}s)."
+        )
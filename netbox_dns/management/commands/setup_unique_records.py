@@ -0,0 +1,82 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, DatabaseError
+
+from netbox.plugins.utils import get_plugin_config
+
+from netbox_dns.models import Record
+from netbox_dns.models.record import (
+    UNIQUE_RECORDS_INDEX,
+    UNIQUE_RECORDS_INDEX_CACHE_KEY,
+    RECORD_ACTIVE_STATUS_LIST,
+)
+
+
+class Command(BaseCommand):
+    help = "Create or drop the database constraint enforcing unique records"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--remove",
+            action="store_true",
+            default=False,
+            help="Drop the constraint regardless of the configuration",
+        )
+
+    def is_enabled(self):
+        return get_plugin_config(
+            "netbox_dns", "enforce_unique_records", False
+        ) and get_plugin_config("netbox_dns", "unique_records_constraint", False)
+
+    def execute_sql(self, sql, params=None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+        cache.delete(UNIQUE_RECORDS_INDEX_CACHE_KEY)
+
+    def drop_index(self, concurrently):
+        self.execute_sql(
+            f"DROP INDEX {concurrently} IF EXISTS {connection.ops.quote_name(UNIQUE_RECORDS_INDEX)}"
+        )
+
+    def create_index(self, concurrently):
+        # +
+        # The index can only depend on the columns of the record table, so
+        # unlike Record.check_unique_record() it also covers active records
+        # in inactive zones.
+        # -
+        statuses = RECORD_ACTIVE_STATUS_LIST
+        table = connection.ops.quote_name(Record._meta.db_table)
+
+        self.execute_sql(
+            f"CREATE UNIQUE INDEX {concurrently} {connection.ops.quote_name(UNIQUE_RECORDS_INDEX)} "
+            f'ON {table} ("zone_id", LOWER("name"), "type", MD5("value")) '
+            f'WHERE "status" IN ({", ".join(["%s"] * len(statuses))}) '
+            f'AND "ipam_ip_address_id" IS NULL',
+            statuses,
+        )
+
+    def handle(self, *model_names, **options):
+        # +
+        # Indexes can only be built concurrently outside of a transaction
+        # -
+        concurrently = "" if connection.in_atomic_block else "CONCURRENTLY"
+
+        self.drop_index(concurrently)
+
+        if options.get("remove") or not self.is_enabled():
+            if options.get("verbosity"):
+                self.stdout.write("The unique records constraint has been removed")
+            return
+
+        try:
+            self.create_index(concurrently)
+        except DatabaseError as exc:
+            if not connection.in_atomic_block:
+                self.drop_index(concurrently)
+            raise CommandError(
+                f"The unique records constraint could not be created, existing duplicate records need to be cleaned up first: {exc}"
+            )
+
+        if options.get("verbosity"):
+            self.stdout.write("The unique records constraint has been created")
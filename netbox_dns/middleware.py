@@ -0,0 +1,94 @@
+import json
+import logging
+import uuid
+
+from django.core.cache import cache
+
+from netbox.plugins.utils import get_plugin_config
+
+from netbox_dns.utilities import trace
+
+
+__all__ = (
+    "TRACE_HEADER",
+    "TRACE_ID_HEADER",
+    "CascadeTraceMiddleware",
+    "get_trace_cache_key",
+    "may_trace",
+)
+
+
+TRACE_HEADER = "X-NetBox-DNS-Trace"
+TRACE_ID_HEADER = "X-NetBox-DNS-Trace-ID"
+
+logger = logging.getLogger("netbox_dns.trace")
+
+
+def get_trace_cache_key(trace_id):
+    return f"netbox_dns_trace_{trace_id}"
+
+
+def may_trace(user):
+    """
+    Return whether 'user' may request cascade traces and retrieve them.
+    """
+    return (
+        user is not None
+        and user.is_authenticated
+        and (user.is_staff or user.is_superuser)
+    )
+
+
+class CascadeTraceMiddleware:
+    """
+    Record a cascade trace for all requests if 'cascade_trace' is enabled, or
+    for requests by staff users and superusers that have the
+    X-NetBox-DNS-Trace header set. Traces containing at least one instrumented
+    operation are logged as JSON and stored in the cache, and their ID is
+    returned in the X-NetBox-DNS-Trace-ID response header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        trace_all = get_plugin_config("netbox_dns", "cascade_trace", False)
+
+        if not trace_all:
+            if not request.headers.get(TRACE_HEADER):
+                return self.get_response(request)
+
+            # +
+            # Session users are known before the request is processed, so
+            # other users are not traced at all. API requests are authenticated
+            # by the view, so requests without credentials are not traced and
+            # the user of other API requests is checked after the response has
+            # been created.
+            # -
+            user = getattr(request, "user", None)
+            if user is not None and user.is_authenticated:
+                if not may_trace(user):
+                    return self.get_response(request)
+            elif "Authorization" not in request.headers:
+                return self.get_response(request)
+
+        with trace(f"{request.method} {request.path}") as root:
+            response = self.get_response(request)
+
+        if not root.steps or not (
+            trace_all or may_trace(getattr(request, "user", None))
+        ):
+            return response
+
+        trace_id = uuid.uuid4().hex
+        trace_data = {"id": trace_id, **root.to_dict()}
+
+        logger.info(json.dumps(trace_data))
+        cache.set(
+            get_trace_cache_key(trace_id),
+            trace_data,
+            get_plugin_config("netbox_dns", "cascade_trace_retention", 3600),
+        )
+
+        response[TRACE_ID_HEADER] = trace_id
+        return response
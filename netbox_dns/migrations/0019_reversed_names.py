@@ -0,0 +1,71 @@
+from dns import name as dns_name
+from dns.exception import DNSException
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def reverse_name_labels(name):
+    fqdn = dns_name.from_text(name, origin=dns_name.root)
+    return ".".join(
+        dns_name.Name((label,)).to_text().lower()
+        for label in reversed(fqdn.labels[:-1])
+    )
+
+
+def update_reversed_names(apps, schema_editor):
+    Zone = apps.get_model("netbox_dns", "Zone")
+    Record = apps.get_model("netbox_dns", "Record")
+
+    for model, source_field, target_field in (
+        (Zone, "name", "reversed_name"),
+        (Record, "fqdn", "reversed_fqdn"),
+    ):
+        batch = []
+        for instance in (
+            model.objects.filter(**{f"{source_field}__isnull": False})
+            .only("pk", source_field)
+            .iterator(chunk_size=BATCH_SIZE)
+        ):
+            try:
+                setattr(
+                    instance,
+                    target_field,
+                    reverse_name_labels(getattr(instance, source_field)),
+                )
+            except DNSException:
+                continue
+
+            batch.append(instance)
+            if len(batch) >= BATCH_SIZE:
+                model.objects.bulk_update(batch, [target_field])
+                batch = []
+
+        if batch:
+            model.objects.bulk_update(batch, [target_field])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_dns", "0018_zone_domain_status_zone_expiration_date"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zone",
+            name="reversed_name",
+            field=models.CharField(
+                blank=True, db_index=True, default=None, max_length=255, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="record",
+            name="reversed_fqdn",
+            field=models.CharField(
+                blank=True, db_index=True, default=None, max_length=255, null=True
+            ),
+        ),
+        migrations.RunPython(update_reversed_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_dns", "0019_reversed_names"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zone",
+            name="zone_template",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="zones",
+                to="netbox_dns.zonetemplate",
+            ),
+        ),
+        migrations.AddField(
+            model_name="record",
+            name="record_template",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="records",
+                to="netbox_dns.recordtemplate",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_dns", "0020_zone_template_record_template"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                fields=["fqdn", "id"], name="netbox_dns_record_fqdn_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_dns", "0021_record_fqdn_id_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeFeedEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "time",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+                ("action", models.CharField(max_length=50)),
+                ("object_type", models.CharField(max_length=50)),
+                ("object_id", models.BigIntegerField()),
+                ("zone_id", models.BigIntegerField()),
+                ("data", models.JSONField(default=dict)),
+            ],
+            options={
+                "ordering": ("id",),
+                "indexes": [
+                    models.Index(
+                        fields=["zone_id", "id"], name="netbox_dns_changefeed_zone_idx"
+                    )
+                ],
+            },
+        ),
+    ]
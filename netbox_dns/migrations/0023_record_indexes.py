@@ -0,0 +1,40 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_dns", "0022_change_feed_entry"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                fields=["zone", "name", "type"], name="netbox_dns_rec_zone_name_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                fields=["zone", "type", "managed"], name="netbox_dns_rec_zone_type_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                fields=["ip_address"], name="netbox_dns_rec_ip_address_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                models.F("zone"),
+                django.db.models.functions.text.Upper("name"),
+                models.F("type"),
+                condition=models.Q(("status", "inactive"), _negated=True),
+                name="netbox_dns_rec_active_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+
+
+def set_records_last_updated(apps, schema_editor):
+    Zone = apps.get_model("netbox_dns", "Zone")
+    Record = apps.get_model("netbox_dns", "Record")
+
+    Zone.objects.update(
+        records_last_updated=Subquery(
+            Record.objects.filter(zone=OuterRef("pk"))
+            .exclude(type="SOA")
+            .order_by()
+            .values("zone")
+            .annotate(records_last_updated=Max("last_updated"))
+            .values("records_last_updated")
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_dns", "0023_record_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zone",
+            name="records_last_updated",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(set_records_last_updated, migrations.RunPython.noop),
+    ]
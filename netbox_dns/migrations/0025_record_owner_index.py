@@ -0,0 +1,20 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_dns", "0024_zone_records_last_updated"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                models.F("zone"),
+                django.db.models.functions.text.Upper("name"),
+                name="netbox_dns_rec_owner_idx",
+            ),
+        ),
+    ]
@@ -8,3 +8,4 @@ from .zone_template import *
 from .record_template import *
 from .dnssec_key_template import *
 from .dnssec_policy import *
+from .change_feed import *
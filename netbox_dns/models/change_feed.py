@@ -0,0 +1,167 @@
+from functools import partial
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from core.choices import ObjectChangeActionChoices
+from netbox.plugins.utils import get_plugin_config
+
+
+__all__ = ("ChangeFeedEntry",)
+
+
+CHANGE_FEED_LOCK_ID = 0x646E7366  # "dnsf"
+
+
+class ChangeFeedEntry(models.Model):
+    """
+    An entry in the change feed for zones and records. The primary key is the
+    cursor of the feed.
+
+    Entries are written when the transaction that makes the change has been
+    committed, in a short transaction of their own that holds an advisory
+    lock while inserting them. So entries become visible in the order of their
+    primary keys and consumers reading entries after a cursor never miss a
+    change committed later with a lower primary key, while the transactions
+    making the changes are not serialized.
+    """
+
+    FIELDS = {
+        "zone": (
+            "name",
+            "view_id",
+            "status",
+            "default_ttl",
+            "soa_serial",
+        ),
+        "record": (
+            "name",
+            "fqdn",
+            "type",
+            "value",
+            "ttl",
+            "status",
+            "managed",
+            "disable_ptr",
+        ),
+    }
+
+    time = models.DateTimeField(
+        verbose_name=_("Time"),
+        default=timezone.now,
+        db_index=True,
+    )
+    action = models.CharField(
+        verbose_name=_("Action"),
+        max_length=50,
+        choices=ObjectChangeActionChoices,
+    )
+    object_type = models.CharField(
+        verbose_name=_("Object Type"),
+        max_length=50,
+    )
+    object_id = models.BigIntegerField(
+        verbose_name=_("Object ID"),
+    )
+    zone_id = models.BigIntegerField(
+        verbose_name=_("Zone ID"),
+    )
+    data = models.JSONField(
+        verbose_name=_("Data"),
+        default=dict,
+    )
+
+    class Meta:
+        verbose_name = _("Change Feed Entry")
+        verbose_name_plural = _("Change Feed Entries")
+
+        ordering = ("id",)
+
+        indexes = [
+            models.Index(
+                fields=["zone_id", "id"],
+                name="netbox_dns_changefeed_zone_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.pk}: {self.action} {self.object_type} {self.object_id}"
+
+    @staticmethod
+    def is_enabled():
+        return get_plugin_config("netbox_dns", "change_feed_enabled", False)
+
+    @classmethod
+    def _insert(cls, entries):
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT pg_advisory_xact_lock(%s)", [CHANGE_FEED_LOCK_ID]
+                    )
+
+            cls.objects.bulk_create(entries)
+
+    @classmethod
+    def _write(cls, entries):
+        if not entries:
+            return
+
+        # +
+        # Outside of a transaction the callback runs immediately. Entries of
+        # rolled back transactions and savepoints are discarded.
+        # -
+        transaction.on_commit(partial(cls._insert, entries))
+
+    @classmethod
+    def log(cls, objects, action):
+        """
+        Add entries for zone or record instances to the change feed.
+        """
+        if not cls.is_enabled():
+            return
+
+        entries = []
+        for obj in objects:
+            object_type = obj._meta.model_name
+            entries.append(
+                cls(
+                    action=action,
+                    object_type=object_type,
+                    object_id=obj.pk,
+                    zone_id=obj.pk if object_type == "zone" else obj.zone_id,
+                    data={
+                        field: getattr(obj, field) for field in cls.FIELDS[object_type]
+                    },
+                )
+            )
+
+        cls._write(entries)
+
+    @classmethod
+    def log_queryset(cls, queryset, action):
+        """
+        Add entries for the zones or records in a queryset to the change feed.
+        This is used after bulk updates, which do not send signals. The field
+        values are fetched with one query.
+        """
+        if not cls.is_enabled():
+            return
+
+        object_type = queryset.model._meta.model_name
+        fields = cls.FIELDS[object_type]
+        zone_field = "pk" if object_type == "zone" else "zone_id"
+
+        cls._write(
+            [
+                cls(
+                    action=action,
+                    object_type=object_type,
+                    object_id=values["pk"],
+                    zone_id=values[zone_field],
+                    data={field: values[field] for field in fields},
+                )
+                for values in queryset.order_by().values(*{"pk", zone_field, *fields})
+            ]
+        )
@@ -5,13 +5,17 @@ import dns
 from dns import name as dns_name
 from dns import rdata
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db import transaction, models
-from django.db.models import Q, ExpressionWrapper, BooleanField, Min
+from django.db import connection, transaction, models, IntegrityError
+from django.db.models import Q, F, ExpressionWrapper, BooleanField, Min
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange
 from netbox.models import NetBoxModel
 from ipam.models import IPAddress
 from netbox.models.features import ContactsMixin
@@ -20,7 +24,14 @@ from netbox.plugins.utils import get_plugin_config
 from utilities.querysets import RestrictedQuerySet
 
 from netbox_dns.fields import AddressField
-from netbox_dns.utilities import arpa_to_prefix, name_to_unicode, get_query_from_filter
+from netbox_dns.utilities import (
+    arpa_to_prefix,
+    name_to_unicode,
+    reverse_name_labels,
+    get_query_from_filter,
+    compact_change_data,
+    instrumented,
+)
 from netbox_dns.validators import validate_generic_name, validate_record_value
 from netbox_dns.mixins import ObjectModificationMixin
 from netbox_dns.choices import (
@@ -38,6 +49,43 @@ __all__ = (
 ZONE_ACTIVE_STATUS_LIST = get_plugin_config("netbox_dns", "zone_active_status")
 RECORD_ACTIVE_STATUS_LIST = get_plugin_config("netbox_dns", "record_active_status")
 
+OWNER_RECORD_FIELDS = (
+    "name",
+    "type",
+    "ttl",
+    "value",
+    "status",
+    "managed",
+    "ipam_ip_address_id",
+)
+
+UNIQUE_RECORDS_INDEX = "netbox_dns_record_unique_idx"
+UNIQUE_RECORDS_INDEX_CACHE_KEY = "netbox_dns.unique_records_index"
+UNIQUE_RECORDS_INDEX_CACHE_TIMEOUT = 300
+
+
+def unique_records_index_exists():
+    """
+    Return whether the unique index created by 'setup_unique_records' exists.
+    The result is cached, and the command removes the cache entry whenever it
+    creates or drops the index.
+    """
+
+    def _lookup():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND indexname = %s",
+                [UNIQUE_RECORDS_INDEX],
+            )
+            return cursor.fetchone() is not None
+
+    return cache.get_or_set(
+        UNIQUE_RECORDS_INDEX_CACHE_KEY,
+        _lookup,
+        timeout=UNIQUE_RECORDS_INDEX_CACHE_TIMEOUT,
+    )
+
 
 def min_ttl(*ttl_list):
     return min((ttl for ttl in ttl_list if ttl is not None), default=None)
@@ -140,6 +188,14 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
         default=None,
         db_collation="natural_sort",
     )
+    reversed_fqdn = models.CharField(
+        verbose_name=_("Reversed FQDN"),
+        max_length=255,
+        null=True,
+        blank=True,
+        default=None,
+        db_index=True,
+    )
     type = models.CharField(
         verbose_name=_("Type"),
         choices=RecordTypeChoices,
@@ -214,6 +270,15 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
         null=True,
         blank=True,
     )
+    record_template = models.ForeignKey(
+        verbose_name=_("Record Template"),
+        to="RecordTemplate",
+        on_delete=models.SET_NULL,
+        related_name="records",
+        help_text=_("Record template the record was created from"),
+        null=True,
+        blank=True,
+    )
 
     objects = RecordManager()
     raw_objects = RestrictedQuerySet.as_manager()
@@ -243,6 +308,37 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
             "status",
         )
 
+        indexes = (
+            models.Index(
+                fields=("fqdn", "id"),
+                name="netbox_dns_record_fqdn_id_idx",
+            ),
+            models.Index(
+                fields=("zone", "name", "type"),
+                name="netbox_dns_rec_zone_name_idx",
+            ),
+            models.Index(
+                fields=("zone", "type", "managed"),
+                name="netbox_dns_rec_zone_type_idx",
+            ),
+            models.Index(
+                fields=("ip_address",),
+                name="netbox_dns_rec_ip_address_idx",
+            ),
+            models.Index(
+                F("zone"),
+                Upper("name"),
+                name="netbox_dns_rec_owner_idx",
+            ),
+            models.Index(
+                F("zone"),
+                Upper("name"),
+                F("type"),
+                name="netbox_dns_rec_active_idx",
+                condition=~Q(status=RecordStatusChoices.STATUS_INACTIVE),
+            ),
+        )
+
     def __str__(self):
         try:
             fqdn = dns_name.from_text(
@@ -353,6 +449,7 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
     def is_delegation_record(self):
         return self in self.zone.delegation_records
 
+    @instrumented()
     def update_ptr_record(self, update_rfc2317_cname=True, save_zone_serial=True):
         ptr_zone = self.ptr_zone
 
@@ -440,6 +537,7 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
             else:
                 self.rfc2317_cname_record.delete()
 
+    @instrumented()
     def update_rfc2317_cname_record(self, save_zone_serial=True):
         if self.zone.rfc2317_parent_managed:
             cname_name = (
@@ -565,6 +663,7 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
 
         self.name = name.relativize(_zone).to_text()
         self.fqdn = fqdn.to_text()
+        self.reversed_fqdn = reverse_name_labels(self.fqdn)
 
     def validate_name(self, new_zone=None):
         if new_zone is None:
@@ -608,44 +707,78 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
         except ValidationError as exc:
             raise ValidationError({"value": exc})
 
-    def check_unique_record(self, new_zone=None):
+    def get_owner_records(self, zone=None):
+        """
+        Return the values of the other records with the same owner name in the
+        zone that are needed to validate the record. The queryset is evaluated
+        lazily and only once, so all checks in 'clean()' share a single query.
+        """
+        if zone is None:
+            zone = self.zone
+
+        records = Record.raw_objects.filter(zone=zone, name__iexact=self.name)
+
+        if not self._state.adding:
+            records = records.exclude(pk=self.pk)
+
+        return records.order_by().values(*OWNER_RECORD_FIELDS)
+
+    def check_unique_record(self, new_zone=None, records=None):
         if not get_plugin_config("netbox_dns", "enforce_unique_records", False):
             return
 
         if not self.is_active:
             return
 
-        if new_zone is None:
-            new_zone = self.zone
-
-        records = new_zone.records.filter(
-            name__iexact=self.name,
-            type=self.type,
-            value=self.value,
-            status__in=RECORD_ACTIVE_STATUS_LIST,
-        )
+        if records is None:
+            records = self.get_owner_records(zone=new_zone)
 
-        if not self._state.adding:
-            records = records.exclude(pk=self.pk)
+        records = [
+            record
+            for record in records
+            if record["type"] == self.type
+            and record["value"] == self.value
+            and record["status"] in RECORD_ACTIVE_STATUS_LIST
+        ]
 
-        if records.exists():
+        if (
+            self.ipam_ip_address is None
+            and get_plugin_config("netbox_dns", "unique_records_constraint", False)
+            and unique_records_index_exists()
+        ):
+            # +
+            # Uniqueness among records not created by DNSsync is enforced by
+            # the database, only DNSsync records need to be checked. If the
+            # index has not been created, all records are checked.
+            # -
+            if get_plugin_config("netbox_dns", "dnssync_disabled", False):
+                return
+
+            records = [
+                record for record in records if record["ipam_ip_address_id"] is not None
+            ]
+
+        if records:
             if self.ipam_ip_address is not None:
-                if not records.filter(
-                    ipam_ip_address__isnull=True
-                ).exists() or get_plugin_config(
+                if all(
+                    record["ipam_ip_address_id"] is not None for record in records
+                ) or get_plugin_config(
                     "netbox_dns", "dnssync_conflict_deactivate", False
                 ):
                     return
 
-            raise ValidationError(
-                {
-                    "value": _(
-                        "There is already an active {type} record for name {name} in zone {zone} with value {value}."
-                    ).format(
-                        type=self.type, name=self.name, zone=self.zone, value=self.value
-                    )
-                }
-            )
+            self.raise_unique_record_error()
+
+    def raise_unique_record_error(self):
+        raise ValidationError(
+            {
+                "value": _(
+                    "There is already an active {type} record for name {name} in zone {zone} with value {value}."
+                ).format(
+                    type=self.type, name=self.name, zone=self.zone, value=self.value
+                )
+            }
+        )
 
     @property
     def absolute_value(self):
@@ -706,7 +839,7 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
             record.status = RecordStatusChoices.STATUS_INACTIVE
             record.save(update_fields=["status"])
 
-    def check_unique_rrset_ttl(self):
+    def check_unique_rrset_ttl(self, records=None):
         if not self._state.adding:
             return
 
@@ -721,23 +854,23 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
         if self.type == RecordTypeChoices.PTR and self.managed:
             return
 
-        records = (
-            self.zone.records.filter(
-                name=self.name,
-                type=self.type,
-            )
-            .exclude(ttl=self.ttl)
-            .exclude(type=RecordTypeChoices.PTR, managed=True)
-            .exclude(status=RecordStatusChoices.STATUS_INACTIVE)
-        )
-
-        if self.ipam_ip_address is not None:
-            records = records.exclude(ipam_ip_address__isnull=False)
-
-        if not records.exists():
+        if records is None:
+            records = self.get_owner_records()
+
+        conflicting_ttls = {
+            str(record["ttl"])
+            for record in records
+            if record["name"] == self.name
+            and record["type"] == self.type
+            and record["ttl"] != self.ttl
+            and not (record["type"] == RecordTypeChoices.PTR and record["managed"])
+            and record["status"] != RecordStatusChoices.STATUS_INACTIVE
+            and (self.ipam_ip_address is None or record["ipam_ip_address_id"] is None)
+        }
+
+        if not conflicting_ttls:
             return
 
-        conflicting_ttls = ", ".join({str(record.ttl) for record in records})
         raise ValidationError(
             {
                 "ttl": _(
@@ -746,7 +879,7 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
                     type=self.type,
                     name=self.name,
                     zone=self.zone,
-                    ttls=conflicting_ttls,
+                    ttls=", ".join(conflicting_ttls),
                 )
             }
         )
@@ -779,60 +912,76 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
             record.ttl = ttl
             record.save(update_fields=["ttl"], update_rrset_ttl=False)
 
-    def clean_fields(self, exclude=None):
+    def normalize_fields(self):
         self.type = self.type.upper()
         if get_plugin_config("netbox_dns", "convert_names_to_lowercase", False):
             self.name = self.name.lower()
 
-        super().clean_fields(exclude=exclude)
+    def clean_fields(self, exclude=None):
+        self.normalize_fields()
 
-    def clean(self, *args, new_zone=None, **kwargs):
-        self.validate_name(new_zone=new_zone)
-        self.validate_value()
-        self.check_unique_record(new_zone=new_zone)
-        if self._state.adding:
-            self.check_unique_rrset_ttl()
+        super().clean_fields(exclude=exclude)
 
-        if not self.is_active:
+    def check_rfc2317_cname_conflict(self):
+        if self.type != RecordTypeChoices.A or self.disable_ptr:
             return
 
-        records = self.zone.records.filter(name=self.name, active=True).exclude(
-            pk=self.pk
-        )
+        ptr_zone = self.ptr_zone
 
-        if self.type == RecordTypeChoices.A and not self.disable_ptr:
-            ptr_zone = self.ptr_zone
+        if (
+            ptr_zone is not None
+            and ptr_zone.is_rfc2317_zone
+            and ptr_zone.rfc2317_parent_managed
+        ):
+            ptr_cname_zone = ptr_zone.rfc2317_parent_zone
+            ptr_cname_name = self.rfc2317_ptr_cname_name
+            ptr_fqdn = dns_name.from_text(
+                self.rfc2317_ptr_name, origin=dns_name.from_text(ptr_zone.name)
+            )
 
             if (
-                ptr_zone is not None
-                and ptr_zone.is_rfc2317_zone
-                and ptr_zone.rfc2317_parent_managed
+                ptr_cname_zone.records.filter(
+                    name=ptr_cname_name,
+                    active=True,
+                )
+                .exclude(
+                    type=RecordTypeChoices.CNAME,
+                    value=ptr_fqdn,
+                )
+                .exclude(type=RecordTypeChoices.NSEC)
+                .exists()
             ):
-                ptr_cname_zone = ptr_zone.rfc2317_parent_zone
-                ptr_cname_name = self.rfc2317_ptr_cname_name
-                ptr_fqdn = dns_name.from_text(
-                    self.rfc2317_ptr_name, origin=dns_name.from_text(ptr_zone.name)
+                raise ValidationError(
+                    {
+                        "value": _(
+                            "There is already an active record for name {name} in zone {zone}, RFC2317 CNAME is not allowed."
+                        ).format(name=ptr_cname_name, zone=ptr_cname_zone)
+                    }
                 )
 
-                if (
-                    ptr_cname_zone.records.filter(
-                        name=ptr_cname_name,
-                        active=True,
-                    )
-                    .exclude(
-                        type=RecordTypeChoices.CNAME,
-                        value=ptr_fqdn,
-                    )
-                    .exclude(type=RecordTypeChoices.NSEC)
-                    .exists()
-                ):
-                    raise ValidationError(
-                        {
-                            "value": _(
-                                "There is already an active record for name {name} in zone {zone}, RFC2317 CNAME is not allowed."
-                            ).format(name=ptr_cname_name, zone=ptr_cname_zone)
-                        }
-                    )
+    def check_record_rules(self, records, new_zone=None):
+        """
+        Check the record against the other records with the same owner name
+        in its zone. 'records' contains the values of these records in the
+        format returned by 'get_owner_records()'.
+        """
+        zone = new_zone if new_zone is not None else self.zone
+
+        self.check_unique_record(new_zone=new_zone, records=records)
+        if self._state.adding:
+            self.check_unique_rrset_ttl(records=records)
+
+        if not self.is_active:
+            return
+
+        self.check_rfc2317_cname_conflict()
+
+        types = {
+            record["type"]
+            for record in records
+            if record["name"] == self.name
+            and record["status"] in RECORD_ACTIVE_STATUS_LIST
+        }
 
         if self.type == RecordTypeChoices.SOA and self.name != "@":
             raise ValidationError(
@@ -844,39 +993,166 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
             )
 
         if self.type == RecordTypeChoices.CNAME:
-            if records.exclude(type=RecordTypeChoices.NSEC).exists():
+            if types - {RecordTypeChoices.NSEC}:
                 raise ValidationError(
                     {
                         "type": _(
                             "There is already an active record for name {name} in zone {zone}, CNAME is not allowed."
-                        ).format(name=self.name, zone=self.zone)
+                        ).format(name=self.name, zone=zone)
                     }
                 )
 
-        elif (
-            records.filter(type=RecordTypeChoices.CNAME).exists()
-            and self.type != RecordTypeChoices.NSEC
-        ):
+        elif RecordTypeChoices.CNAME in types and self.type != RecordTypeChoices.NSEC:
             raise ValidationError(
                 {
                     "type": _(
                         "There is already an active CNAME record for name {name} in zone {zone}, no other record allowed."
-                    ).format(name=self.name, zone=self.zone)
+                    ).format(name=self.name, zone=zone)
                 }
             )
 
         elif self.type in RecordTypeChoices.SINGLETONS:
-            if records.filter(type=self.type).exists():
+            if self.type in types:
                 raise ValidationError(
                     {
                         "type": _(
                             "There is already an active {type} record for name {name} in zone {zone}, more than one are not allowed."
-                        ).format(type=self.type, name=self.name, zone=self.zone)
+                        ).format(type=self.type, name=self.name, zone=zone)
                     }
                 )
 
+    def clean(self, *args, new_zone=None, **kwargs):
+        self.validate_name(new_zone=new_zone)
+        self.validate_value()
+
+        self.check_record_rules(
+            self.get_owner_records(zone=new_zone), new_zone=new_zone
+        )
+
         super().clean(*args, **kwargs)
 
+    def check_record_set(self, records, zone=None):
+        """
+        Validate a new record against other records in its zone that are passed
+        in instead of being looked up in the database. 'records' contains the
+        records in the zone that may conflict with the new record, e.g. all
+        records with the same name.
+
+        This performs the same checks as 'clean()' and is used to validate
+        records created from record templates in bulk or for zones that have
+        not been saved yet.
+        """
+        if zone is None:
+            zone = self.zone
+
+        self.validate_name(new_zone=zone)
+        self.validate_value()
+
+        self.check_record_rules(
+            [
+                {
+                    field: record.serializable_value(field)
+                    for field in OWNER_RECORD_FIELDS
+                }
+                for record in records
+                if record is not self and record.name.lower() == self.name.lower()
+            ],
+            new_zone=zone,
+        )
+
+    @property
+    def changelog_policy(self):
+        if not self.managed:
+            return "full"
+
+        return get_plugin_config("netbox_dns", "changelog_managed_records", "full")
+
+    def _get_tag_names(self):
+        return sorted(tag.name for tag in self.tags.all())
+
+    def _get_changelog_data(self, saved=False, tags=False):
+        data = {}
+        for field in self._meta.concrete_fields:
+            if field.name not in self.check_fields:
+                continue
+
+            value = self.__dict__.get(
+                f"_saved_{field.attname}" if saved else field.attname
+            )
+            if not isinstance(value, (str, int, float, bool, dict, list, type(None))):
+                value = str(value)
+
+            data[field.name] = value
+
+        # +
+        # Tags are only included if they were saved by 'snapshot()' or are
+        # requested explicitly, so compact entries do not require a query for
+        # the tags of each record.
+        # -
+        if saved:
+            if (prechange_tags := self.__dict__.get("_prechange_tags")) is not None:
+                data["tags"] = prechange_tags
+        elif tags or "_prechange_tags" in self.__dict__:
+            data["tags"] = self._get_tag_names()
+
+        return data
+
+    def snapshot(self):
+        match self.changelog_policy:
+            case "full":
+                super().snapshot()
+            case "compact":
+                self._prechange_tags = self._get_tag_names()
+
+    def to_objectchange(self, action):
+        """
+        Return the change log entry for the record. Depending on the setting
+        'changelog_managed_records', the entry for a managed record is
+        either a full entry, an entry containing only the changed fields
+        ('compact') or, except for deletions, an entry without any changes
+        that is not saved ('none'). Compact entries are built from the field
+        values saved by ObjectModificationMixin and do not require serializing
+        the record.
+
+        NetBox builds another entry after the record has been saved when its
+        tags are changed and uses its post-change data for the entry already
+        written for the request, so the data from before the last save is
+        kept in '_changelog_prechange'.
+        """
+        policy = self.changelog_policy
+        if policy == "full":
+            return super().to_objectchange(action)
+
+        prechange_data = None
+        postchange_data = None
+        if policy == "none" and action != ObjectChangeActionChoices.ACTION_DELETE:
+            prechange_data = {}
+            postchange_data = {}
+        else:
+            match action:
+                case ObjectChangeActionChoices.ACTION_CREATE:
+                    postchange_data = self._get_changelog_data()
+                case ObjectChangeActionChoices.ACTION_UPDATE:
+                    prechange_data = self.__dict__.get("_changelog_prechange")
+                    if prechange_data is None:
+                        prechange_data = self._get_changelog_data(saved=True)
+                    postchange_data = self._get_changelog_data(tags=not prechange_data)
+                case _:
+                    prechange_data = self._get_changelog_data()
+
+            prechange_data, postchange_data = compact_change_data(
+                prechange_data, postchange_data
+            )
+
+        return ObjectChange(
+            changed_object=self,
+            object_repr=str(self)[:200],
+            action=action,
+            prechange_data=prechange_data,
+            postchange_data=postchange_data,
+        )
+
+    @instrumented()
     def save(
         self,
         *args,
@@ -887,39 +1163,63 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
     ):
         self.full_clean()
 
-        if not self._state.adding and update_rrset_ttl:
-            self.update_rrset_ttl()
+        # +
+        # The PTR record, RFC2317 CNAME record and conflicting address records
+        # are written before the record itself, so the whole cascade must be
+        # rolled back if saving the record fails.
+        # -
+        with transaction.atomic():
+            if not self._state.adding and update_rrset_ttl:
+                self.update_rrset_ttl()
+
+            if self.is_ptr_record:
+                if self.zone.is_rfc2317_zone:
+                    self.ip_address = self.address_from_rfc2317_name
+                    if update_rfc2317_cname:
+                        self.update_rfc2317_cname_record(
+                            save_zone_serial=save_zone_serial
+                        )
+                else:
+                    self.ip_address = self.address_from_name
 
-        if self.is_ptr_record:
-            if self.zone.is_rfc2317_zone:
-                self.ip_address = self.address_from_rfc2317_name
-                if update_rfc2317_cname:
-                    self.update_rfc2317_cname_record(save_zone_serial=save_zone_serial)
+            elif self.is_address_record:
+                self.ip_address = netaddr.IPAddress(self.value)
             else:
-                self.ip_address = self.address_from_name
+                self.ip_address = None
 
-        elif self.is_address_record:
-            self.ip_address = netaddr.IPAddress(self.value)
-        else:
-            self.ip_address = None
+            if self.is_address_record:
+                self.handle_conflicting_address_records()
+                self.update_ptr_record(
+                    update_rfc2317_cname=update_rfc2317_cname,
+                    save_zone_serial=save_zone_serial,
+                )
+            elif self.ptr_record is not None:
+                self.ptr_record.delete()
+                self.ptr_record = None
 
-        if self.is_address_record:
-            self.handle_conflicting_address_records()
-            self.update_ptr_record(
-                update_rfc2317_cname=update_rfc2317_cname,
-                save_zone_serial=save_zone_serial,
-            )
-        elif self.ptr_record is not None:
-            self.ptr_record.delete()
-            self.ptr_record = None
+            if self.changelog_policy == "compact":
+                self._changelog_prechange = (
+                    {} if self._state.adding else self._get_changelog_data(saved=True)
+                )
 
-        changed_fields = self.changed_fields
-        if changed_fields is None or changed_fields:
-            super().save(*args, **kwargs)
+            changed_fields = self.changed_fields
+            if changed_fields is None or changed_fields:
+                if get_plugin_config("netbox_dns", "unique_records_constraint", False):
+                    try:
+                        with transaction.atomic():
+                            super().save(*args, **kwargs)
+                    except IntegrityError as exc:
+                        if UNIQUE_RECORDS_INDEX not in str(exc):
+                            raise
+
+                        self.raise_unique_record_error()
+                else:
+                    super().save(*args, **kwargs)
 
-            if self.type != RecordTypeChoices.SOA and self.zone.soa_serial_auto:
-                self.zone.update_serial(save_zone_serial=save_zone_serial)
+                if self.type != RecordTypeChoices.SOA:
+                    self.zone.update_serial(save_zone_serial=save_zone_serial)
 
+    @instrumented()
     def delete(self, *args, save_zone_serial=True, **kwargs):
         if self.rfc2317_cname_record:
             self.remove_from_rfc2317_cname_record(save_zone_serial=save_zone_serial)
@@ -929,9 +1229,7 @@ class Record(ObjectModificationMixin, ContactsMixin, NetBoxModel):
 
         super().delete(*args, **kwargs)
 
-        _zone = self.zone
-        if _zone.soa_serial_auto:
-            _zone.update_serial(save_zone_serial=save_zone_serial)
+        self.zone.update_serial(save_zone_serial=save_zone_serial)
 
 
 @register_search
@@ -944,3 +1242,12 @@ class RecordIndex(SearchIndex):
         ("zone", 200),
         ("type", 200),
     )
+
+    @classmethod
+    def to_cache(cls, instance, custom_fields=None):
+        if instance.managed and get_plugin_config(
+            "netbox_dns", "search_exclude_managed_records", False
+        ):
+            return []
+
+        return super().to_cache(instance, custom_fields=custom_fields)
@@ -90,6 +90,7 @@ class RecordTemplate(NetBoxModel):
         "ttl",
         "disable_ptr",
         "tenant",
+        "description",
     )
 
     class Meta:
@@ -101,6 +102,16 @@ class RecordTemplate(NetBoxModel):
     def __str__(self):
         return str(self.name)
 
+    @classmethod
+    def record_fields(cls):
+        """
+        Return pairs of the record fields set from a record template and the
+        corresponding fields of the record template.
+        """
+        return (("name", "record_name"),) + tuple(
+            (field, field) for field in cls.template_fields
+        )
+
     def get_status_color(self):
         return RecordStatusChoices.colors.get(self.status)
 
@@ -149,19 +160,74 @@ class RecordTemplate(NetBoxModel):
             name=self.record_name, type=self.type, value=self.value
         )
 
-    def create_record(self, zone):
-        if self.matching_records(zone).exists():
-            return
-
+    def build_record(self, zone):
         record_data = {
             "zone": zone,
             "name": self.record_name,
+            "record_template": self,
         }
         for field in self.template_fields:
             record_data[field] = getattr(self, field)
 
+        return Record(**record_data)
+
+    def validate_record(self, zone, records):
+        """
+        Build the record for 'zone' and validate it against 'records', the
+        relevant records in the zone, without saving it. Return None if there
+        already is a record with the same name, type and value.
+        """
+        if any(
+            record.name == self.record_name
+            and record.type == self.type
+            and record.value == self.value
+            for record in records
+        ):
+            return None
+
+        record = self.build_record(zone)
+
+        try:
+            record.check_record_set(records, zone=zone)
+        except ValidationError as exc:
+            raise ValidationError(
+                {
+                    None: _(
+                        "Error while processing record template {template}: {error}"
+                    ).format(template=self, error=exc.messages[0])
+                }
+            )
+
+        return record
+
+    def apply_to_record(self, record):
+        """
+        Set the fields of an existing record created from the template to the
+        values of the template. Return True if any field was changed.
+        """
+        record_data = {}
+        for field, template_field in self.record_fields():
+            attname = self._meta.get_field(template_field).attname
+            record_data[Record._meta.get_field(field).attname] = getattr(self, attname)
+
+        fields_changed = False
+        for field, value in record_data.items():
+            if getattr(record, field) != value:
+                setattr(record, field, value)
+                fields_changed = True
+
+        return fields_changed
+
+    def create_record(self, zone):
+        if (matching_records := self.matching_records(zone)).exists():
+            matching_records.filter(record_template__isnull=True).update(
+                record_template=self
+            )
+            return
+
         try:
-            record = Record.objects.create(**record_data)
+            record = self.build_record(zone)
+            record.save()
         except ValidationError as exc:
             raise ValidationError(
                 {
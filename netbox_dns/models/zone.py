@@ -9,16 +9,32 @@ from django.core.validators import (
     MinValueValidator,
     MaxValueValidator,
 )
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import (
+    ObjectDoesNotExist,
+    PermissionDenied,
+    ValidationError,
+)
 from django.db import models, transaction
-from django.db.models import Q, Max, ExpressionWrapper, BooleanField, UniqueConstraint
-from django.db.models.functions import Length, Lower
+from django.db.models import (
+    Q,
+    F,
+    Value,
+    Subquery,
+    OuterRef,
+    ExpressionWrapper,
+    BooleanField,
+    UniqueConstraint,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Length, Lower, Concat, Substr
 from django.db.models.signals import m2m_changed
 from django.urls import reverse
 from django.dispatch import receiver
 from django.conf import settings
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from core.choices import ObjectChangeActionChoices
 from netbox.models import NetBoxModel
 from netbox.models.features import ContactsMixin
 from netbox.search import SearchIndex, register_search
@@ -41,8 +57,15 @@ from netbox_dns.utilities import (
     name_to_unicode,
     normalize_name,
     get_parent_zone_names,
-    regex_from_list,
+    reverse_name_labels,
+    update_search_cache,
+    delete_search_cache,
+    log_object_changes,
+    ZoneDeletionPlan,
+    get_zone_deletion_plan,
     NameFormatError,
+    instrument,
+    instrumented,
 )
 from netbox_dns.validators import (
     validate_rname,
@@ -52,6 +75,7 @@ from netbox_dns.mixins import ObjectModificationMixin
 
 from .record import Record
 from .view import View
+from .change_feed import ChangeFeedEntry
 from .nameserver import NameServer
 
 
@@ -102,6 +126,14 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
         max_length=255,
         db_collation="natural_sort",
     )
+    reversed_name = models.CharField(
+        verbose_name=_("Reversed Name"),
+        max_length=255,
+        null=True,
+        blank=True,
+        default=None,
+        db_index=True,
+    )
     description = models.CharField(
         verbose_name=_("Description"),
         max_length=200,
@@ -285,6 +317,21 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
         blank=True,
         null=True,
     )
+    zone_template = models.ForeignKey(
+        verbose_name=_("Zone Template"),
+        to="ZoneTemplate",
+        on_delete=models.SET_NULL,
+        related_name="zones",
+        help_text=_("Zone template that was last applied to the zone"),
+        blank=True,
+        null=True,
+    )
+    records_last_updated = models.DateTimeField(
+        verbose_name=_("Records Last Updated"),
+        editable=False,
+        blank=True,
+        null=True,
+    )
 
     objects = ZoneManager()
 
@@ -437,17 +484,24 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
 
     @property
     def child_zones(self):
-        return self.view.zones.filter(name__iregex=rf"^[^.]+\.{re.escape(self.name)}$")
+        descendant_prefix = f"{reverse_name_labels(self.name)}."
+
+        return self.view.zones.filter(
+            reversed_name__startswith=descendant_prefix,
+            reversed_name__regex=rf"^{re.escape(descendant_prefix)}[^.]+$",
+        )
 
     @property
     def descendant_zones(self):
-        return self.view.zones.filter(name__iendswith=f".{self.name}")
+        return self.view.zones.filter(
+            reversed_name__startswith=f"{reverse_name_labels(self.name)}."
+        )
 
     @property
     def parent_zone(self):
         try:
             return self.view.zones.get(
-                name__iexact=get_parent_zone_names(self.name)[-1]
+                reversed_name=reverse_name_labels(get_parent_zone_names(self.name)[-1])
             )
         except (Zone.DoesNotExist, IndexError):
             return None
@@ -456,24 +510,24 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
     def ancestor_zones(self):
         return (
             self.view.zones.annotate(name_length=Length("name"))
-            .filter(name__iregex=regex_from_list(get_parent_zone_names(self.name)))
+            .filter(
+                reversed_name__in=[
+                    reverse_name_labels(name)
+                    for name in get_parent_zone_names(self.name)
+                ]
+            )
             .order_by("name_length")
         )
 
     @property
     def delegation_records(self):
-        descendant_zone_names = [
-            rf"{name}."
-            for name in (
-                name.lower()
-                for name in self.descendant_zones.values_list("name", flat=True)
-            )
-        ]
+        descendant_zone_names = list(
+            self.descendant_zones.values_list("reversed_name", flat=True)
+        )
 
-        ns_records = (
-            self.records.filter(type=RecordTypeChoices.NS)
-            .exclude(fqdn__iexact=self.fqdn)
-            .filter(fqdn__iregex=regex_from_list(descendant_zone_names))
+        ns_records = self.records.filter(
+            type=RecordTypeChoices.NS,
+            reversed_fqdn__in=descendant_zone_names,
         )
         ns_values = [record.value_fqdn for record in ns_records]
 
@@ -509,6 +563,7 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
             )
         )
 
+    @instrumented()
     def update_soa_record(self):
         soa_name = "@"
         soa_ttl = self.soa_ttl
@@ -637,16 +692,149 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
                 }
             )
 
-    def get_auto_serial(self):
-        records = Record.objects.filter(zone_id=self.pk).exclude(
-            type=RecordTypeChoices.SOA
+    def check_record_fqdns(self):
+        """
+        Check that renaming the zone does not result in record FQDNs that
+        exceed the maximum length of a DNS name.
+
+        In wire format a relative name is at most one octet longer than its
+        text representation, as escaped characters only make the text longer.
+        Only names whose text is long enough to exceed the limit in the renamed
+        zone are therefore fetched and checked.
+        """
+        zone = dns_name.from_text(self.name, origin=dns_name.root)
+        max_length = 254 - len(zone.to_wire())
+
+        names = (
+            self.records.filter(ipam_ip_address__isnull=True)
+            .exclude(name="@")
+            .annotate(name_length=Length("name"))
+            .filter(name_length__gt=max_length)
+            .values_list("name", flat=True)
+            .distinct()
+        )
+
+        for name in names:
+            try:
+                dns_name.from_text(name, origin=zone)
+            except DNSException as exc:
+                raise ValidationError(
+                    {
+                        "name": _(
+                            "Renaming the zone would result in an invalid name for record {name}: {error}"
+                        ).format(name=name, error=exc)
+                    }
+                )
+
+    @instrumented()
+    def update_record_fqdns(self, old_name):
+        """
+        Rewrite the FQDNs of the records in a renamed zone using queryset updates
+        instead of saving each record, then update the values of the PTR records
+        pointing to the address records in the zone.
+
+        The record names are relative to the zone and do not change, so the
+        checks in 'check_record_fqdns' are sufficient for validation. Change log
+        entries for the rewritten records are written in bulk.
+        """
+        now = timezone.now()
+
+        zone_fqdn = dns_name.from_text(self.name, origin=dns_name.root).to_text()
+        fqdn_suffix = zone_fqdn if zone_fqdn == "." else f".{zone_fqdn}"
+
+        reversed_name = reverse_name_labels(self.name)
+        new_reversed_prefix = f"{reversed_name}." if reversed_name else ""
+        old_reversed_name = reverse_name_labels(old_name)
+        old_reversed_prefix = f"{old_reversed_name}." if old_reversed_name else ""
+
+        records = Record.raw_objects.filter(zone=self, ipam_ip_address__isnull=True)
+
+        ptr_records = Record.raw_objects.filter(
+            type=RecordTypeChoices.PTR,
+            address_record__in=records,
+        )
+        updated_records = Record.objects.filter(
+            Q(pk__in=records.values("pk")) | Q(pk__in=ptr_records.values("pk"))
         )
-        if records:
-            soa_serial = (
-                records.aggregate(Max("last_updated"))
-                .get("last_updated__max")
-                .timestamp()
+
+        # +
+        # Queryset updates do not create change log entries, so the records are
+        # snapshotted before and logged after the updates.
+        # -
+        changed_records = list(updated_records.prefetch_related("tags"))
+        for record in changed_records:
+            record.snapshot()
+
+        records.filter(name="@").update(
+            fqdn=zone_fqdn,
+            reversed_fqdn=reversed_name,
+            last_updated=now,
+        )
+        records.exclude(name="@").update(
+            fqdn=Concat(F("name"), Value(fqdn_suffix)),
+            reversed_fqdn=Concat(
+                Value(new_reversed_prefix),
+                Substr("reversed_fqdn", len(old_reversed_prefix) + 1),
+            ),
+            last_updated=now,
+        )
+
+        ptr_zones = Zone.objects.filter(
+            pk__in=ptr_records.values_list("zone_id", flat=True)
+        )
+
+        ptr_records.update(
+            value=Subquery(
+                Record.raw_objects.filter(ptr_record=OuterRef("pk")).values("fqdn")[:1]
+            ),
+            last_updated=now,
+        )
+
+        for ptr_zone in ptr_zones:
+            ptr_zone.update_serial()
+
+        updated_values = {
+            pk: (fqdn, reversed_fqdn, value)
+            for pk, fqdn, reversed_fqdn, value in updated_records.values_list(
+                "pk", "fqdn", "reversed_fqdn", "value"
             )
+        }
+        for record in changed_records:
+            record.fqdn, record.reversed_fqdn, record.value = updated_values[record.pk]
+            record.last_updated = now
+        log_object_changes(changed_records, ObjectChangeActionChoices.ACTION_UPDATE)
+
+        update_search_cache(updated_records.select_related("zone__view"))
+        ChangeFeedEntry.log_queryset(
+            updated_records, ObjectChangeActionChoices.ACTION_UPDATE
+        )
+
+        self.update_serial(save_zone_serial=False)
+
+    def refresh_records_last_updated(self):
+        # +
+        # The in-memory value may be stale if records were changed through
+        # another instance of the zone, so the saved value is fetched as well.
+        # -
+        if self.pk is None:
+            return
+
+        saved_records_last_updated = (
+            Zone.objects.filter(pk=self.pk)
+            .values_list("records_last_updated", flat=True)
+            .first()
+        )
+        if saved_records_last_updated is not None and (
+            self.records_last_updated is None
+            or saved_records_last_updated > self.records_last_updated
+        ):
+            self.records_last_updated = saved_records_last_updated
+
+    def get_auto_serial(self):
+        self.refresh_records_last_updated()
+
+        if self.records_last_updated is not None:
+            soa_serial = self.records_last_updated.timestamp()
         else:
             soa_serial = ceil(datetime.now().timestamp())
 
@@ -655,29 +843,479 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
 
         return soa_serial
 
+    @instrumented()
     def update_serial(self, save_zone_serial=True):
+        self.records_last_updated = timezone.now()
+
         if not self.soa_serial_auto:
+            Zone.objects.filter(pk=self.pk).update(
+                records_last_updated=self.records_last_updated
+            )
             return
 
         self.last_updated = datetime.now()
         self.soa_serial = ceil(datetime.now().timestamp())
 
         if save_zone_serial:
-            super().save(update_fields=["soa_serial", "last_updated"])
+            super().save(
+                update_fields=["soa_serial", "last_updated", "records_last_updated"]
+            )
             self.soa_serial_dirty = False
             self.update_soa_record()
         else:
             self.soa_serial_dirty = True
 
+    def build_record(self, **kwargs):
+        """
+        Return an unsaved record in the zone with normalized name, type and
+        FQDN.
+        """
+        record = Record(zone=self, **kwargs)
+        record.normalize_fields()
+        record.update_fqdn(zone=self)
+
+        return record
+
+    UPSERT_RECORD_FIELDS = (
+        "ttl",
+        "status",
+        "disable_ptr",
+        "description",
+        "tenant",
+    )
+
+    # +
+    # Related objects of records in an RRset are either the zone itself or
+    # have been validated by the API serializer, so validating them would
+    # only cost one query per record.
+    # -
+    RRSET_CLEAN_EXCLUDE_FIELDS = (
+        "zone",
+        "ptr_record",
+        "tenant",
+        "ipam_ip_address",
+        "rfc2317_cname_record",
+        "record_template",
+    )
+
+    @staticmethod
+    def _get_upsert_value(value):
+        if isinstance(value, models.Model):
+            return value.pk
+
+        return value
+
+    @staticmethod
+    def _check_record_permissions(user, action, records):
+        """
+        Raise PermissionDenied unless the object permissions of 'user' permit
+        'action' for all of 'records'. Nothing is checked if 'user' is None.
+        """
+        if user is None or not records:
+            return
+
+        permitted_pks = set(
+            Record.objects.restrict(user, action)
+            .filter(pk__in=[record.pk for record in records])
+            .values_list("pk", flat=True)
+        )
+        for record in records:
+            if record.pk not in permitted_pks:
+                raise PermissionDenied(
+                    _("Permission to {action} record {record} is required.").format(
+                        action=action, record=record
+                    )
+                )
+
+    def upsert_records(self, records, name=None, type=None, delete=True, user=None):
+        """
+        Reconcile the unmanaged records in the zone with a desired set of
+        records. 'records' is a list of dictionaries with the keys 'name',
+        'type' and 'value' identifying the record, and optionally the fields in
+        UPSERT_RECORD_FIELDS. 'name' and 'type' restrict the scope of the
+        operation to records with that name and/or type.
+
+        The existing records in scope are loaded with one query and compared
+        with the desired records in memory. Missing records are created,
+        records with different field values are updated and, if 'delete' is
+        True, records not in the desired set are deleted. All changes are made
+        in a single transaction and the SOA serial of each affected zone is
+        updated once. Return the numbers of created, updated, deleted and
+        unchanged records.
+
+        If 'user' is given, all deleted, updated and created records must be
+        permitted by the user's object permissions, otherwise the transaction
+        is rolled back and PermissionDenied is raised.
+        """
+
+        def _record_key(record):
+            return (record.fqdn.lower(), record.type, record.value)
+
+        existing_records = self.records.filter(managed=False)
+        if name is not None:
+            scope_record = self.build_record(name=name, type="")
+            existing_records = existing_records.filter(fqdn__iexact=scope_record.fqdn)
+        if type is not None:
+            existing_records = existing_records.filter(type=type.upper())
+
+        result = {
+            "created": 0,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": 0,
+        }
+        updated_zones = {self.pk: self}
+
+        def _add_ptr_zone(record):
+            if record.ptr_record is not None:
+                updated_zones.setdefault(
+                    record.ptr_record.zone_id, record.ptr_record.zone
+                )
+
+        with transaction.atomic():
+            existing = {}
+            obsolete_records = []
+            for record in existing_records.select_related("ptr_record__zone"):
+                record.zone = self
+                if _record_key(record) in existing:
+                    obsolete_records.append(record)
+                else:
+                    existing[_record_key(record)] = record
+
+            new_records = []
+            changed_records = []
+            seen_keys = set()
+            for record_data in records:
+                record = self.build_record(
+                    name=record_data["name"],
+                    type=record_data["type"],
+                    value=record_data["value"],
+                )
+                record.validate_value()
+
+                if (
+                    name is not None
+                    and record.fqdn.lower() != scope_record.fqdn.lower()
+                ) or (type is not None and record.type != type.upper()):
+                    raise ValidationError(
+                        _(
+                            "Record {record} is outside the scope of the operation."
+                        ).format(record=record)
+                    )
+
+                if (key := _record_key(record)) in seen_keys:
+                    continue
+                seen_keys.add(key)
+
+                if (existing_record := existing.pop(key, None)) is None:
+                    for field in self.UPSERT_RECORD_FIELDS:
+                        if field in record_data:
+                            setattr(record, field, record_data[field])
+                    new_records.append(record)
+                    continue
+
+                changed = False
+                for field in self.UPSERT_RECORD_FIELDS:
+                    if field in record_data and existing_record.serializable_value(
+                        field
+                    ) != self._get_upsert_value(record_data[field]):
+                        setattr(existing_record, field, record_data[field])
+                        changed = True
+
+                if changed:
+                    changed_records.append(existing_record)
+                else:
+                    result["unchanged"] += 1
+
+            if delete:
+                obsolete_records += existing.values()
+            else:
+                result["unchanged"] += len(existing) + len(obsolete_records)
+                obsolete_records = []
+
+            self._check_record_permissions(user, "delete", obsolete_records)
+            self._check_record_permissions(user, "change", changed_records)
+
+            for record in obsolete_records:
+                _add_ptr_zone(record)
+                record.delete(save_zone_serial=False)
+                result["deleted"] += 1
+
+            for record in changed_records:
+                _add_ptr_zone(record)
+                record.save(save_zone_serial=False)
+                _add_ptr_zone(record)
+                result["updated"] += 1
+
+            for record in new_records:
+                record.save(save_zone_serial=False)
+                _add_ptr_zone(record)
+                result["created"] += 1
+
+            # +
+            # Constraints of object permissions can depend on the new field
+            # values, so the written records are checked again.
+            # -
+            self._check_record_permissions(user, "change", changed_records)
+            self._check_record_permissions(user, "add", new_records)
+
+            if result["created"] or result["updated"] or result["deleted"]:
+                for zone in updated_zones.values():
+                    zone.update_serial()
+
+        return result
+
+    def get_rrset(self, name, type):
+        """
+        Return the records of the RRset with the given name and type.
+        """
+        rrset_record = self.build_record(name=name, type=type)
+
+        return self.records.filter(
+            fqdn__iexact=rrset_record.fqdn, type=rrset_record.type
+        )
+
+    def _write_rrset(self, obsolete_records, changed_records, new_records):
+        """
+        Delete, update and create records of a single RRset that has already
+        been validated as a whole. Return the zones whose SOA serial needs to
+        be updated.
+
+        The records are written with bulk operations, followed by the change
+        log, change feed and search cache entries for all of them. Changed
+        records must have been snapshotted before they were modified. Bulk
+        operations do not send signals, so event rules are not triggered.
+        """
+        updated_zones = {self.pk: self}
+
+        def _add_ptr_zone(record):
+            if record.ptr_record is not None:
+                updated_zones.setdefault(
+                    record.ptr_record.zone_id, record.ptr_record.zone
+                )
+
+        # +
+        # Address and PTR records maintain PTR and RFC2317 CNAME records in
+        # other zones when they are saved or deleted, so RRsets containing
+        # them are still written record by record.
+        # -
+        if any(
+            record.is_address_record or record.is_ptr_record
+            for record in obsolete_records + changed_records + new_records
+        ):
+            for record in obsolete_records:
+                _add_ptr_zone(record)
+                record.delete(save_zone_serial=False)
+
+            for record in changed_records + new_records:
+                _add_ptr_zone(record)
+                record.save(save_zone_serial=False)
+                _add_ptr_zone(record)
+
+            return updated_zones
+
+        if obsolete_records:
+            for record in obsolete_records:
+                record.snapshot()
+
+            log_object_changes(
+                obsolete_records, ObjectChangeActionChoices.ACTION_DELETE
+            )
+            ChangeFeedEntry.log(
+                obsolete_records, ObjectChangeActionChoices.ACTION_DELETE
+            )
+
+            obsolete_pks = [record.pk for record in obsolete_records]
+            Record.raw_objects.filter(pk__in=obsolete_pks).delete()
+            delete_search_cache(Record, obsolete_pks)
+
+        now = timezone.now()
+        for record in changed_records:
+            record.last_updated = now
+        Record.objects.bulk_update(
+            changed_records,
+            fields=(*self.UPSERT_RECORD_FIELDS, "last_updated"),
+        )
+        Record.objects.bulk_create(new_records)
+        prefetch_related_objects(new_records, "tags")
+
+        log_object_changes(changed_records, ObjectChangeActionChoices.ACTION_UPDATE)
+        log_object_changes(new_records, ObjectChangeActionChoices.ACTION_CREATE)
+
+        ChangeFeedEntry.log(changed_records, ObjectChangeActionChoices.ACTION_UPDATE)
+        ChangeFeedEntry.log(new_records, ObjectChangeActionChoices.ACTION_CREATE)
+
+        update_search_cache(
+            Record.objects.filter(
+                pk__in=[record.pk for record in changed_records + new_records]
+            ).select_related("zone__view")
+        )
+
+        return updated_zones
+
+    def replace_rrset(self, name, type, records, ttl=None, user=None):
+        """
+        Replace the RRset with the given name and type by a new set of records.
+        'records' is a list of dictionaries with the key 'value' and optionally
+        the other fields in UPSERT_RECORD_FIELDS except 'ttl', which is set for
+        the whole RRset.
+
+        The RRset is validated as a whole against the other records with the
+        same name, which are loaded with one query. Records with a value that
+        is already in the RRset are kept and updated if necessary. The SOA
+        serial of each affected zone is updated once. The validated RRset is
+        written in bulk by '_write_rrset()'. Return the numbers of created,
+        updated, deleted and unchanged records.
+
+        If 'user' is given, all deleted, updated and created records must be
+        permitted by the user's object permissions, otherwise the transaction
+        is rolled back and PermissionDenied is raised.
+        """
+        rrset_record = self.build_record(name=name, type=type)
+
+        result = {
+            "created": 0,
+            "updated": 0,
+            "deleted": 0,
+            "unchanged": 0,
+        }
+
+        with transaction.atomic():
+            owner_records = list(
+                self.records.filter(fqdn__iexact=rrset_record.fqdn)
+                .select_related("ptr_record__zone")
+                .prefetch_related("tags")
+            )
+            for record in owner_records:
+                record.zone = self
+
+            if any(
+                record.managed
+                for record in owner_records
+                if record.type == rrset_record.type
+            ):
+                raise ValidationError(
+                    _("The RRset contains managed records and cannot be changed.")
+                )
+
+            existing = {}
+            obsolete_records = []
+            validated_records = []
+            for record in owner_records:
+                if record.type != rrset_record.type:
+                    validated_records.append(record)
+                elif record.value in existing:
+                    obsolete_records.append(record)
+                else:
+                    existing[record.value] = record
+
+            new_records = []
+            changed_records = []
+            seen_values = set()
+            for record_data in records:
+                new_record = self.build_record(
+                    name=rrset_record.name,
+                    type=rrset_record.type,
+                    value=record_data["value"],
+                )
+                new_record.validate_value()
+
+                if (value := new_record.value) in seen_values:
+                    continue
+                seen_values.add(value)
+
+                record_data = {
+                    field: field_value
+                    for field, field_value in record_data.items()
+                    if field in self.UPSERT_RECORD_FIELDS
+                } | {"ttl": ttl}
+
+                if (record := existing.pop(value, None)) is None:
+                    record = new_record
+                    for field, field_value in record_data.items():
+                        setattr(record, field, field_value)
+                    new_records.append(record)
+                elif any(
+                    record.serializable_value(field)
+                    != self._get_upsert_value(field_value)
+                    for field, field_value in record_data.items()
+                ):
+                    record.snapshot()
+                    for field, field_value in record_data.items():
+                        setattr(record, field, field_value)
+                    changed_records.append(record)
+                else:
+                    result["unchanged"] += 1
+
+                record.clean_fields(exclude=self.RRSET_CLEAN_EXCLUDE_FIELDS)
+                record.check_record_set(validated_records, zone=self)
+                validated_records.append(record)
+
+            obsolete_records += existing.values()
+
+            self._check_record_permissions(user, "delete", obsolete_records)
+            self._check_record_permissions(user, "change", changed_records)
+
+            updated_zones = self._write_rrset(
+                obsolete_records, changed_records, new_records
+            )
+
+            self._check_record_permissions(user, "change", changed_records)
+            self._check_record_permissions(user, "add", new_records)
+
+            result["created"] = len(new_records)
+            result["updated"] = len(changed_records)
+            result["deleted"] = len(obsolete_records)
+
+            if new_records or changed_records or obsolete_records:
+                for zone in updated_zones.values():
+                    zone.update_serial()
+
+        return result
+
+    def delete_rrset(self, name, type, user=None):
+        """
+        Delete all records of the RRset with the given name and type and update
+        the SOA serial of each affected zone once. Return the number of deleted
+        records.
+
+        If 'user' is given, all records must be permitted for deletion by the
+        user's object permissions, otherwise PermissionDenied is raised.
+        """
+        with transaction.atomic():
+            records = list(
+                self.get_rrset(name, type)
+                .select_related("ptr_record__zone")
+                .prefetch_related("tags")
+            )
+            if any(record.managed for record in records):
+                raise ValidationError(
+                    _("The RRset contains managed records and cannot be deleted.")
+                )
+
+            for record in records:
+                record.zone = self
+
+            self._check_record_permissions(user, "delete", records)
+
+            if records:
+                for zone in self._write_rrset(records, [], []).values():
+                    zone.update_serial()
+
+        return len(records)
+
     def save_soa_serial(self):
         if self.soa_serial_auto and self.soa_serial_dirty:
-            super().save(update_fields=["soa_serial", "last_updated"])
+            super().save(
+                update_fields=["soa_serial", "last_updated", "records_last_updated"]
+            )
             self.soa_serial_dirty = False
 
     @property
     def network_from_name(self):
         return arpa_to_prefix(self.name)
 
+    @instrumented()
     def update_rfc2317_parent_zone(self):
         if not self.is_rfc2317_zone:
             return
@@ -771,6 +1409,7 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
 
         try:
             self.name = normalize_name(self.name)
+            self.reversed_name = reverse_name_labels(self.name)
         except NameFormatError as exc:
             raise ValidationError(
                 {
@@ -838,6 +1477,9 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
             old_name = self.get_saved_value("name")
             old_view_id = self.get_saved_value("view_id")
 
+            if old_name != self.name:
+                self.check_record_fqdns()
+
             if (
                 not self.ip_addresses_checked
                 and old_name != self.name
@@ -907,169 +1549,110 @@ class Zone(ObjectModificationMixin, ContactsMixin, NetBoxModel):
 
         super().clean(*args, **kwargs)
 
+    @instrumented()
     def save(self, *args, **kwargs):
         self.full_clean()
 
         changed_fields = self.changed_fields
+        old_name = self.get_saved_value("name")
 
         if self.soa_serial_auto:
             self.soa_serial = self.get_auto_serial()
+        else:
+            self.refresh_records_last_updated()
 
         super().save(*args, **kwargs)
 
+        if changed_fields is not None and "name" in changed_fields:
+            self.update_record_fqdns(old_name)
+
         if (
             changed_fields is None or {"name", "view", "status"} & changed_fields
         ) and self.is_reverse_zone:
-            zones = self.view.zones.filter(
-                arpa_network__net_contains_or_equals=self.arpa_network
-            )
-            address_records = Record.objects.filter(
-                Q(ptr_record__isnull=True) | Q(ptr_record__zone__in=zones),
-                type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA),
-                disable_ptr=False,
-            )
-
-            for address_record in address_records:
-                address_record.save(
-                    update_fields=["ptr_record"], save_zone_serial=False
+            with instrument("Zone.save.reverse_zone"):
+                zones = self.view.zones.filter(
+                    arpa_network__net_contains_or_equals=self.arpa_network
+                )
+                address_records = Record.objects.filter(
+                    Q(ptr_record__isnull=True) | Q(ptr_record__zone__in=zones),
+                    type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA),
+                    disable_ptr=False,
                 )
 
-            for zone in zones:
-                zone.save_soa_serial()
+                for address_record in address_records:
+                    address_record.save(
+                        update_fields=["ptr_record"], save_zone_serial=False
+                    )
 
-            if self.arpa_network.version == 4:
-                rfc2317_child_zones = Zone.objects.filter(
-                    rfc2317_prefix__net_contained=self.arpa_network,
-                    rfc2317_parent_managed=True,
-                )
-                for child_zone in rfc2317_child_zones:
-                    child_zone.update_rfc2317_parent_zone()
+                for zone in zones:
+                    zone.save_soa_serial()
+
+                if self.arpa_network.version == 4:
+                    rfc2317_child_zones = Zone.objects.filter(
+                        rfc2317_prefix__net_contained=self.arpa_network,
+                        rfc2317_parent_managed=True,
+                    )
+                    for child_zone in rfc2317_child_zones:
+                        child_zone.update_rfc2317_parent_zone()
 
         if (
             changed_fields is None
             or {"name", "view", "status", "rfc2317_prefix", "rfc2317_parent_managed"}
             & changed_fields
         ) and self.is_rfc2317_zone:
-            zones = self.view.zones.filter(
-                arpa_network__net_contains=self.rfc2317_prefix
-            )
-            address_records = Record.objects.filter(
-                Q(ptr_record__isnull=True)
-                | Q(ptr_record__zone__in=zones)
-                | Q(ptr_record__zone=self),
-                type=RecordTypeChoices.A,
-                disable_ptr=False,
-            )
-
-            for address_record in address_records:
-                address_record.save(
-                    update_fields=["ptr_record"],
-                    update_rfc2317_cname=False,
-                    save_zone_serial=False,
+            with instrument("Zone.save.rfc2317_zone"):
+                zones = self.view.zones.filter(
+                    arpa_network__net_contains=self.rfc2317_prefix
+                )
+                address_records = Record.objects.filter(
+                    Q(ptr_record__isnull=True)
+                    | Q(ptr_record__zone__in=zones)
+                    | Q(ptr_record__zone=self),
+                    type=RecordTypeChoices.A,
+                    disable_ptr=False,
                 )
 
-            for zone in zones:
-                zone.save_soa_serial()
+                for address_record in address_records:
+                    address_record.save(
+                        update_fields=["ptr_record"],
+                        update_rfc2317_cname=False,
+                        save_zone_serial=False,
+                    )
 
-            self.update_rfc2317_parent_zone()
+                for zone in zones:
+                    zone.save_soa_serial()
 
-        elif changed_fields is not None and {"name", "view", "status"} & changed_fields:
-            for address_record in self.records.filter(
-                type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA),
-                ipam_ip_address__isnull=True,
-            ):
-                address_record.save(update_fields=["ptr_record"])
+                self.update_rfc2317_parent_zone()
 
-        if changed_fields is not None and "name" in changed_fields:
-            for _record in self.records.filter(ipam_ip_address__isnull=True):
-                _record.save(
-                    update_fields=["fqdn"],
-                    save_zone_serial=False,
-                    update_rrset_ttl=False,
-                    update_rfc2317_cname=False,
-                )
+        elif changed_fields is not None and {"view", "status"} & changed_fields:
+            with instrument("Zone.save.address_records"):
+                for address_record in self.records.filter(
+                    type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA),
+                    ipam_ip_address__isnull=True,
+                ):
+                    address_record.save(update_fields=["ptr_record"])
 
         if changed_fields is None or {"name", "view"} & changed_fields:
-            ip_addresses = IPAddress.objects.filter(
-                netbox_dns_records__in=self.records.filter(
-                    ipam_ip_address__isnull=False
+            with instrument("Zone.save.dnssync"):
+                ip_addresses = IPAddress.objects.filter(
+                    netbox_dns_records__in=self.records.filter(
+                        ipam_ip_address__isnull=False
+                    )
                 )
-            )
-            ip_addresses |= get_ip_addresses_by_zone(self)
+                ip_addresses |= get_ip_addresses_by_zone(self)
 
-            for ip_address in ip_addresses.distinct():
-                update_dns_records(ip_address)
+                for ip_address in ip_addresses.distinct():
+                    update_dns_records(ip_address)
 
         self.save_soa_serial()
         self.update_soa_record()
 
     def delete(self, *args, **kwargs):
-        with transaction.atomic():
-            address_records = self.records.filter(
-                ptr_record__isnull=False
-            ).prefetch_related("ptr_record")
-            for address_record in address_records:
-                address_record.ptr_record.delete()
-
-            ptr_records = self.records.filter(address_record__isnull=False)
-            update_records = list(
-                Record.objects.filter(ptr_record__in=ptr_records).values_list(
-                    "pk", flat=True
-                )
-            )
-
-            cname_records = {
-                ptr_record.rfc2317_cname_record
-                for ptr_record in ptr_records
-                if ptr_record.rfc2317_cname_record is not None
-            }
-            cname_zones = {cname_record.zone for cname_record in cname_records}
-
-            for cname_record in cname_records:
-                cname_record.delete(save_zone_serial=False)
-            for cname_zone in cname_zones:
-                cname_zone.save_soa_serial()
-                cname_zone.update_soa_record()
-
-            rfc2317_child_zones = list(
-                self.rfc2317_child_zones.values_list("pk", flat=True)
-            )
-
-            ipam_ip_addresses = list(
-                IPAddress.objects.filter(
-                    netbox_dns_records__in=self.records.filter(
-                        ipam_ip_address__isnull=False
-                    )
-                )
-                .distinct()
-                .values_list("pk", flat=True)
-            )
-
-            super().delete(*args, **kwargs)
-
-        address_records = Record.objects.filter(pk__in=update_records).prefetch_related(
-            "zone"
-        )
+        deletion_plan = get_zone_deletion_plan()
+        if deletion_plan is None or self.pk not in deletion_plan.zone_pks:
+            deletion_plan = ZoneDeletionPlan([self])
 
-        for address_record in address_records:
-            address_record.save(save_zone_serial=False)
-        for address_zone in {address_record.zone for address_record in address_records}:
-            address_zone.save_soa_serial()
-            address_zone.update_soa_record()
-
-        ip_addresses = IPAddress.objects.filter(pk__in=ipam_ip_addresses)
-        for ip_address in ip_addresses:
-            update_dns_records(ip_address)
-
-        rfc2317_child_zones = Zone.objects.filter(pk__in=rfc2317_child_zones)
-        if rfc2317_child_zones:
-            for child_zone in rfc2317_child_zones:
-                child_zone.update_rfc2317_parent_zone()
-
-            new_rfc2317_parent_zone = rfc2317_child_zones.first().rfc2317_parent_zone
-            if new_rfc2317_parent_zone is not None:
-                new_rfc2317_parent_zone.save_soa_serial()
-                new_rfc2317_parent_zone.update_soa_record()
+        return deletion_plan.apply()
 
 
 @receiver(m2m_changed, sender=Zone.nameservers.through)
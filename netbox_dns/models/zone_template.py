@@ -1,16 +1,30 @@
+from functools import reduce
+from operator import or_
+
 from dns import name as dns_name
 from dns.exception import DNSException
 
-from django.db import models
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef, Q
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.core.exceptions import ValidationError
 
+from core.choices import ObjectChangeActionChoices
+from extras.models import TaggedItem
 from netbox.models import NetBoxModel
 from netbox.search import SearchIndex, register_search
 
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import update_search_cache, log_object_changes
 from netbox_dns.validators import validate_rname
 
+from .record import Record
+from .zone import Zone
+from .change_feed import ChangeFeedEntry
+from .record_template import RecordTemplate
+
 
 __all__ = (
     "ZoneTemplate",
@@ -172,6 +186,383 @@ class ZoneTemplate(NetBoxModel):
         for record_template in self.record_templates.all():
             record_template.create_record(zone=zone)
 
+        if zone.zone_template_id != self.pk:
+            Zone.objects.filter(pk=zone.pk).update(zone_template=self)
+            zone.zone_template = self
+
+    def validate_records(self, zone, records=None):
+        """
+        Validate the records the template creates in 'zone' without saving
+        them. 'records' contains the records already present in the zone, which
+        may be an unsaved zone.
+        """
+        records = list(records or [])
+
+        for record_template in self.record_templates.all():
+            if (record := record_template.validate_record(zone, records)) is not None:
+                records.append(record)
+
+    def apply_to_zones(self, zones, batch_size=1000):
+        """
+        Apply the template's nameservers, tags and records to multiple existing
+        zones, as 'apply_to_zone_relations()' does for a single zone.
+
+        The existing records in all zones are loaded with a single query, and
+        missing records are validated in memory and created in bulk together
+        with their tags and change log entries. Address and PTR records are
+        saved individually so their PTR records and IP addresses are set. The
+        SOA serial of each modified zone is updated once.
+        """
+        with transaction.atomic():
+            result, updated_zone_pks = self._apply_to_zones(
+                zones, batch_size=batch_size
+            )
+
+            for zone in Zone.objects.filter(pk__in=updated_zone_pks):
+                zone.update_serial()
+
+        return result
+
+    def _apply_to_zones(self, zones, batch_size=1000):
+        zones = list(zones)
+        zone_pks = [zone.pk for zone in zones]
+
+        nameservers = list(self.nameservers.all())
+        tags = list(self.tags.all())
+        record_templates = list(self.record_templates.prefetch_related("tags"))
+
+        zone_type = ContentType.objects.get_for_model(Zone)
+        record_type = ContentType.objects.get_for_model(Record)
+
+        result = {
+            "zones": len(zones),
+            "nameservers": 0,
+            "tags": 0,
+            "records": 0,
+        }
+
+        names = {record_template.record_name for record_template in record_templates}
+        if nameservers:
+            names.add("@")
+
+        zone_records = {zone.pk: [] for zone in zones}
+        if names:
+            for record in Record.raw_objects.filter(zone_id__in=zone_pks).filter(
+                reduce(or_, (Q(name__iexact=name) for name in names))
+            ):
+                zone_records[record.zone_id].append(record)
+
+        zones_with_nameservers = set(
+            Zone.nameservers.through.objects.filter(zone_id__in=zone_pks).values_list(
+                "zone_id", flat=True
+            )
+        )
+        zones_with_tags = set(
+            TaggedItem.objects.filter(
+                content_type=zone_type, object_id__in=zone_pks
+            ).values_list("object_id", flat=True)
+        )
+
+        zone_nameservers = []
+        zone_tags = []
+        new_records = []
+        saved_records = []
+        updated_zone_pks = set()
+        changed_zone_pks = {
+            zone.pk for zone in zones if zone.zone_template_id != self.pk
+        }
+
+        for zone in zones:
+            records = zone_records[zone.pk]
+
+            if nameservers and zone.pk not in zones_with_nameservers:
+                for nameserver in nameservers:
+                    zone_nameservers.append(
+                        Zone.nameservers.through(
+                            zone_id=zone.pk, nameserver_id=nameserver.pk
+                        )
+                    )
+
+                    ns_value = f"{nameserver.name}."
+                    if not any(
+                        record.name == "@"
+                        and record.type == RecordTypeChoices.NS
+                        and record.value == ns_value
+                        for record in records
+                    ):
+                        ns_record = Record(
+                            zone=zone,
+                            name="@",
+                            type=RecordTypeChoices.NS,
+                            value=ns_value,
+                            ttl=None,
+                            managed=True,
+                        )
+                        ns_record.update_fqdn()
+                        records.append(ns_record)
+                        new_records.append((ns_record, None))
+
+                result["nameservers"] += 1
+                updated_zone_pks.add(zone.pk)
+                changed_zone_pks.add(zone.pk)
+
+            if tags and zone.pk not in zones_with_tags:
+                for tag in tags:
+                    zone_tags.append(
+                        TaggedItem(content_type=zone_type, object_id=zone.pk, tag=tag)
+                    )
+
+                result["tags"] += 1
+                changed_zone_pks.add(zone.pk)
+
+            for record_template in record_templates:
+                record = record_template.validate_record(zone, records)
+                if record is None:
+                    continue
+
+                records.append(record)
+                if record.is_address_record or record.is_ptr_record:
+                    saved_records.append((record, record_template))
+                else:
+                    new_records.append((record, record_template))
+
+                result["records"] += 1
+                updated_zone_pks.add(zone.pk)
+
+        with transaction.atomic():
+            # +
+            # The template, nameservers and tags of the zones are changed in
+            # bulk, which does not send the signals NetBox creates change log
+            # entries from, so the changed zones are snapshotted here and
+            # logged after all changes have been written.
+            # -
+            prechange_zones = list(
+                Zone.objects.filter(pk__in=changed_zone_pks).prefetch_related(
+                    "nameservers", "tags"
+                )
+            )
+            for zone in prechange_zones:
+                zone.snapshot()
+
+            Zone.objects.filter(pk__in=zone_pks).exclude(zone_template=self).update(
+                zone_template=self
+            )
+
+            for record_template in record_templates:
+                Record.raw_objects.filter(
+                    zone_id__in=zone_pks,
+                    name=record_template.record_name,
+                    type=record_template.type,
+                    value=record_template.value,
+                    record_template__isnull=True,
+                ).update(record_template=record_template)
+
+            Zone.nameservers.through.objects.bulk_create(
+                zone_nameservers, batch_size=batch_size
+            )
+            Record.objects.bulk_create(
+                [record for record, _template in new_records], batch_size=batch_size
+            )
+            ChangeFeedEntry.log(
+                [record for record, _template in new_records],
+                ObjectChangeActionChoices.ACTION_CREATE,
+            )
+
+            for record, _template in saved_records:
+                record.save(save_zone_serial=False)
+                if record.ptr_record is not None:
+                    updated_zone_pks.add(record.ptr_record.zone_id)
+                if record.rfc2317_cname_record is not None:
+                    updated_zone_pks.add(record.rfc2317_cname_record.zone_id)
+
+            for record, record_template in new_records + saved_records:
+                if record_template is None:
+                    continue
+
+                for tag in record_template.tags.all():
+                    zone_tags.append(
+                        TaggedItem(
+                            content_type=record_type, object_id=record.pk, tag=tag
+                        )
+                    )
+
+            TaggedItem.objects.bulk_create(zone_tags, batch_size=batch_size)
+
+            log_object_changes(
+                [record for record, _template in new_records],
+                ObjectChangeActionChoices.ACTION_CREATE,
+            )
+
+            changed_zones = Zone.objects.prefetch_related(
+                "nameservers", "tags"
+            ).in_bulk(changed_zone_pks)
+            for zone in prechange_zones:
+                changed_zones[zone.pk]._prechange_snapshot = zone._prechange_snapshot
+            log_object_changes(
+                changed_zones.values(), ObjectChangeActionChoices.ACTION_UPDATE
+            )
+
+            update_search_cache(
+                Record.objects.filter(
+                    pk__in=[record.pk for record, _template in new_records]
+                ).select_related("zone__view"),
+                batch_size=batch_size,
+            )
+
+        return result, updated_zone_pks
+
+    def _get_drift_zones(self, zones=None):
+        if zones is None:
+            return self.zones.all()
+
+        return self.zones.filter(pk__in=[zone.pk for zone in zones])
+
+    def get_drift(self, zones=None):
+        """
+        Compare the records in the zones the template was applied to with the
+        template's record templates. 'zones' restricts the comparison to some
+        of these zones.
+
+        The result maps the primary keys of zones that have drifted to the
+        primary keys of record templates with no record in the zone
+        ('missing'), of records created from record templates not belonging
+        to the template ('extra'), and of records whose fields no longer match
+        their record template ('divergent').
+
+        The comparison is done in the database with one query for each of
+        'missing', 'extra' and 'divergent'.
+        """
+        zone_pks = self._get_drift_zones(zones).values("pk")
+        record_template_pks = self.record_templates.values("pk")
+
+        drift = {}
+
+        def _zone_drift(zone_pk):
+            return drift.setdefault(
+                zone_pk, {"missing": [], "extra": [], "divergent": []}
+            )
+
+        for zone_pk, record_template_pk in (
+            Zone.objects.filter(pk__in=zone_pks)
+            .annotate(record_template_pk=F("zone_template__record_templates"))
+            .filter(record_template_pk__isnull=False)
+            .exclude(
+                Exists(
+                    Record.raw_objects.filter(
+                        zone_id=OuterRef("pk"),
+                        record_template_id=OuterRef("record_template_pk"),
+                    )
+                )
+            )
+            .order_by("pk", "record_template_pk")
+            .values_list("pk", "record_template_pk")
+        ):
+            _zone_drift(zone_pk)["missing"].append(record_template_pk)
+
+        for zone_pk, record_pk in (
+            Record.raw_objects.filter(
+                zone_id__in=zone_pks, record_template__isnull=False
+            )
+            .exclude(record_template_id__in=record_template_pks)
+            .values_list("zone_id", "pk")
+        ):
+            _zone_drift(zone_pk)["extra"].append(record_pk)
+
+        divergent = reduce(
+            or_,
+            (
+                _is_distinct_from(field, f"record_template__{template_field}")
+                for field, template_field in RecordTemplate.record_fields()
+            ),
+        )
+        for zone_pk, record_pk in (
+            Record.raw_objects.filter(
+                zone_id__in=zone_pks, record_template_id__in=record_template_pks
+            )
+            .filter(divergent)
+            .values_list("zone_id", "pk")
+        ):
+            _zone_drift(zone_pk)["divergent"].append(record_pk)
+
+        return drift
+
+    def sync_zones(self, zones=None, batch_size=1000):
+        """
+        Bring the records in the zones the template was applied to back in line
+        with the template, based on the result of 'get_drift()': Divergent
+        records are updated and missing records are created.
+
+        Extra records are not deleted, as they may have been created by
+        another zone template that was applied to the zone before.
+
+        Records are processed in batches of 'batch_size', each in its own
+        transaction, and the SOA serial of each modified zone is updated once
+        at the end.
+        """
+        drift = self.get_drift(zones)
+
+        result = {
+            "zones": len(drift),
+            "updated": 0,
+            "created": 0,
+        }
+        if not drift:
+            return result
+
+        record_templates = {
+            record_template.pk: record_template
+            for record_template in self.record_templates.all()
+        }
+        updated_zone_pks = set()
+
+        divergent_pks = [pk for zone in drift.values() for pk in zone["divergent"]]
+        for offset in range(0, len(divergent_pks), batch_size):
+            with transaction.atomic():
+                for record in Record.objects.filter(
+                    pk__in=divergent_pks[offset : offset + batch_size]
+                ).select_related("zone", "ptr_record"):
+                    if record.ptr_record is not None:
+                        updated_zone_pks.add(record.ptr_record.zone_id)
+
+                    record_templates[record.record_template_id].apply_to_record(record)
+                    try:
+                        record.save(save_zone_serial=False)
+                    except ValidationError as exc:
+                        raise ValidationError(
+                            {
+                                None: _(
+                                    "Error while processing record template {template}: {error}"
+                                ).format(
+                                    template=record_templates[
+                                        record.record_template_id
+                                    ],
+                                    error=exc.messages[0],
+                                )
+                            }
+                        )
+
+                    if record.ptr_record is not None:
+                        updated_zone_pks.add(record.ptr_record.zone_id)
+                    updated_zone_pks.add(record.zone_id)
+                    result["updated"] += 1
+
+        missing_zone_pks = [pk for pk, zone in drift.items() if zone["missing"]]
+        for offset in range(0, len(missing_zone_pks), batch_size):
+            with transaction.atomic():
+                apply_result, apply_zone_pks = self._apply_to_zones(
+                    Zone.objects.filter(
+                        pk__in=missing_zone_pks[offset : offset + batch_size]
+                    ),
+                    batch_size=batch_size,
+                )
+                updated_zone_pks |= apply_zone_pks
+                result["created"] += apply_result["records"]
+
+        for zone in Zone.objects.filter(pk__in=updated_zone_pks):
+            zone.update_serial()
+
+        return result
+
     def clean(self, *args, **kwargs):
         if self.soa_rname:
             try:
@@ -185,6 +576,17 @@ class ZoneTemplate(NetBoxModel):
                 )
 
 
+def _is_distinct_from(field, other_field):
+    return (
+        Q(**{f"{field}__isnull": True, f"{other_field}__isnull": False})
+        | Q(**{f"{field}__isnull": False, f"{other_field}__isnull": True})
+        | (
+            Q(**{f"{field}__isnull": False, f"{other_field}__isnull": False})
+            & ~Q(**{field: F(other_field)})
+        )
+    )
+
+
 @register_search
 class ZoneTemplateIndex(SearchIndex):
     model = ZoneTemplate
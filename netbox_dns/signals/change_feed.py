@@ -0,0 +1,31 @@
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+
+from core.choices import ObjectChangeActionChoices
+
+from netbox_dns.models import ChangeFeedEntry, Record, Zone
+from netbox_dns.utilities import instrumented, ORIGIN_SIGNAL
+
+
+@receiver(post_save, sender=Zone)
+@receiver(post_save, sender=Record)
+@instrumented(origin=ORIGIN_SIGNAL)
+def change_feed_post_save(instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    ChangeFeedEntry.log(
+        (instance,),
+        (
+            ObjectChangeActionChoices.ACTION_CREATE
+            if created
+            else ObjectChangeActionChoices.ACTION_UPDATE
+        ),
+    )
+
+
+@receiver(post_delete, sender=Zone)
+@receiver(post_delete, sender=Record)
+@instrumented(origin=ORIGIN_SIGNAL)
+def change_feed_post_delete(instance, **kwargs):
+    ChangeFeedEntry.log((instance,), ObjectChangeActionChoices.ACTION_DELETE)
@@ -6,11 +6,13 @@ from netbox.context import current_request
 from utilities.exceptions import AbortRequest
 
 from netbox_dns.validators import validate_key_template_assignment
+from netbox_dns.utilities import instrumented, ORIGIN_SIGNAL
 
 from netbox_dns.models import DNSSECPolicy, DNSSECKeyTemplate
 
 
 @receiver(m2m_changed, sender=DNSSECPolicy.key_templates.through)
+@instrumented(origin=ORIGIN_SIGNAL)
 def dnssec_policy_key_templates_changed(action, instance, pk_set, **kwargs):
     request = current_request.get()
 
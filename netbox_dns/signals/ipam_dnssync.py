@@ -12,6 +12,8 @@ from ipam.models import IPAddress, Prefix
 from utilities.exceptions import AbortRequest
 
 from netbox_dns.utilities import (
+    instrumented,
+    ORIGIN_SIGNAL,
     check_dns_records,
     check_record_permission,
     update_dns_records,
@@ -33,6 +35,7 @@ ENFORCE_UNIQUE_RECORDS = settings.PLUGINS_CONFIG["netbox_dns"]["enforce_unique_r
 
 
 @receiver(post_clean, sender=IPAddress)
+@instrumented(origin=ORIGIN_SIGNAL)
 def ipam_dnssync_ipaddress_post_clean(instance, **kwargs):
     if not instance.dns_name:
         return
@@ -109,21 +112,25 @@ def ipam_dnssync_ipaddress_post_clean(instance, **kwargs):
 
 
 @receiver(pre_delete, sender=IPAddress)
+@instrumented(origin=ORIGIN_SIGNAL)
 def ipam_dnssync_ipaddress_pre_delete(instance, **kwargs):
     delete_dns_records(instance)
 
 
 @receiver(pre_save, sender=IPAddress)
+@instrumented(origin=ORIGIN_SIGNAL)
 def ipam_dnssync_ipaddress_pre_save(instance, **kwargs):
     check_dns_records(instance)
 
 
 @receiver(post_save, sender=IPAddress)
+@instrumented(origin=ORIGIN_SIGNAL)
 def ipam_dnssync_ipaddress_post_save(instance, **kwargs):
     update_dns_records(instance)
 
 
 @receiver(pre_save, sender=Prefix)
+@instrumented(origin=ORIGIN_SIGNAL)
 def ipam_dnssync_prefix_pre_save(instance, **kwargs):
     """
     Changes that modify the prefix hierarchy cannot be validated properly before
@@ -157,6 +164,7 @@ def ipam_dnssync_prefix_pre_save(instance, **kwargs):
 
 
 @receiver(pre_delete, sender=Prefix)
+@instrumented(origin=ORIGIN_SIGNAL)
 def ipam_dnssync_prefix_pre_delete(instance, **kwargs):
     parent = instance.get_parents().last()
     request = current_request.get()
@@ -203,6 +211,7 @@ def ipam_dnssync_prefix_pre_delete(instance, **kwargs):
 
 
 @receiver(m2m_changed, sender=Prefix.netbox_dns_views.through)
+@instrumented(origin=ORIGIN_SIGNAL)
 def ipam_dnssync_view_prefix_changed(**kwargs):
     action = kwargs.get("action")
 
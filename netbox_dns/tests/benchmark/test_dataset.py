@@ -0,0 +1,114 @@
+import json
+from io import StringIO
+
+from django.core import management
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from netbox_dns.models import View, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import generate_dataset, delete_dataset
+
+
+class DatasetTestCase(TestCase):
+    dataset = {
+        "name": "test",
+        "views": 2,
+        "zones": 2,
+        "records": 10,
+        "rfc2317_zones": 1,
+    }
+
+    def get_records(self):
+        return list(
+            Record.objects.filter(zone__view__name__startswith="test-")
+            .exclude(type=RecordTypeChoices.SOA)
+            .order_by("zone__view__name", "zone__name", "name", "type", "value")
+            .values_list("zone__view__name", "zone__name", "name", "type", "value")
+        )
+
+    def test_generate_dataset(self):
+        result = generate_dataset(**self.dataset)
+
+        self.assertEqual(result["views"], 2)
+        self.assertEqual(result["zones"], 8)
+        self.assertGreaterEqual(result["records"], 40)
+        self.assertEqual(Zone.objects.filter(view__name__startswith="test-").count(), 8)
+        self.assertTrue(
+            Record.objects.filter(
+                zone__view__name="test-0", type=RecordTypeChoices.PTR
+            ).exists()
+        )
+
+    def test_generate_dataset_reproducible(self):
+        generate_dataset(**self.dataset)
+        records = self.get_records()
+
+        delete_dataset("test")
+        self.assertEqual(self.get_records(), [])
+
+        generate_dataset(**self.dataset)
+        self.assertEqual(self.get_records(), records)
+
+    def test_generate_dataset_network(self):
+        generate_dataset(**self.dataset, network=5)
+
+        self.assertTrue(
+            Zone.objects.filter(view__name="test-1", name="6.10.in-addr.arpa").exists()
+        )
+        self.assertTrue(
+            Record.objects.filter(
+                zone__view__name="test-0",
+                type=RecordTypeChoices.A,
+                value__startswith="10.5.0.",
+            ).exists()
+        )
+
+        with self.assertRaises(ValidationError):
+            generate_dataset(**(self.dataset | {"name": "other"}), network=255)
+
+    def test_generate_existing_dataset(self):
+        generate_dataset(**self.dataset)
+
+        with self.assertRaises(ValidationError):
+            generate_dataset(**self.dataset)
+
+    def test_delete_dataset(self):
+        generate_dataset(**self.dataset)
+
+        self.assertEqual(delete_dataset("test"), 2)
+        self.assertFalse(View.objects.filter(name__startswith="test-").exists())
+        self.assertEqual(delete_dataset("test"), 0)
+
+    def test_benchmark_command(self):
+        management.call_command(
+            "generate_dns_dataset",
+            name="test",
+            zones=2,
+            records=10,
+            verbosity=0,
+            stdout=StringIO(),
+        )
+        records = self.get_records()
+
+        output = StringIO()
+        management.call_command(
+            "benchmark_dns",
+            name="test",
+            iterations=2,
+            benchmark=["record_update", "zone_rename", "bulk_import"],
+            import_size=10,
+            stdout=output,
+        )
+        results = json.loads(output.getvalue())
+
+        self.assertEqual(results["dataset"]["views"], 1)
+        self.assertEqual(
+            set(results["benchmarks"]), {"record_update", "zone_rename", "bulk_import"}
+        )
+        for result in results["benchmarks"].values():
+            self.assertEqual(result["iterations"], 2)
+            self.assertEqual(len(result["queries"]), 2)
+            self.assertGreater(min(result["queries"]), 0)
+
+        self.assertEqual(self.get_records(), records)
@@ -0,0 +1,271 @@
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectType
+from users.models import ObjectPermission
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import ChangeFeedEntry, Zone, NameServer, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+def change_feed_settings():
+    return {
+        "netbox_dns": settings.PLUGINS_CONFIG["netbox_dns"]
+        | {"change_feed_enabled": True}
+    }
+
+
+class ChangeFeedTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zone = Zone.objects.create(name="zone1.example.com", **zone_data)
+        cls.reverse_zone = Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data)
+
+    def get_entries(self, cursor, **kwargs):
+        return list(
+            ChangeFeedEntry.objects.filter(pk__gt=cursor, **kwargs).values_list(
+                "action", "object_type", "zone_id"
+            )
+        )
+
+    def get_cursor(self):
+        return (
+            ChangeFeedEntry.objects.order_by("-pk").values_list("pk", flat=True).first()
+            or 0
+        )
+
+    def test_change_feed_disabled(self):
+        Record.objects.create(
+            zone=self.zone, name="name1", type=RecordTypeChoices.TXT, value="text"
+        )
+
+        self.assertFalse(ChangeFeedEntry.objects.exists())
+
+    def test_record_changes(self):
+        with self.settings(PLUGINS_CONFIG=change_feed_settings()):
+            cursor = self.get_cursor()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                record = Record.objects.create(
+                    zone=self.zone,
+                    name="name1",
+                    type=RecordTypeChoices.A,
+                    value="10.0.0.1",
+                )
+            ptr_record = record.ptr_record
+
+            record_entries = self.get_entries(cursor, object_type="record")
+            self.assertIn(
+                (ObjectChangeActionChoices.ACTION_CREATE, "record", self.zone.pk),
+                record_entries,
+            )
+            self.assertIn(
+                (
+                    ObjectChangeActionChoices.ACTION_CREATE,
+                    "record",
+                    self.reverse_zone.pk,
+                ),
+                record_entries,
+            )
+            self.assertIn(
+                (ObjectChangeActionChoices.ACTION_UPDATE, "zone", self.zone.pk),
+                self.get_entries(cursor, object_type="zone"),
+            )
+
+            cursor = self.get_cursor()
+            with self.captureOnCommitCallbacks(execute=True):
+                record.delete()
+
+            self.assertTrue(
+                ChangeFeedEntry.objects.filter(
+                    pk__gt=cursor,
+                    action=ObjectChangeActionChoices.ACTION_DELETE,
+                    object_type="record",
+                    object_id=ptr_record.pk,
+                ).exists()
+            )
+            entry = ChangeFeedEntry.objects.get(
+                pk__gt=cursor,
+                action=ObjectChangeActionChoices.ACTION_DELETE,
+                object_id=record.pk,
+            )
+            self.assertEqual(entry.data["fqdn"], "name1.zone1.example.com.")
+            self.assertEqual(entry.data["value"], "10.0.0.1")
+
+    def test_bulk_changes(self):
+        with self.settings(PLUGINS_CONFIG=change_feed_settings()):
+            cursor = self.get_cursor()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.zone.replace_rrset(
+                    "name2",
+                    RecordTypeChoices.TXT,
+                    [{"value": "text 1"}, {"value": "text 2"}],
+                )
+
+            entries = ChangeFeedEntry.objects.filter(
+                pk__gt=cursor,
+                object_type="record",
+                action=ObjectChangeActionChoices.ACTION_CREATE,
+            )
+            self.assertEqual(
+                {entry.data["value"] for entry in entries}, {"text 1", "text 2"}
+            )
+
+    def test_entries_written_on_commit(self):
+        with self.settings(PLUGINS_CONFIG=change_feed_settings()):
+            cursor = self.get_cursor()
+
+            with self.captureOnCommitCallbacks() as callbacks:
+                Record.objects.create(
+                    zone=self.zone,
+                    name="name1",
+                    type=RecordTypeChoices.TXT,
+                    value="text",
+                )
+                self.assertEqual(self.get_entries(cursor), [])
+
+            for callback in callbacks:
+                callback()
+
+            self.assertIn(
+                (ObjectChangeActionChoices.ACTION_CREATE, "record", self.zone.pk),
+                self.get_entries(cursor),
+            )
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class ChangeFeedAPITestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zones = (
+            Zone.objects.create(name="zone1.example.com", **zone_data),
+            Zone.objects.create(name="zone2.example.com", **zone_data),
+        )
+
+        cls.url = reverse("plugins-api:netbox_dns-api:changefeed")
+
+    def test_change_feed(self):
+        with self.settings(PLUGINS_CONFIG=change_feed_settings()):
+            response = self.client.get(f"{self.url}?timeout=0", **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            cursor = response.data["cursor"]
+
+            with self.captureOnCommitCallbacks(execute=True):
+                for zone in self.zones:
+                    Record.objects.create(
+                        zone=zone,
+                        name="name1",
+                        type=RecordTypeChoices.TXT,
+                        value="text",
+                    )
+
+            response = self.client.get(
+                f"{self.url}?cursor={cursor}&zone_id={self.zones[1].pk}&object_type=record",
+                **self.header,
+            )
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertEqual(len(response.data["changes"]), 1)
+
+            change = response.data["changes"][0]
+            self.assertEqual(change["action"], ObjectChangeActionChoices.ACTION_CREATE)
+            self.assertEqual(change["zone_id"], self.zones[1].pk)
+            self.assertEqual(change["data"]["fqdn"], "name1.zone2.example.com.")
+            self.assertEqual(response.data["cursor"], change["id"])
+
+            response = self.client.get(
+                f"{self.url}?cursor={response.data['cursor']}&zone_id={self.zones[1].pk}&object_type=record",
+                **self.header,
+            )
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertEqual(response.data["changes"], [])
+
+    def test_change_feed_constrained_permission(self):
+        self.user.user_permissions.clear()
+        permission = ObjectPermission.objects.create(
+            name="Zone 1", actions=["view"], constraints={"name": "zone1.example.com"}
+        )
+        permission.object_types.add(ObjectType.objects.get_for_model(Zone))
+        permission.users.add(self.user)
+
+        with self.settings(
+            PLUGINS_CONFIG=change_feed_settings(),
+            EXEMPT_VIEW_PERMISSIONS=["netbox_dns.record"],
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                for zone in self.zones:
+                    Record.objects.create(
+                        zone=zone,
+                        name="name1",
+                        type=RecordTypeChoices.TXT,
+                        value="text",
+                    )
+
+            response = self.client.get(self.url, **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertTrue(response.data["changes"])
+            self.assertEqual(
+                {change["zone_id"] for change in response.data["changes"]},
+                {self.zones[0].pk},
+            )
+
+    def test_change_feed_constrained_permission_deleted_zone(self):
+        self.user.user_permissions.clear()
+        permission = ObjectPermission.objects.create(
+            name="Example zones",
+            actions=["view"],
+            constraints={"name__endswith": ".example.com"},
+        )
+        permission.object_types.add(ObjectType.objects.get_for_model(Zone))
+        permission.users.add(self.user)
+
+        with self.settings(
+            PLUGINS_CONFIG=change_feed_settings(),
+            EXEMPT_VIEW_PERMISSIONS=["netbox_dns.record"],
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                zone = Zone.objects.create(
+                    name="zone3.example.com",
+                    soa_mname=self.zones[0].soa_mname,
+                    soa_rname=self.zones[0].soa_rname,
+                )
+                Record.objects.create(
+                    zone=self.zones[0],
+                    name="name1",
+                    type=RecordTypeChoices.TXT,
+                    value="text",
+                )
+                zone.delete()
+
+            # +
+            # The constraint matches all remaining zones, but the entries of
+            # the deleted zone are still not returned.
+            # -
+            response = self.client.get(self.url, **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertEqual(
+                {change["zone_id"] for change in response.data["changes"]},
+                {self.zones[0].pk},
+            )
+
+    def test_change_feed_invalid_cursor(self):
+        response = self.client.get(f"{self.url}?cursor=invalid", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
@@ -1,3 +1,5 @@
+from django.core import management
+from django.db import connection, transaction
 from django.urls import reverse
 from rest_framework import status
 
@@ -6,8 +8,16 @@ from extras.choices import CustomFieldTypeChoices
 from extras.models import CustomField
 from ipam.models import IPAddress
 
+from netbox_dns.models import View, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import generate_dataset
 
-__all__ = ("CustomFieldTargetAPIMixin",)
+
+__all__ = (
+    "CustomFieldTargetAPIMixin",
+    "QueryBudget",
+    "QueryBudgetMixin",
+)
 
 
 class CustomFieldTargetAPIMixin:
@@ -41,3 +51,148 @@ class CustomFieldTargetAPIMixin:
 
         ip_address.refresh_from_db()
         self.assertEqual(ip_address.custom_field_data[cf.name], instance.pk)
+
+
+class QueryBudget:
+    """
+    Upper bounds for the number of database queries and the number of rows
+    fetched by an operation against a dataset with N records per zone:
+
+        queries <= queries + queries_per_object * N
+        rows <= rows + rows_per_object * N
+    """
+
+    def __init__(self, queries, rows, queries_per_object=0, rows_per_object=0):
+        self.queries = queries
+        self.rows = rows
+        self.queries_per_object = queries_per_object
+        self.rows_per_object = rows_per_object
+
+    def get_max_queries(self, size):
+        return self.queries + self.queries_per_object * size
+
+    def get_max_rows(self, size):
+        return self.rows + self.rows_per_object * size
+
+
+class QueryCounter:
+    def __init__(self):
+        self.queries = 0
+        self.rows = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+
+        self.queries += 1
+        if context["cursor"].description is not None:
+            self.rows += max(context["cursor"].rowcount, 0)
+
+        return result
+
+
+class QueryBudgetDataset:
+    def __init__(self, name, size, network):
+        self.name = name
+        self.size = size
+        self.network = network
+
+        self.view = View.objects.get(name=f"{name}-0")
+        self.zone = Zone.objects.get(view=self.view, name=f"zone0.{name}.example")
+        self.reverse_zone = Zone.objects.get(
+            view=self.view, name=f"{network}.10.in-addr.arpa"
+        )
+        self.rfc2317_zone = Zone.objects.get(
+            view=self.view, rfc2317_prefix__isnull=False
+        )
+        self.nameserver = self.zone.soa_mname
+        self.record = Record.objects.filter(
+            zone=self.zone, type=RecordTypeChoices.A, managed=False
+        ).first()
+
+
+class QueryBudgetMixin:
+    """
+    Check operations against query budgets. 'create_datasets()' generates one
+    dataset with a single forward zone per size in 'dataset_sizes', and
+    'assertQueryBudget()' runs an operation against each of them. Besides the
+    absolute bounds of the budget, the growth between the smallest and the
+    largest dataset must not exceed the per-object allowance, so an operation
+    whose number of queries is linear in the size of the zone fails even if
+    it stays within the absolute bounds.
+    """
+
+    dataset_sizes = (20, 100)
+
+    query_tolerance = 5
+    row_tolerance = 25
+
+    @classmethod
+    def create_datasets(cls):
+        cls.datasets = []
+
+        management.call_command("setup_dnssync", verbosity=0)
+
+        for network, size in enumerate(cls.dataset_sizes):
+            name = f"budget{size}"
+            generate_dataset(
+                name=name,
+                zones=1,
+                records=size,
+                rfc2317_zones=1,
+                ip_addresses=size // 5,
+                network=network,
+            )
+            cls.datasets.append(QueryBudgetDataset(name, size, network))
+
+    def count_queries(self, operation, dataset):
+        counter = QueryCounter()
+
+        # +
+        # Operations run in a transaction that is rolled back afterwards, so
+        # each operation sees the same dataset.
+        # -
+        with transaction.atomic():
+            with connection.execute_wrapper(counter):
+                operation(dataset)
+            transaction.set_rollback(True)
+
+        return counter
+
+    def assertQueryBudget(self, operation, budget):
+        # +
+        # The first run fills caches that would otherwise be attributed to
+        # the smallest dataset.
+        # -
+        self.count_queries(operation, self.datasets[0])
+
+        counters = []
+        for dataset in self.datasets:
+            counter = self.count_queries(operation, dataset)
+
+            self.assertLessEqual(
+                counter.queries,
+                budget.get_max_queries(dataset.size),
+                f"Query budget exceeded for {dataset.size} records",
+            )
+            self.assertLessEqual(
+                counter.rows,
+                budget.get_max_rows(dataset.size),
+                f"Row budget exceeded for {dataset.size} records",
+            )
+            counters.append(counter)
+
+        growth = self.datasets[-1].size - self.datasets[0].size
+        self.assertLessEqual(
+            counters[-1].queries - counters[0].queries,
+            budget.queries_per_object * growth + self.query_tolerance,
+            f"Number of queries grows with the dataset size ({counters[0].queries} "
+            f"for {self.datasets[0].size}, {counters[-1].queries} for "
+            f"{self.datasets[-1].size} records)",
+        )
+        self.assertLessEqual(
+            counters[-1].rows - counters[0].rows,
+            budget.rows_per_object * growth + self.row_tolerance,
+            f"Number of rows grows with the dataset size ({counters[0].rows} "
+            f"for {self.datasets[0].size}, {counters[-1].rows} for "
+            f"{self.datasets[-1].size} records)",
+        )
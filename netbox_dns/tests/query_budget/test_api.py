@@ -0,0 +1,203 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase, QueryBudget, QueryBudgetMixin
+from netbox_dns.models import Zone
+
+
+API_BUDGET = QueryBudget(queries=40, rows=300)
+GRAPHQL_BUDGET = QueryBudget(queries=40, rows=300, rows_per_object=10)
+
+ZONE_QUERY = """
+{
+    netbox_dns_zone(id: %d) {
+        name
+        view { name }
+        nameservers { name }
+        records {
+            name
+            type
+            value
+            active
+            ptr_record { fqdn zone { name } }
+            ipam_ip_address { address }
+        }
+    }
+}
+"""
+
+VIEW_QUERY = """
+{
+    netbox_dns_view(id: %d) {
+        name
+        zones {
+            name
+            soa_mname { name }
+            rfc2317_parent_zone { name }
+            records { fqdn type value }
+        }
+    }
+}
+"""
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class APIQueryBudgetTestCase(QueryBudgetMixin, APITestCase):
+    model = Zone
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_datasets()
+
+    def get_endpoint(self, viewname, pk=None, **params):
+        def operation(dataset):
+            response = self.client.get(
+                reverse(
+                    f"plugins-api:netbox_dns-api:{viewname}",
+                    kwargs={"pk": pk(dataset)} if pk is not None else None,
+                ),
+                {
+                    key: value(dataset) if callable(value) else value
+                    for key, value in params.items()
+                },
+                **self.header,
+            )
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+
+            if response.streaming:
+                b"".join(response.streaming_content)
+
+        return operation
+
+    def post_graphql(self, query, pk):
+        def operation(dataset):
+            response = self.client.post(
+                reverse("graphql"),
+                data={"query": query % pk(dataset)},
+                format="json",
+                **self.header,
+            )
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertNotIn("errors", response.json())
+
+        return operation
+
+    def test_view_list(self):
+        self.assertQueryBudget(
+            self.get_endpoint("view-list", id=lambda d: d.view.pk), API_BUDGET
+        )
+
+    def test_view_detail(self):
+        self.assertQueryBudget(
+            self.get_endpoint("view-detail", pk=lambda d: d.view.pk), API_BUDGET
+        )
+
+    def test_zone_list(self):
+        self.assertQueryBudget(
+            self.get_endpoint("zone-list", view_id=lambda d: d.view.pk, limit=10),
+            API_BUDGET,
+        )
+
+    def test_zone_detail(self):
+        self.assertQueryBudget(
+            self.get_endpoint("zone-detail", pk=lambda d: d.zone.pk), API_BUDGET
+        )
+
+    def test_nameserver_list(self):
+        self.assertQueryBudget(
+            self.get_endpoint("nameserver-list", id=lambda d: d.nameserver.pk),
+            API_BUDGET,
+        )
+
+    def test_nameserver_detail(self):
+        self.assertQueryBudget(
+            self.get_endpoint("nameserver-detail", pk=lambda d: d.nameserver.pk),
+            API_BUDGET,
+        )
+
+    def test_record_list(self):
+        self.assertQueryBudget(
+            self.get_endpoint("record-list", view_id=lambda d: d.view.pk, limit=10),
+            API_BUDGET,
+        )
+
+    def test_record_list_cursor(self):
+        self.assertQueryBudget(
+            self.get_endpoint(
+                "record-list", view_id=lambda d: d.view.pk, limit=10, cursor=""
+            ),
+            API_BUDGET,
+        )
+
+    def test_record_detail(self):
+        self.assertQueryBudget(
+            self.get_endpoint("record-detail", pk=lambda d: d.record.pk), API_BUDGET
+        )
+
+    def test_record_flat(self):
+        self.assertQueryBudget(
+            self.get_endpoint("record-flat", view_id=lambda d: d.view.pk),
+            QueryBudget(queries=40, rows=300, rows_per_object=10),
+        )
+
+    def test_rrset(self):
+        def operation(dataset):
+            response = self.client.get(
+                reverse(
+                    "plugins-api:netbox_dns-api:rrset",
+                    kwargs={
+                        "zone_id": dataset.zone.pk,
+                        "name": dataset.record.name,
+                        "type": dataset.record.type,
+                    },
+                ),
+                **self.header,
+            )
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        self.assertQueryBudget(operation, API_BUDGET)
+
+    def test_rrset_put(self):
+        self.add_permissions(
+            "netbox_dns.change_zone",
+            "netbox_dns.add_record",
+            "netbox_dns.change_record",
+            "netbox_dns.delete_record",
+        )
+
+        def operation(dataset):
+            response = self.client.put(
+                reverse(
+                    "plugins-api:netbox_dns-api:rrset",
+                    kwargs={
+                        "zone_id": dataset.zone.pk,
+                        "name": "budget",
+                        "type": "TXT",
+                    },
+                ),
+                {
+                    "ttl": 300,
+                    "records": [
+                        {"value": f"text {index}"} for index in range(dataset.size)
+                    ],
+                },
+                format="json",
+                **self.header,
+            )
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertEqual(len(response.data["records"]), dataset.size)
+
+        self.assertQueryBudget(
+            operation, QueryBudget(queries=60, rows=300, rows_per_object=10)
+        )
+
+    def test_graphql_zone(self):
+        self.assertQueryBudget(
+            self.post_graphql(ZONE_QUERY, lambda d: d.zone.pk), GRAPHQL_BUDGET
+        )
+
+    def test_graphql_view(self):
+        self.assertQueryBudget(
+            self.post_graphql(VIEW_QUERY, lambda d: d.view.pk), GRAPHQL_BUDGET
+        )
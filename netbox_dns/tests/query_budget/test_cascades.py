@@ -0,0 +1,101 @@
+from netaddr import IPNetwork
+
+from django.test import TestCase
+
+from ipam.models import IPAddress
+
+from netbox_dns.tests.custom import QueryBudget, QueryBudgetMixin
+from netbox_dns.models import Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+class CascadeQueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_datasets()
+
+    def test_record_create_with_ptr(self):
+        def operation(dataset):
+            record = Record.objects.create(
+                zone=dataset.zone,
+                name="budget",
+                type=RecordTypeChoices.A,
+                value=f"10.{dataset.network}.1.1",
+            )
+            self.assertIsNotNone(record.ptr_record)
+
+        self.assertQueryBudget(operation, QueryBudget(queries=150, rows=300))
+
+    def test_record_update_with_ptr(self):
+        def operation(dataset):
+            record = Record.objects.get(pk=dataset.record.pk)
+            record.value = f"10.{dataset.network}.1.2"
+            record.save()
+            self.assertEqual(record.ptr_record.zone, dataset.reverse_zone)
+
+        self.assertQueryBudget(operation, QueryBudget(queries=150, rows=300))
+
+    def test_record_create_with_rfc2317_ptr(self):
+        def operation(dataset):
+            record = Record.objects.create(
+                zone=dataset.zone,
+                name="budget",
+                type=RecordTypeChoices.A,
+                value=f"10.{dataset.network}.0.63",
+            )
+            self.assertEqual(record.ptr_record.zone, dataset.rfc2317_zone)
+            self.assertIsNotNone(record.ptr_record.rfc2317_cname_record)
+
+        self.assertQueryBudget(operation, QueryBudget(queries=200, rows=400))
+
+    def test_record_delete_with_ptr(self):
+        def operation(dataset):
+            Record.objects.get(pk=dataset.record.pk).delete()
+
+        self.assertQueryBudget(operation, QueryBudget(queries=150, rows=300))
+
+    def test_zone_save(self):
+        def operation(dataset):
+            zone = Zone.objects.get(pk=dataset.zone.pk)
+            zone.description = "Budget"
+            zone.save()
+
+        self.assertQueryBudget(operation, QueryBudget(queries=60, rows=200))
+
+    def test_zone_rename(self):
+        # +
+        # Renaming a zone updates the DNS records of all IP addresses in the
+        # zone via DNSsync, which is linear in the number of IP addresses.
+        # -
+        def operation(dataset):
+            zone = Zone.objects.get(pk=dataset.zone.pk)
+            zone.name = f"renamed.{zone.name}"
+            zone.save()
+
+        self.assertQueryBudget(
+            operation,
+            QueryBudget(
+                queries=200, rows=500, queries_per_object=20, rows_per_object=20
+            ),
+        )
+
+    def test_ip_address_create_with_dnssync(self):
+        def operation(dataset):
+            ip_address = IPAddress.objects.create(
+                address=IPNetwork(f"10.{dataset.network}.129.1/16"),
+                dns_name=f"budget.{dataset.zone.name}",
+            )
+            record = Record.objects.get(ipam_ip_address=ip_address)
+            self.assertEqual(record.ptr_record.zone, dataset.reverse_zone)
+
+        self.assertQueryBudget(operation, QueryBudget(queries=200, rows=400))
+
+    def test_ip_address_update_with_dnssync(self):
+        def operation(dataset):
+            ip_address = IPAddress.objects.filter(
+                netbox_dns_records__zone=dataset.zone
+            ).first()
+            ip_address.dns_name = f"budget.{dataset.zone.name}"
+            ip_address.save()
+
+        self.assertQueryBudget(operation, QueryBudget(queries=200, rows=400))
@@ -0,0 +1,122 @@
+from django.test import override_settings
+from django.urls import reverse
+
+from netbox_dns.tests.custom import ModelViewTestCase, QueryBudget, QueryBudgetMixin
+from netbox_dns.models import Zone
+
+
+LIST_VIEW_BUDGET = QueryBudget(queries=80, rows=500)
+DETAIL_VIEW_BUDGET = QueryBudget(queries=80, rows=500)
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class ViewQueryBudgetTestCase(QueryBudgetMixin, ModelViewTestCase):
+    model = Zone
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_datasets()
+
+    def get_page(self, viewname, pk=None, **params):
+        def operation(dataset):
+            response = self.client.get(
+                reverse(
+                    f"plugins:netbox_dns:{viewname}",
+                    kwargs={"pk": pk(dataset)} if pk is not None else None,
+                ),
+                {
+                    key: value(dataset) if callable(value) else value
+                    for key, value in params.items()
+                },
+            )
+            self.assertHttpStatus(response, 200)
+
+        return operation
+
+    def test_zone_list(self):
+        self.assertQueryBudget(
+            self.get_page("zone_list", view_id=lambda d: d.view.pk, per_page=10),
+            LIST_VIEW_BUDGET,
+        )
+
+    def test_zone(self):
+        self.assertQueryBudget(
+            self.get_page("zone", pk=lambda d: d.zone.pk), DETAIL_VIEW_BUDGET
+        )
+
+    def test_zone_records(self):
+        self.assertQueryBudget(
+            self.get_page("zone_records", pk=lambda d: d.zone.pk, per_page=10),
+            LIST_VIEW_BUDGET,
+        )
+
+    def test_zone_managed_records(self):
+        self.assertQueryBudget(
+            self.get_page(
+                "zone_managed_records", pk=lambda d: d.reverse_zone.pk, per_page=10
+            ),
+            LIST_VIEW_BUDGET,
+        )
+
+    def test_zone_rfc2317_child_zones(self):
+        self.assertQueryBudget(
+            self.get_page("zone_rfc2317_child_zones", pk=lambda d: d.reverse_zone.pk),
+            LIST_VIEW_BUDGET,
+        )
+
+    def test_record_list(self):
+        self.assertQueryBudget(
+            self.get_page("record_list", view_id=lambda d: d.view.pk, per_page=10),
+            LIST_VIEW_BUDGET,
+        )
+
+    def test_managed_record_list(self):
+        self.assertQueryBudget(
+            self.get_page(
+                "record_list_managed", view_id=lambda d: d.view.pk, per_page=10
+            ),
+            LIST_VIEW_BUDGET,
+        )
+
+    def test_record(self):
+        # +
+        # The record view loads the CNAME records of the zone to find those
+        # pointing to the record.
+        # -
+        self.assertQueryBudget(
+            self.get_page("record", pk=lambda d: d.record.pk),
+            QueryBudget(queries=80, rows=500, rows_per_object=1),
+        )
+
+    def test_view_list(self):
+        self.assertQueryBudget(
+            self.get_page("view_list", id=lambda d: d.view.pk), LIST_VIEW_BUDGET
+        )
+
+    def test_view(self):
+        self.assertQueryBudget(
+            self.get_page("view", pk=lambda d: d.view.pk), DETAIL_VIEW_BUDGET
+        )
+
+    def test_view_zones(self):
+        self.assertQueryBudget(
+            self.get_page("view_zones", pk=lambda d: d.view.pk), LIST_VIEW_BUDGET
+        )
+
+    def test_nameserver_list(self):
+        self.assertQueryBudget(
+            self.get_page("nameserver_list", id=lambda d: d.nameserver.pk),
+            LIST_VIEW_BUDGET,
+        )
+
+    def test_nameserver(self):
+        self.assertQueryBudget(
+            self.get_page("nameserver", pk=lambda d: d.nameserver.pk),
+            DETAIL_VIEW_BUDGET,
+        )
+
+    def test_nameserver_soa_zones(self):
+        self.assertQueryBudget(
+            self.get_page("nameserver_soa_zones", pk=lambda d: d.nameserver.pk),
+            LIST_VIEW_BUDGET,
+        )
@@ -0,0 +1,187 @@
+import uuid
+
+from django.conf import settings
+from django.core import management
+from django.test import RequestFactory
+from django.urls import reverse
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
+from netbox.context_managers import event_tracking
+from utilities.testing import TestCase, create_tags
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+def changelog_settings(policy):
+    return {
+        "netbox_dns": settings.PLUGINS_CONFIG["netbox_dns"]
+        | {"changelog_managed_records": policy}
+    }
+
+
+class RecordChangelogTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zones = (
+            Zone.objects.create(name="zone1.example.com", **zone_data),
+            Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data),
+        )
+
+    def get_request(self):
+        request = RequestFactory().get(reverse("plugins:netbox_dns:record_add"))
+        request.id = uuid.uuid4()
+        request.user = self.user
+
+        return request
+
+    def get_object_changes(self, record):
+        return ObjectChange.objects.filter(
+            changed_object_type=ObjectType.objects.get_for_model(Record),
+            changed_object_id=record.pk,
+        )
+
+    def create_record(self):
+        with event_tracking(self.get_request()):
+            return Record.objects.create(
+                zone=self.zones[0],
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            )
+
+    def test_full_changelog(self):
+        record = self.create_record()
+
+        object_change = self.get_object_changes(record.ptr_record).get(
+            action=ObjectChangeActionChoices.ACTION_CREATE
+        )
+        self.assertIn("description", object_change.postchange_data)
+
+    def test_compact_changelog(self):
+        with self.settings(PLUGINS_CONFIG=changelog_settings("compact")):
+            record = self.create_record()
+
+            object_change = self.get_object_changes(record.ptr_record).get(
+                action=ObjectChangeActionChoices.ACTION_CREATE
+            )
+            self.assertEqual(
+                object_change.postchange_data,
+                {
+                    "zone": self.zones[1].pk,
+                    "name": "1",
+                    "type": RecordTypeChoices.PTR,
+                    "value": "name1.zone1.example.com.",
+                    "ttl": None,
+                    "status": record.ptr_record.status,
+                    "managed": True,
+                },
+            )
+
+            with event_tracking(self.get_request()):
+                record.ttl = 300
+                record.save()
+
+            object_change = self.get_object_changes(record.ptr_record).latest("time")
+            self.assertEqual(
+                object_change.action, ObjectChangeActionChoices.ACTION_UPDATE
+            )
+            self.assertEqual(object_change.prechange_data, {"ttl": None})
+            self.assertEqual(object_change.postchange_data, {"ttl": 300})
+
+            self.assertIn(
+                "description", self.get_object_changes(record).first().postchange_data
+            )
+
+    def test_no_changelog(self):
+        with self.settings(PLUGINS_CONFIG=changelog_settings("none")):
+            record = self.create_record()
+            ptr_record = record.ptr_record
+
+            self.assertFalse(self.get_object_changes(ptr_record).exists())
+            self.assertTrue(self.get_object_changes(record).exists())
+
+            with event_tracking(self.get_request()):
+                record.delete()
+
+            object_change = self.get_object_changes(ptr_record).get()
+            self.assertEqual(
+                object_change.action, ObjectChangeActionChoices.ACTION_DELETE
+            )
+            self.assertEqual(object_change.prechange_data["name"], "1")
+            self.assertNotIn("description", object_change.prechange_data)
+
+    def test_compact_changelog_tags(self):
+        tags = create_tags("Alpha", "Bravo")
+
+        with self.settings(PLUGINS_CONFIG=changelog_settings("compact")):
+            record = self.create_record()
+
+            ptr_record = Record.objects.get(pk=record.ptr_record.pk)
+            with event_tracking(self.get_request()):
+                ptr_record.snapshot()
+                ptr_record.tags.set(tags)
+
+            object_change = self.get_object_changes(ptr_record).latest("time")
+            self.assertEqual(
+                object_change.action, ObjectChangeActionChoices.ACTION_UPDATE
+            )
+            self.assertEqual(object_change.prechange_data, {"tags": []})
+            self.assertEqual(
+                object_change.postchange_data, {"tags": ["Alpha", "Bravo"]}
+            )
+
+    def test_no_changelog_tags(self):
+        tags = create_tags("Alpha", "Bravo")
+
+        with self.settings(PLUGINS_CONFIG=changelog_settings("none")):
+            record = self.create_record()
+
+            ptr_record = Record.objects.get(pk=record.ptr_record.pk)
+            with event_tracking(self.get_request()):
+                ptr_record.snapshot()
+                ptr_record.tags.set(tags)
+
+            self.assertFalse(self.get_object_changes(ptr_record).exists())
+
+    def test_compact_changelog_command(self):
+        soa_record = self.zones[0].records.get(type=RecordTypeChoices.SOA)
+        prechange_data = {
+            "name": "@",
+            "type": RecordTypeChoices.SOA,
+            "value": "ns1.example.com. hostmaster.example.com. 1 172800 7200 2592000 3600",
+            "description": "",
+        }
+        ObjectChange.objects.create(
+            changed_object=soa_record,
+            object_repr=str(soa_record),
+            action=ObjectChangeActionChoices.ACTION_UPDATE,
+            prechange_data=prechange_data,
+            postchange_data=prechange_data
+            | {
+                "value": "ns1.example.com. hostmaster.example.com. 2 172800 7200 2592000 3600"
+            },
+        )
+
+        management.call_command("compact_changelog", verbosity=0)
+
+        object_change = self.get_object_changes(soa_record).get()
+        self.assertEqual(
+            object_change.prechange_data,
+            {
+                "value": "ns1.example.com. hostmaster.example.com. 1 172800 7200 2592000 3600"
+            },
+        )
+        self.assertEqual(
+            object_change.postchange_data,
+            {
+                "value": "ns1.example.com. hostmaster.example.com. 2 172800 7200 2592000 3600"
+            },
+        )
@@ -0,0 +1,119 @@
+from io import StringIO
+
+from django.core import management
+from django.test import TestCase, override_settings
+
+from core.models import ObjectChange
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+@override_settings(
+    PLUGINS_CONFIG={
+        "netbox_dns": {
+            "enforce_unique_rrset_ttl": False,
+        }
+    }
+)
+class CleanupRRSetTTLTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.zone = Zone.objects.create(name="zone1.example.com", **zone_data)
+        cls.reverse_zone = Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data)
+
+    def setUp(self):
+        self.records = (
+            Record(
+                zone=self.zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+                ttl=3600,
+            ),
+            Record(
+                zone=self.zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.2",
+                ttl=7200,
+            ),
+            Record(
+                zone=self.zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.3",
+            ),
+            Record(
+                zone=self.zone,
+                name="name2",
+                type=RecordTypeChoices.A,
+                value="10.0.0.4",
+                ttl=86400,
+            ),
+        )
+        for record in self.records:
+            record.save()
+
+    def test_cleanup_min(self):
+        management.call_command("cleanup_rrset_ttl", "--min", stdout=StringIO())
+
+        for record in self.records:
+            record.refresh_from_db()
+
+        self.assertEqual(
+            [record.ttl for record in self.records], [3600, 3600, 3600, 86400]
+        )
+
+    def test_cleanup_max(self):
+        management.call_command("cleanup_rrset_ttl", "--max", stdout=StringIO())
+
+        for record in self.records:
+            record.refresh_from_db()
+
+        self.assertEqual(
+            [record.ttl for record in self.records], [7200, 7200, 7200, 86400]
+        )
+
+    def test_cleanup_dry_run(self):
+        output = StringIO()
+        management.call_command("cleanup_rrset_ttl", "--dry-run", stdout=output)
+
+        for record in self.records:
+            record.refresh_from_db()
+
+        self.assertEqual(
+            [record.ttl for record in self.records], [3600, 7200, None, 86400]
+        )
+        self.assertIn(
+            "name1 A in zone zone1.example.com: TTLs None, 3600, 7200 -> 3600",
+            output.getvalue(),
+        )
+        self.assertIn("2 records in 1 RRSets", output.getvalue())
+
+    def test_cleanup_ptr_records(self):
+        management.call_command("cleanup_rrset_ttl", "--min", stdout=StringIO())
+
+        for record in self.records:
+            record.refresh_from_db()
+            self.assertEqual(record.ptr_record.ttl, record.ttl)
+
+    def test_cleanup_change_log(self):
+        management.call_command("cleanup_rrset_ttl", "--min", stdout=StringIO())
+
+        changed_pks = {record.pk for record in self.records[1:3]} | {
+            record.ptr_record_id for record in self.records[1:3]
+        }
+        self.assertEqual(
+            set(
+                ObjectChange.objects.filter(
+                    changed_object_id__in=changed_pks
+                ).values_list("changed_object_id", flat=True)
+            ),
+            changed_pks,
+        )
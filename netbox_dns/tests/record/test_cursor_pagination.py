@@ -0,0 +1,121 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import Zone, NameServer, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import (
+    encode_record_cursor,
+    decode_record_cursor,
+    filter_records_after_cursor,
+)
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class RecordCursorPaginationTestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zones = (
+            Zone.objects.create(name="zone1.example.com", **zone_data),
+            Zone.objects.create(name="zone2.example.com", **zone_data),
+        )
+
+        for zone in cls.zones:
+            for index in range(3):
+                Record.objects.create(
+                    zone=zone,
+                    name="name1",
+                    type=RecordTypeChoices.TXT,
+                    value=f"text {index}",
+                )
+                Record.objects.create(
+                    zone=zone,
+                    name=f"name{index + 2}",
+                    type=RecordTypeChoices.TXT,
+                    value="text",
+                )
+
+        cls.record_pks = list(
+            Record.objects.order_by("fqdn", "pk").values_list("pk", flat=True)
+        )
+
+    def test_cursor_roundtrip(self):
+        record = Record.objects.get(pk=self.record_pks[3])
+
+        self.assertEqual(
+            decode_record_cursor(encode_record_cursor(record)),
+            (record.fqdn, record.pk),
+        )
+        self.assertIsNone(decode_record_cursor(""))
+
+    def test_invalid_cursor(self):
+        for cursor in ("invalid", "WzFd", "WyJhIiwgImIiXQ=="):
+            with self.assertRaises(ValueError):
+                decode_record_cursor(cursor)
+
+    def test_filter_records_after_cursor(self):
+        record = Record.objects.get(pk=self.record_pks[3])
+
+        self.assertEqual(
+            list(
+                filter_records_after_cursor(
+                    Record.objects.all(), encode_record_cursor(record)
+                ).values_list("pk", flat=True)
+            ),
+            self.record_pks[4:],
+        )
+
+    def test_api_cursor_pagination(self):
+        url = reverse("plugins-api:netbox_dns-api:record-list")
+
+        record_pks = []
+        response = self.client.get(f"{url}?cursor=&limit=4", **self.header)
+        while True:
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+
+            record_pks += [record["id"] for record in response.data["results"]]
+
+            if response.data["next"] is None:
+                break
+            response = self.client.get(response.data["next"], **self.header)
+
+        self.assertEqual(record_pks, self.record_pks)
+
+    def test_api_cursor_pagination_without_fqdn(self):
+        Record.objects.filter(pk__in=self.record_pks[-2:]).update(fqdn=None)
+        record_pks = list(
+            Record.objects.order_by("fqdn", "pk").values_list("pk", flat=True)
+        )
+
+        url = reverse("plugins-api:netbox_dns-api:record-list")
+
+        response = self.client.get(f"{url}?cursor=&limit=5", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        page_pks = [record["id"] for record in response.data["results"]]
+
+        response = self.client.get(response.data["next"], **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        page_pks += [record["id"] for record in response.data["results"]]
+
+        response = self.client.get(response.data["next"], **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        page_pks += [record["id"] for record in response.data["results"]]
+
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(page_pks, record_pks)
+
+    def test_api_invalid_cursor(self):
+        url = reverse("plugins-api:netbox_dns-api:record-list")
+
+        response = self.client.get(f"{url}?cursor=invalid", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
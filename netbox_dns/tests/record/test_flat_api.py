@@ -0,0 +1,129 @@
+import csv
+import json
+from io import StringIO
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import View, Zone, NameServer, Record
+from netbox_dns.choices import RecordTypeChoices, RecordStatusChoices
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class RecordFlatAPITestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        view = View.objects.create(name="Test View")
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        cls.zones = (
+            Zone.objects.create(
+                name="zone1.example.com",
+                view=view,
+                default_ttl=3600,
+                soa_mname=nameserver,
+                soa_rname="hostmaster.example.com",
+            ),
+            Zone.objects.create(
+                name="zone2.example.com",
+                view=view,
+                soa_mname=nameserver,
+                soa_rname="hostmaster.example.com",
+            ),
+        )
+
+        cls.records = (
+            Record.objects.create(
+                zone=cls.zones[0],
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+                ttl=300,
+            ),
+            Record.objects.create(
+                zone=cls.zones[0],
+                name="name2",
+                type=RecordTypeChoices.TXT,
+                value="text",
+            ),
+            Record.objects.create(
+                zone=cls.zones[1],
+                name="name3",
+                type=RecordTypeChoices.AAAA,
+                value="fe80::1",
+                status=RecordStatusChoices.STATUS_INACTIVE,
+            ),
+        )
+
+        cls.url = reverse("plugins-api:netbox_dns-api:record-flat")
+
+    def _get_content(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_flat_json_lines(self):
+        response = self.client.get(
+            f"{self.url}?zone_id={self.zones[0].pk}&type=A&type=TXT", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/jsonl")
+
+        rows = [json.loads(line) for line in self._get_content(response).splitlines()]
+        self.assertEqual(
+            rows,
+            [
+                {
+                    "id": self.records[0].pk,
+                    "zone": "zone1.example.com",
+                    "view": "Test View",
+                    "fqdn": "name1.zone1.example.com.",
+                    "type": RecordTypeChoices.A,
+                    "ttl": 300,
+                    "value": "10.0.0.1",
+                    "status": RecordStatusChoices.STATUS_ACTIVE,
+                },
+                {
+                    "id": self.records[1].pk,
+                    "zone": "zone1.example.com",
+                    "view": "Test View",
+                    "fqdn": "name2.zone1.example.com.",
+                    "type": RecordTypeChoices.TXT,
+                    "ttl": 3600,
+                    "value": "text",
+                    "status": RecordStatusChoices.STATUS_ACTIVE,
+                },
+            ],
+        )
+
+    def test_flat_csv(self):
+        response = self.client.get(
+            f"{self.url}?zone_id={self.zones[1].pk}&type=AAAA&output=csv",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        rows = list(csv.reader(StringIO(self._get_content(response))))
+        self.assertEqual(
+            rows,
+            [
+                ["id", "zone", "view", "fqdn", "type", "ttl", "value", "status"],
+                [
+                    str(self.records[2].pk),
+                    "zone2.example.com",
+                    "Test View",
+                    "name3.zone2.example.com.",
+                    RecordTypeChoices.AAAA,
+                    str(self.zones[1].default_ttl),
+                    "fe80::1",
+                    RecordStatusChoices.STATUS_INACTIVE,
+                ],
+            ],
+        )
+
+    def test_flat_invalid_output(self):
+        response = self.client.get(f"{self.url}?output=xml", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
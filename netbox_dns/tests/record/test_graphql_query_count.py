@@ -0,0 +1,108 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import View, Zone, NameServer, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+RECORD_LIST_QUERY = """
+{
+    netbox_dns_record_list {
+        id
+        name
+        fqdn
+        type
+        value
+        absolute_value
+        active
+        zone { name active view { name } }
+        ptr_record { fqdn zone { name } }
+        address_record { fqdn }
+        rfc2317_cname_record { fqdn }
+    }
+}
+"""
+
+ZONE_LIST_QUERY = """
+{
+    netbox_dns_zone_list {
+        id
+        name
+        active
+        view { name }
+        nameservers { name }
+        records { name type value active }
+    }
+}
+"""
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class GraphQLQueryCountTestCase(APITestCase):
+    """
+    Benchmark for the number of database queries issued by the GraphQL queries
+    commonly used for inventory purposes. The number of queries must not depend
+    on the number of objects returned.
+    """
+
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = View.objects.create(name="Test View")
+        cls.nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "view": cls.view,
+            "soa_mname": cls.nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.zones = (
+            Zone.objects.create(name="zone1.example.com", **zone_data),
+            Zone.objects.create(name="zone2.example.com", **zone_data),
+            Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data),
+        )
+        for zone in cls.zones:
+            zone.nameservers.set([cls.nameserver])
+
+    def _create_records(self, start, count):
+        for index in range(start, start + count):
+            Record.objects.create(
+                zone=self.zones[index % 2],
+                name=f"name{index}",
+                type=RecordTypeChoices.A,
+                value=f"10.0.0.{index + 1}",
+            )
+
+    def _count_queries(self, query):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                reverse("graphql"),
+                data={"query": query},
+                format="json",
+                **self.header,
+            )
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotIn("errors", response.json())
+
+        return len(context.captured_queries)
+
+    def test_record_list_query_count(self):
+        self._create_records(0, 5)
+        query_count = self._count_queries(RECORD_LIST_QUERY)
+
+        self._create_records(5, 20)
+        self.assertEqual(self._count_queries(RECORD_LIST_QUERY), query_count)
+
+    def test_zone_list_query_count(self):
+        self._create_records(0, 5)
+        query_count = self._count_queries(ZONE_LIST_QUERY)
+
+        self._create_records(5, 20)
+        self.assertEqual(self._count_queries(ZONE_LIST_QUERY), query_count)
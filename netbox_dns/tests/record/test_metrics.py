@@ -0,0 +1,81 @@
+from prometheus_client import REGISTRY
+
+from django.test import TestCase, override_settings
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import instrument, ORIGIN_COMMAND, ORIGIN_SIGNAL
+
+
+def get_sample(name, operation, origin):
+    return (
+        REGISTRY.get_sample_value(name, {"operation": operation, "origin": origin}) or 0
+    )
+
+
+def get_count(operation, origin=ORIGIN_COMMAND):
+    return get_sample("netbox_dns_operation_duration_seconds_count", operation, origin)
+
+
+def get_queries(operation, origin=ORIGIN_COMMAND):
+    return get_sample("netbox_dns_operation_queries_total", operation, origin)
+
+
+class RecordMetricsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zone = Zone.objects.create(name="zone1.example.com", **zone_data)
+        cls.reverse_zone = Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data)
+
+    def create_record(self):
+        return Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+    @override_settings(METRICS_ENABLED=True)
+    def test_record_save(self):
+        saves = get_count("Record.save")
+        ptr_updates = get_count("Record.update_ptr_record")
+        serial_updates = get_count("Zone.update_serial")
+        queries = get_queries("Record.save")
+
+        self.create_record()
+
+        # +
+        # Saving the address record also saves its PTR record and possibly the
+        # SOA records of both zones
+        # -
+        self.assertGreaterEqual(get_count("Record.save"), saves + 2)
+        self.assertEqual(get_count("Record.update_ptr_record"), ptr_updates + 1)
+        self.assertEqual(get_count("Zone.update_serial"), serial_updates + 2)
+        self.assertGreater(get_queries("Record.save"), queries)
+
+    @override_settings(METRICS_ENABLED=True)
+    def test_record_save_origin(self):
+        saves = get_count("Record.save", origin=ORIGIN_SIGNAL)
+        tests = get_count("test", origin=ORIGIN_SIGNAL)
+
+        with instrument("test", origin=ORIGIN_SIGNAL):
+            self.create_record()
+
+        self.assertGreaterEqual(
+            get_count("Record.save", origin=ORIGIN_SIGNAL), saves + 2
+        )
+        self.assertEqual(get_count("test", origin=ORIGIN_SIGNAL), tests + 1)
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_metrics_disabled(self):
+        saves = get_count("Record.save")
+
+        self.create_record()
+
+        self.assertEqual(get_count("Record.save"), saves)
@@ -0,0 +1,118 @@
+import os
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.utilities import encode_record_cursor, get_record_cursor_segments
+from netbox_dns.choices import RecordTypeChoices, RecordStatusChoices
+
+
+# +
+# The number of records in the test dataset. Set NETBOX_DNS_EXPLAIN_RECORDS
+# to 1000000 to verify the query plans for a large installation.
+# -
+RECORD_COUNT = int(os.environ.get("NETBOX_DNS_EXPLAIN_RECORDS", 20000))
+ZONE_COUNT = 100
+
+
+class RecordQueryPlanTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        cls.zones = [
+            Zone.objects.create(
+                name=f"zone{index}.example.com",
+                soa_mname=nameserver,
+                soa_rname="hostmaster.example.com",
+            )
+            for index in range(ZONE_COUNT)
+        ]
+
+        batch = []
+        for index in range(RECORD_COUNT):
+            zone = cls.zones[index % ZONE_COUNT]
+            name = f"name{index // ZONE_COUNT}"
+            batch.append(
+                Record(
+                    zone=zone,
+                    name=name,
+                    fqdn=f"{name}.{zone.name}.",
+                    type=RecordTypeChoices.TXT,
+                    value=f"text {index}",
+                    status=(
+                        RecordStatusChoices.STATUS_INACTIVE
+                        if index % 10 == 0
+                        else RecordStatusChoices.STATUS_ACTIVE
+                    ),
+                )
+            )
+
+            if len(batch) >= 10000:
+                Record.objects.bulk_create(batch)
+                batch = []
+
+        Record.objects.bulk_create(batch)
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE netbox_dns_record")
+
+    def assertIndexScans(self, queries, index):
+        record_queries = [
+            query["sql"]
+            for query in queries
+            if 'FROM "netbox_dns_record"' in query["sql"]
+        ]
+        self.assertTrue(record_queries)
+
+        for sql in record_queries:
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN {sql}")
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+
+            self.assertNotIn(
+                "Seq Scan on netbox_dns_record", plan, msg=f"{sql}\n{plan}"
+            )
+            self.assertIn(index, plan, msg=f"{sql}\n{plan}")
+
+    def test_record_validation(self):
+        record = Record(
+            zone=self.zones[1],
+            name="name42",
+            type=RecordTypeChoices.TXT,
+            value="new text",
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            record.full_clean()
+
+        self.assertIndexScans(queries.captured_queries, "netbox_dns_rec_owner_idx")
+
+    def test_update_rrset_ttl(self):
+        record = Record.objects.get(zone=self.zones[1], name="name42")
+        record.ttl = 300
+
+        with CaptureQueriesContext(connection) as queries:
+            record.update_rrset_ttl()
+
+        self.assertIndexScans(queries.captured_queries, "netbox_dns_rec_zone_name_idx")
+
+    def test_managed_records(self):
+        with CaptureQueriesContext(connection) as queries:
+            list(self.zones[1].records.filter(type=RecordTypeChoices.NS, managed=True))
+
+        self.assertIndexScans(queries.captured_queries, "netbox_dns_rec_zone_type_idx")
+
+    def test_record_cursor(self):
+        record = Record.objects.order_by("fqdn", "pk")[RECORD_COUNT // 2]
+
+        with CaptureQueriesContext(connection) as queries:
+            list(
+                get_record_cursor_segments(
+                    Record.objects.all(), encode_record_cursor(record)
+                )[0][:100]
+            )
+
+        self.assertIndexScans(queries.captured_queries, "netbox_dns_record_fqdn_id_idx")
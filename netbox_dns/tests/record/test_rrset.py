@@ -0,0 +1,269 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
+from users.models import ObjectPermission
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import Zone, NameServer, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+class RRSetTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zone = Zone.objects.create(name="zone1.example.com", **zone_data)
+        cls.reverse_zone = Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data)
+
+    def setUp(self):
+        self.records = (
+            Record.objects.create(
+                zone=self.zone,
+                name="www",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            ),
+            Record.objects.create(
+                zone=self.zone,
+                name="www",
+                type=RecordTypeChoices.A,
+                value="10.0.0.2",
+            ),
+            Record.objects.create(
+                zone=self.zone,
+                name="www",
+                type=RecordTypeChoices.TXT,
+                value="text 1",
+            ),
+        )
+
+    def test_get_rrset(self):
+        self.assertEqual(set(self.zone.get_rrset("www", "a")), set(self.records[0:2]))
+        self.assertEqual(
+            set(self.zone.get_rrset("WWW.zone1.example.com.", "TXT")),
+            {self.records[2]},
+        )
+
+    def test_replace_address_rrset(self):
+        result = self.zone.replace_rrset(
+            "www",
+            RecordTypeChoices.A,
+            [{"value": "10.0.0.2"}, {"value": "10.0.0.3"}],
+            ttl=300,
+        )
+
+        self.assertEqual(
+            result, {"created": 1, "updated": 1, "deleted": 1, "unchanged": 0}
+        )
+
+        rrset = self.zone.get_rrset("www", RecordTypeChoices.A)
+        self.assertEqual(
+            set(rrset.values_list("value", flat=True)), {"10.0.0.2", "10.0.0.3"}
+        )
+        self.assertEqual(set(rrset.values_list("ttl", flat=True)), {300})
+        self.assertEqual(
+            set(
+                self.reverse_zone.records.filter(
+                    type=RecordTypeChoices.PTR
+                ).values_list("name", flat=True)
+            ),
+            {"2", "3"},
+        )
+
+    def test_replace_rrset_bulk(self):
+        result = self.zone.replace_rrset(
+            "www",
+            RecordTypeChoices.TXT,
+            [{"value": "text 1"}, {"value": "text 2"}, {"value": "text 2"}],
+        )
+
+        self.assertEqual(
+            result, {"created": 1, "updated": 0, "deleted": 0, "unchanged": 1}
+        )
+        self.assertEqual(
+            set(
+                self.zone.get_rrset("www", RecordTypeChoices.TXT).values_list(
+                    "value", flat=True
+                )
+            ),
+            {"text 1", "text 2"},
+        )
+
+    def test_replace_rrset_cname_conflict(self):
+        with self.assertRaises(ValidationError):
+            self.zone.replace_rrset(
+                "www",
+                RecordTypeChoices.CNAME,
+                [{"value": "web.example.com."}],
+            )
+
+        self.assertFalse(self.zone.get_rrset("www", RecordTypeChoices.CNAME).exists())
+
+    def test_replace_rrset_singleton(self):
+        with self.assertRaises(ValidationError):
+            self.zone.replace_rrset(
+                "alias",
+                RecordTypeChoices.CNAME,
+                [{"value": "web1.example.com."}, {"value": "web2.example.com."}],
+            )
+
+    def test_replace_managed_rrset(self):
+        with self.assertRaises(ValidationError):
+            self.zone.replace_rrset(
+                "@",
+                RecordTypeChoices.SOA,
+                [{"value": "invalid"}],
+            )
+
+    def test_delete_rrset(self):
+        self.assertEqual(self.zone.delete_rrset("www", RecordTypeChoices.A), 2)
+
+        self.assertFalse(self.zone.get_rrset("www", RecordTypeChoices.A).exists())
+        self.assertFalse(
+            self.reverse_zone.records.filter(type=RecordTypeChoices.PTR).exists()
+        )
+        self.assertTrue(Record.objects.filter(pk=self.records[2].pk).exists())
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class RRSetAPITestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+        for value in ("text 1", "text 2"):
+            Record.objects.create(
+                zone=cls.zone,
+                name="name1",
+                type=RecordTypeChoices.TXT,
+                value=value,
+                ttl=600,
+            )
+
+    def _get_url(self, name, type):
+        return reverse(
+            "plugins-api:netbox_dns-api:rrset",
+            kwargs={"zone_id": self.zone.pk, "name": name, "type": type},
+        )
+
+    def test_get_rrset(self):
+        response = self.client.get(self._get_url("name1", "TXT"), **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["ttl"], 600)
+        self.assertEqual(
+            {record["value"] for record in response.data["records"]},
+            {"text 1", "text 2"},
+        )
+
+    def test_get_missing_rrset(self):
+        response = self.client.get(self._get_url("name2", "TXT"), **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+    def test_put_rrset(self):
+        self.add_permissions(
+            "netbox_dns.change_zone",
+            "netbox_dns.add_record",
+            "netbox_dns.change_record",
+            "netbox_dns.delete_record",
+        )
+
+        response = self.client.put(
+            self._get_url("name1", "TXT"),
+            {"ttl": 300, "records": [{"value": "text 3"}]},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["ttl"], 300)
+        self.assertEqual(
+            [record["value"] for record in response.data["records"]], ["text 3"]
+        )
+
+        record_type = ObjectType.objects.get_for_model(Record)
+        self.assertTrue(
+            ObjectChange.objects.filter(
+                changed_object_type=record_type,
+                changed_object_id=response.data["records"][0]["id"],
+                action=ObjectChangeActionChoices.ACTION_CREATE,
+            ).exists()
+        )
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_type=record_type,
+                action=ObjectChangeActionChoices.ACTION_DELETE,
+            ).count(),
+            2,
+        )
+
+    def test_put_rrset_constrained_permission(self):
+        self.add_permissions("netbox_dns.change_zone")
+
+        permission = ObjectPermission.objects.create(
+            name="Records name1",
+            actions=["add", "change", "delete"],
+            constraints={"name": "name1"},
+        )
+        permission.object_types.add(ObjectType.objects.get_for_model(Record))
+        permission.users.add(self.user)
+
+        response = self.client.put(
+            self._get_url("name1", "TXT"),
+            {"records": [{"value": "text 3"}]},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        response = self.client.put(
+            self._get_url("name2", "TXT"),
+            {"records": [{"value": "text 3"}]},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(self.zone.get_rrset("name2", "TXT").exists())
+
+    def test_put_rrset_without_zone_permission(self):
+        self.add_permissions(
+            "netbox_dns.add_record",
+            "netbox_dns.change_record",
+            "netbox_dns.delete_record",
+        )
+
+        response = self.client.put(
+            self._get_url("name1", "TXT"),
+            {"records": [{"value": "text 3"}]},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
+    def test_put_rrset_without_permission(self):
+        response = self.client.put(
+            self._get_url("name1", "TXT"),
+            {"records": [{"value": "text 3"}]},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_delete_rrset(self):
+        self.add_permissions("netbox_dns.change_zone", "netbox_dns.delete_record")
+
+        response = self.client.delete(self._get_url("name1", "TXT"), **self.header)
+        self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(self.zone.get_rrset("name1", "TXT").exists())
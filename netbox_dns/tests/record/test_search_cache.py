@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.core import management
+from django.test import TestCase
+
+from core.models import ObjectType
+from extras.models import CachedValue
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+def search_settings(exclude_managed_records):
+    return {
+        "netbox_dns": settings.PLUGINS_CONFIG["netbox_dns"]
+        | {"search_exclude_managed_records": exclude_managed_records}
+    }
+
+
+class RecordSearchCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zones = (
+            Zone.objects.create(name="zone1.example.com", **zone_data),
+            Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data),
+        )
+
+    def get_cached_record_pks(self):
+        return set(
+            CachedValue.objects.filter(
+                object_type=ObjectType.objects.get_for_model(Record)
+            ).values_list("object_id", flat=True)
+        )
+
+    def create_record(self):
+        return Record.objects.create(
+            zone=self.zones[0],
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+    def test_managed_records_indexed(self):
+        record = self.create_record()
+
+        cached_record_pks = self.get_cached_record_pks()
+        self.assertIn(record.pk, cached_record_pks)
+        self.assertIn(record.ptr_record.pk, cached_record_pks)
+
+    def test_managed_records_excluded(self):
+        with self.settings(PLUGINS_CONFIG=search_settings(True)):
+            record = self.create_record()
+
+            self.assertEqual(self.get_cached_record_pks(), {record.pk})
+
+    def test_reindex(self):
+        record = self.create_record()
+        CachedValue.objects.all().delete()
+
+        management.call_command("reindex_dns", verbosity=0)
+
+        self.assertEqual(
+            self.get_cached_record_pks(),
+            set(Record.objects.values_list("pk", flat=True)),
+        )
+        self.assertTrue(
+            CachedValue.objects.filter(
+                object_type=ObjectType.objects.get_for_model(Zone),
+                object_id=self.zones[0].pk,
+            ).exists()
+        )
+
+        with self.settings(PLUGINS_CONFIG=search_settings(True)):
+            management.call_command("reindex_dns", model=["record"], verbosity=0)
+
+        self.assertEqual(self.get_cached_record_pks(), {record.pk})
@@ -0,0 +1,105 @@
+from django.core import management
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import (
+    RecordTypeChoices,
+    RecordStatusChoices,
+    ZoneStatusChoices,
+)
+
+
+@override_settings(
+    PLUGINS_CONFIG={
+        "netbox_dns": {
+            "enforce_unique_records": True,
+            "unique_records_constraint": True,
+            "dnssync_disabled": True,
+        }
+    }
+)
+class RecordUniqueConstraintTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.record_data = {"type": RecordTypeChoices.AAAA, "value": "fe80:dead:beef::"}
+
+        cls.zone = Zone.objects.create(name="zone1.example.com", **zone_data)
+
+    def setUp(self):
+        management.call_command("setup_unique_records", verbosity=0)
+
+    def test_duplicate_record_fail(self):
+        Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+
+        with self.assertRaisesMessage(
+            ValidationError,
+            f"There is already an active AAAA record for name NAME1 in zone {self.zone} with value fe80:dead:beef::.",
+        ):
+            Record.objects.create(name="NAME1", zone=self.zone, **self.record_data)
+
+    def test_update_duplicate_record_fail(self):
+        Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+        record = Record.objects.create(name="name2", zone=self.zone, **self.record_data)
+
+        record.name = "name1"
+        with self.assertRaises(ValidationError):
+            record.save()
+
+    def test_inactive_duplicate_record_ok(self):
+        Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+        Record.objects.create(
+            name="name1",
+            zone=self.zone,
+            status=RecordStatusChoices.STATUS_INACTIVE,
+            **self.record_data,
+        )
+
+    def test_duplicate_record_inactive_zone_fail(self):
+        self.zone.status = ZoneStatusChoices.STATUS_PARKED
+        self.zone.save()
+
+        Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+
+        with self.assertRaises(ValidationError):
+            Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+
+    def test_remove_constraint(self):
+        management.call_command("setup_unique_records", remove=True, verbosity=0)
+
+        Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+
+        # +
+        # Without the index the setting is not sufficient, so the records are
+        # checked before they are saved.
+        # -
+        with self.assertRaisesMessage(
+            ValidationError,
+            f"There is already an active AAAA record for name name1 in zone {self.zone} with value fe80:dead:beef::.",
+        ):
+            Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+
+    def test_duplicate_record_rollback(self):
+        reverse_zone = Zone.objects.create(
+            name="f.e.e.b.d.a.e.d.0.8.e.f.ip6.arpa",
+            soa_mname=self.zone.soa_mname,
+            soa_rname=self.zone.soa_rname,
+        )
+        record = Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+        ptr_records = list(
+            Record.objects.filter(zone=reverse_zone, type=RecordTypeChoices.PTR)
+        )
+        self.assertEqual(ptr_records, [record.ptr_record])
+
+        with self.assertRaises(ValidationError):
+            Record.objects.create(name="name1", zone=self.zone, **self.record_data)
+
+        self.assertEqual(
+            list(Record.objects.filter(zone=reverse_zone, type=RecordTypeChoices.PTR)),
+            ptr_records,
+        )
@@ -0,0 +1,262 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from core.models import ObjectType
+from users.models import ObjectPermission
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import Zone, NameServer, Record
+from netbox_dns.choices import RecordTypeChoices, RecordStatusChoices
+
+
+class RecordUpsertTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zone = Zone.objects.create(name="zone1.example.com", **zone_data)
+        cls.reverse_zone = Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data)
+
+    def setUp(self):
+        self.records = (
+            Record.objects.create(
+                zone=self.zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            ),
+            Record.objects.create(
+                zone=self.zone,
+                name="name2",
+                type=RecordTypeChoices.A,
+                value="10.0.0.2",
+            ),
+            Record.objects.create(
+                zone=self.zone,
+                name="name3",
+                type=RecordTypeChoices.TXT,
+                value="text",
+            ),
+        )
+
+    def test_upsert_records(self):
+        result = self.zone.upsert_records(
+            [
+                {"name": "name1", "type": "A", "value": "10.0.0.1"},
+                {"name": "name2", "type": "A", "value": "10.0.0.2", "ttl": 300},
+                {"name": "NAME4.zone1.example.com.", "type": "a", "value": "10.0.0.4"},
+            ]
+        )
+
+        self.assertEqual(
+            result, {"created": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+        )
+
+        self.assertEqual(Record.objects.get(pk=self.records[1].pk).ttl, 300)
+        self.assertFalse(Record.objects.filter(pk=self.records[2].pk).exists())
+
+        record = Record.objects.get(zone=self.zone, value="10.0.0.4")
+        self.assertEqual(record.type, RecordTypeChoices.A)
+        self.assertEqual(record.fqdn.lower(), "name4.zone1.example.com.")
+        self.assertEqual(record.ptr_record.zone, self.reverse_zone)
+
+    def test_upsert_records_no_delete(self):
+        result = self.zone.upsert_records(
+            [{"name": "name5", "type": "TXT", "value": "text"}], delete=False
+        )
+
+        self.assertEqual(
+            result, {"created": 1, "updated": 0, "deleted": 0, "unchanged": 3}
+        )
+        self.assertEqual(self.zone.records.filter(managed=False).count(), 4)
+
+    def test_upsert_records_scope(self):
+        result = self.zone.upsert_records(
+            [
+                {
+                    "name": "name1",
+                    "type": "A",
+                    "value": "10.0.0.1",
+                    "status": RecordStatusChoices.STATUS_INACTIVE,
+                }
+            ],
+            type=RecordTypeChoices.A,
+        )
+
+        self.assertEqual(
+            result, {"created": 0, "updated": 1, "deleted": 1, "unchanged": 0}
+        )
+        self.assertTrue(Record.objects.filter(pk=self.records[2].pk).exists())
+        self.assertFalse(Record.objects.filter(pk=self.records[1].pk).exists())
+
+    def test_upsert_records_normalized_value(self):
+        value = " ".join(f"word{index}" for index in range(100))
+        Record.objects.create(
+            zone=self.zone, name="name5", type=RecordTypeChoices.TXT, value=value
+        )
+
+        result = self.zone.upsert_records(
+            [{"name": "name5", "type": "TXT", "value": value}], delete=False
+        )
+
+        self.assertEqual(
+            result, {"created": 0, "updated": 0, "deleted": 0, "unchanged": 4}
+        )
+
+    def test_upsert_records_out_of_scope(self):
+        with self.assertRaises(ValidationError):
+            self.zone.upsert_records(
+                [{"name": "name3", "type": "TXT", "value": "text"}], name="name1"
+            )
+
+    def test_upsert_records_rollback(self):
+        with self.assertRaises(ValidationError):
+            self.zone.upsert_records(
+                [
+                    {"name": "name1", "type": "A", "value": "10.0.0.1"},
+                    {"name": "name6", "type": "A", "value": "invalid"},
+                ]
+            )
+
+        self.assertEqual(self.zone.records.filter(managed=False).count(), 3)
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class RecordUpsertAPITestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+        Record.objects.create(
+            zone=cls.zone,
+            name="name1",
+            type=RecordTypeChoices.TXT,
+            value="text",
+        )
+
+        cls.url = reverse("plugins-api:netbox_dns-api:record-upsert")
+
+    def test_upsert_without_permission(self):
+        response = self.client.post(
+            self.url,
+            {"zone": self.zone.pk, "records": []},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_upsert_without_zone_permission(self):
+        self.add_permissions(
+            "netbox_dns.add_record",
+            "netbox_dns.change_record",
+            "netbox_dns.delete_record",
+        )
+
+        response = self.client.post(
+            self.url,
+            {"zone": self.zone.pk, "records": []},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(Record.objects.filter(zone=self.zone, name="name1").exists())
+
+    def test_upsert_constrained_permission(self):
+        self.add_permissions("netbox_dns.change_zone")
+
+        permission = ObjectPermission.objects.create(
+            name="Records name1",
+            actions=["add", "change", "delete"],
+            constraints={"name": "name1"},
+        )
+        permission.object_types.add(ObjectType.objects.get_for_model(Record))
+        permission.users.add(self.user)
+
+        response = self.client.post(
+            self.url,
+            {
+                "zone": self.zone.pk,
+                "records": [
+                    {"name": "name1", "type": "TXT", "value": "text"},
+                    {"name": "name2", "type": "TXT", "value": "text"},
+                ],
+            },
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Record.objects.filter(zone=self.zone, name="name2").exists())
+
+        response = self.client.post(
+            self.url,
+            {
+                "zone": self.zone.pk,
+                "records": [
+                    {"name": "name1", "type": "TXT", "value": "text", "ttl": 300}
+                ],
+            },
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, {"created": 0, "updated": 1, "deleted": 0, "unchanged": 0}
+        )
+
+    def test_upsert(self):
+        self.add_permissions(
+            "netbox_dns.change_zone",
+            "netbox_dns.add_record",
+            "netbox_dns.change_record",
+            "netbox_dns.delete_record",
+        )
+
+        response = self.client.post(
+            self.url,
+            {
+                "zone": self.zone.pk,
+                "records": [
+                    {"name": "name2", "type": "TXT", "value": "text", "ttl": "PT5M"}
+                ],
+            },
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, {"created": 1, "updated": 0, "deleted": 1, "unchanged": 0}
+        )
+        self.assertEqual(
+            Record.objects.get(zone=self.zone, name="name2", type="TXT").ttl, 300
+        )
+
+    def test_upsert_invalid_record(self):
+        self.add_permissions(
+            "netbox_dns.change_zone",
+            "netbox_dns.add_record",
+            "netbox_dns.change_record",
+            "netbox_dns.delete_record",
+        )
+
+        response = self.client.post(
+            self.url,
+            {
+                "zone": self.zone.pk,
+                "records": [{"name": "name2", "type": "A", "value": "invalid"}],
+            },
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(Record.objects.filter(zone=self.zone, name="name1").exists())
@@ -0,0 +1,87 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+def validation_settings():
+    return {
+        "netbox_dns": settings.PLUGINS_CONFIG["netbox_dns"]
+        | {
+            "enforce_unique_records": True,
+            "enforce_unique_rrset_ttl": True,
+        }
+    }
+
+
+class RecordValidationQueriesTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+
+        for value in ("text 1", "text 2"):
+            Record.objects.create(
+                zone=cls.zone,
+                name="name1",
+                type=RecordTypeChoices.TXT,
+                value=value,
+                ttl=600,
+            )
+
+    def count_record_queries(self, record):
+        with CaptureQueriesContext(connection) as queries:
+            try:
+                record.clean()
+            except ValidationError:
+                pass
+
+        return len(
+            [
+                query
+                for query in queries.captured_queries
+                if Record._meta.db_table in query["sql"]
+            ]
+        )
+
+    def test_new_record_single_query(self):
+        record = Record(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.TXT,
+            value="text 3",
+            ttl=600,
+        )
+
+        with self.settings(PLUGINS_CONFIG=validation_settings()):
+            self.assertEqual(self.count_record_queries(record), 1)
+
+    def test_existing_record_single_query(self):
+        record = self.zone.records.get(name="name1", value="text 1")
+        record.value = "text 3"
+
+        with self.settings(PLUGINS_CONFIG=validation_settings()):
+            self.assertEqual(self.count_record_queries(record), 1)
+
+    def test_conflicts_single_query(self):
+        for type, value, ttl in (
+            (RecordTypeChoices.TXT, "text 1", 600),
+            (RecordTypeChoices.TXT, "text 3", 300),
+            (RecordTypeChoices.CNAME, "name2.zone1.example.com.", 600),
+        ):
+            record = Record(
+                zone=self.zone, name="name1", type=type, value=value, ttl=ttl
+            )
+
+            with self.settings(PLUGINS_CONFIG=validation_settings()):
+                with self.assertRaises(ValidationError):
+                    record.clean()
+
+                self.assertEqual(self.count_record_queries(record), 1)
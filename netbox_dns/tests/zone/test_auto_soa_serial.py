@@ -687,3 +687,63 @@ class ZoneAutoSOASerialTestCase(TestCase):
         self.assertEqual(
             parse_soa_value(rfc2317_soa_record.value).serial, rfc2317_zone.soa_serial
         )
+
+    def test_create_record_records_last_updated(self):
+        zone = self.zones[0]
+
+        self.assertIsNone(zone.records_last_updated)
+
+        Record.objects.create(
+            zone=zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.1.42",
+            ttl=86400,
+        )
+
+        zone.refresh_from_db()
+
+        self.assertTrue(int(zone.records_last_updated.timestamp()) >= self.start_time)
+
+    def test_create_record_records_last_updated_soa_serial_fixed(self):
+        zone = self.zones[1]
+
+        Record.objects.create(
+            zone=zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.1.42",
+            ttl=86400,
+        )
+
+        zone.refresh_from_db()
+
+        self.assertEqual(zone.soa_serial, 1)
+        self.assertTrue(int(zone.records_last_updated.timestamp()) >= self.start_time)
+
+    def test_stale_zone_records_last_updated_soa_serial_auto(self):
+        zone = self.zones[0]
+
+        set_soa_serial_back(zone)
+
+        stale_zone = Zone.objects.get(pk=zone.pk)
+
+        Record.objects.create(
+            zone=zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.1.42",
+            ttl=86400,
+        )
+
+        set_soa_serial_back(zone)
+
+        stale_zone.soa_rname = "admin.example.com"
+        stale_zone.save()
+
+        stale_zone.refresh_from_db()
+
+        self.assertTrue(int(stale_zone.soa_serial) >= self.start_time)
+        self.assertTrue(
+            int(stale_zone.records_last_updated.timestamp()) >= self.start_time
+        )
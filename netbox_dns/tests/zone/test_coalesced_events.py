@@ -0,0 +1,134 @@
+import uuid
+
+import django_rq
+from django.urls import reverse
+from django.test import RequestFactory, override_settings
+
+from core.models import ObjectType
+from extras.models import EventRule, Webhook
+from extras.choices import EventRuleActionChoices
+
+from netbox.context_managers import event_tracking
+from core.events import OBJECT_CREATED, OBJECT_UPDATED, OBJECT_DELETED
+from utilities.testing import APITestCase
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+@override_settings(EVENTS_PIPELINE=["netbox_dns.events.process_event_queue"])
+class CoalescedEventRuleTest(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.queue = django_rq.get_queue("default")
+        self.queue.empty()
+
+    @classmethod
+    def setUpTestData(cls):
+        zone_type = ObjectType.objects.get_for_model(Zone)
+        record_type = ObjectType.objects.get_for_model(Record)
+        webhook_type = ObjectType.objects.get_for_model(Webhook)
+
+        webhook = Webhook.objects.create(
+            name="Zone Webhook",
+            payload_url="http://localhost:9000/",
+            secret="THISISNOTASECRETANYMORE",
+        )
+
+        event_rule = EventRule.objects.create(
+            name="DNS Change",
+            event_types=[OBJECT_CREATED, OBJECT_UPDATED, OBJECT_DELETED],
+            action_type=EventRuleActionChoices.WEBHOOK,
+            action_object_type=webhook_type,
+            action_object_id=webhook.id,
+        )
+        event_rule.object_types.set([zone_type, record_type])
+
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+            "soa_serial": 1,
+            "soa_serial_auto": False,
+        }
+
+        cls.zones = (
+            Zone(name="zone1.example.com", **zone_data),
+            Zone(name="0.0.10.in-addr.arpa", **zone_data),
+        )
+        for zone in cls.zones:
+            zone.save()
+
+    def get_request(self):
+        request = RequestFactory().get(reverse("plugins:netbox_dns:record_add"))
+        request.id = uuid.uuid4()
+        request.user = self.user
+
+        return request
+
+    def test_create_records(self):
+        with event_tracking(self.get_request()):
+            for index in range(1, 4):
+                Record.objects.create(
+                    name=f"name{index}",
+                    zone=self.zones[0],
+                    type=RecordTypeChoices.A,
+                    value=f"10.0.0.{index}",
+                )
+
+        self.assertEqual(self.queue.count, 2)
+
+        jobs = {job.kwargs["data"]["id"]: job for job in self.queue.jobs}
+        self.assertEqual(set(jobs), {zone.pk for zone in self.zones})
+
+        zone_job = jobs[self.zones[0].pk]
+        self.assertEqual(zone_job.kwargs["event_type"], OBJECT_UPDATED)
+        self.assertEqual(zone_job.kwargs["data"]["name"], self.zones[0].name)
+        self.assertEqual(
+            {
+                record["value"]
+                for record in zone_job.kwargs["data"]["record_changes"]["created"]
+            },
+            {"10.0.0.1", "10.0.0.2", "10.0.0.3"},
+        )
+        self.assertEqual(zone_job.kwargs["data"]["record_changes"]["deleted"], [])
+
+        ptr_zone_job = jobs[self.zones[1].pk]
+        self.assertEqual(
+            {
+                record["name"]
+                for record in ptr_zone_job.kwargs["data"]["record_changes"]["created"]
+            },
+            {"1", "2", "3"},
+        )
+
+    def test_delete_record(self):
+        record = Record.objects.create(
+            name="name1",
+            zone=self.zones[0],
+            type=RecordTypeChoices.TXT,
+            value="text",
+        )
+        record_pk = record.pk
+        self.queue.empty()
+
+        with event_tracking(self.get_request()):
+            record.delete()
+
+        self.assertEqual(self.queue.count, 1)
+
+        job = self.queue.jobs[0]
+        self.assertEqual(job.kwargs["data"]["id"], self.zones[0].pk)
+        self.assertEqual(
+            job.kwargs["data"]["record_changes"]["deleted"],
+            [
+                {
+                    "id": record_pk,
+                    "name": "name1",
+                    "type": RecordTypeChoices.TXT,
+                    "value": "text",
+                }
+            ],
+        )
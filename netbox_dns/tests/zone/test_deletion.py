@@ -0,0 +1,200 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
+from netbox.context_managers import event_tracking
+from utilities.request import NetBoxFakeRequest
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import zone_deletion_plan
+
+
+class ZoneDeletionTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+    def setUp(self):
+        self.zones = (
+            Zone(name="zone1.example.com", **self.zone_data),
+            Zone(name="zone2.example.com", **self.zone_data),
+            Zone(name="0.0.10.in-addr.arpa", **self.zone_data),
+            Zone(name="10.in-addr.arpa", **self.zone_data),
+        )
+        for zone in self.zones:
+            zone.save()
+
+    def test_delete_forward_zone(self):
+        f_zone = self.zones[0]
+        r_zone = self.zones[2]
+
+        Record.objects.create(
+            zone=f_zone, name="name1", type=RecordTypeChoices.A, value="10.0.0.1"
+        )
+        Record.objects.create(
+            zone=f_zone, name="name2", type=RecordTypeChoices.A, value="10.0.0.2"
+        )
+        self.assertEqual(
+            Record.objects.filter(type=RecordTypeChoices.PTR, zone=r_zone).count(), 2
+        )
+
+        r_zone.refresh_from_db()
+        r_zone_serial = r_zone.soa_serial
+
+        f_zone.delete()
+
+        self.assertFalse(Zone.objects.filter(pk=f_zone.pk).exists())
+        self.assertFalse(
+            Record.objects.filter(type=RecordTypeChoices.PTR, zone=r_zone).exists()
+        )
+
+        r_zone.refresh_from_db()
+        self.assertGreaterEqual(r_zone.soa_serial, r_zone_serial)
+
+    def test_delete_ptr_zone(self):
+        f_zone = self.zones[0]
+        r_zone = self.zones[3]
+
+        f_record = Record.objects.create(
+            zone=f_zone, name="name1", type=RecordTypeChoices.A, value="10.1.0.1"
+        )
+        self.assertEqual(f_record.ptr_record.zone, r_zone)
+
+        r_zone.delete()
+
+        f_record.refresh_from_db()
+        self.assertIsNone(f_record.ptr_record)
+
+    def test_delete_ptr_zone_with_parent(self):
+        f_zone = self.zones[0]
+        r_zone1 = self.zones[2]
+        r_zone2 = self.zones[3]
+
+        f_record = Record.objects.create(
+            zone=f_zone, name="name1", type=RecordTypeChoices.A, value="10.0.0.1"
+        )
+        self.assertEqual(f_record.ptr_record.zone, r_zone1)
+
+        r_zone1.delete()
+
+        f_record.refresh_from_db()
+        self.assertEqual(f_record.ptr_record.zone, r_zone2)
+        self.assertEqual(f_record.ptr_record.value, "name1.zone1.example.com.")
+
+    def test_bulk_delete(self):
+        f_zone1 = self.zones[0]
+        f_zone2 = self.zones[1]
+        r_zone = self.zones[2]
+
+        f_record = Record.objects.create(
+            zone=f_zone1, name="name1", type=RecordTypeChoices.A, value="10.0.0.1"
+        )
+        Record.objects.create(
+            zone=f_zone2, name="name2", type=RecordTypeChoices.A, value="10.0.0.2"
+        )
+        ptr_record_pk = f_record.ptr_record.pk
+
+        zones = Zone.objects.filter(pk__in=(f_zone1.pk, f_zone2.pk))
+        with zone_deletion_plan(zones):
+            results = [zone.delete() for zone in zones]
+
+        self.assertEqual(results[0][1]["netbox_dns.Zone"], 2)
+        self.assertEqual(results[0][0], sum(results[0][1].values()))
+        self.assertEqual(results[1], (0, {}))
+
+        self.assertFalse(Zone.objects.filter(pk__in=(f_zone1.pk, f_zone2.pk)).exists())
+        self.assertFalse(Record.objects.filter(pk=ptr_record_pk).exists())
+        self.assertFalse(
+            Record.objects.filter(type=RecordTypeChoices.PTR, zone=r_zone).exists()
+        )
+
+    def test_delete_rfc2317_zone(self):
+        f_zone = self.zones[0]
+        r_zone = self.zones[2]
+
+        rfc2317_zone = Zone.objects.create(
+            name="0-31.0.0.10.in-addr.arpa",
+            rfc2317_prefix="10.0.0.0/27",
+            rfc2317_parent_managed=True,
+            **self.zone_data,
+        )
+
+        f_record = Record.objects.create(
+            zone=f_zone, name="name1", type=RecordTypeChoices.A, value="10.0.0.1"
+        )
+        cname_record = f_record.ptr_record.rfc2317_cname_record
+        self.assertEqual(cname_record.zone, r_zone)
+
+        rfc2317_zone.delete()
+
+        self.assertFalse(Record.objects.filter(pk=cname_record.pk).exists())
+
+        f_record.refresh_from_db()
+        self.assertEqual(f_record.ptr_record.zone, r_zone)
+
+    @override_settings(
+        PLUGINS_CONFIG={"netbox_dns": {"enforce_unique_rrset_ttl": False}}
+    )
+    def test_delete_rfc2317_cname_ttl_change_log(self):
+        f_zone1 = self.zones[0]
+        f_zone2 = self.zones[1]
+
+        Zone.objects.create(
+            name="0-31.0.0.10.in-addr.arpa",
+            rfc2317_prefix="10.0.0.0/27",
+            rfc2317_parent_managed=True,
+            **self.zone_data,
+        )
+
+        f_record = Record.objects.create(
+            zone=f_zone1,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+            ttl=600,
+        )
+        Record.objects.create(
+            zone=f_zone2,
+            name="name2",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+            ttl=300,
+        )
+        cname_record = Record.objects.get(
+            pk=f_record.ptr_record.rfc2317_cname_record_id
+        )
+        self.assertEqual(cname_record.ttl, 300)
+
+        request = NetBoxFakeRequest(
+            {
+                "META": {},
+                "POST": {},
+                "GET": {},
+                "FILES": {},
+                "user": get_user_model().objects.create(username="testuser"),
+                "path": "",
+                "id": uuid.uuid4(),
+            }
+        )
+
+        with event_tracking(request):
+            f_zone2.delete()
+
+        cname_record.refresh_from_db()
+        self.assertEqual(cname_record.ttl, 600)
+
+        objectchange = ObjectChange.objects.get(
+            changed_object_type=ObjectType.objects.get_for_model(Record),
+            changed_object_id=cname_record.pk,
+            action=ObjectChangeActionChoices.ACTION_UPDATE,
+            request_id=request.id,
+        )
+        self.assertEqual(objectchange.prechange_data["ttl"], 300)
+        self.assertEqual(objectchange.postchange_data["ttl"], 600)
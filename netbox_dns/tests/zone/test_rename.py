@@ -0,0 +1,150 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
+from netbox.context_managers import event_tracking
+from utilities.request import NetBoxFakeRequest
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+class ZoneRenameTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+    def setUp(self):
+        self.zone = Zone.objects.create(name="zone1.example.com", **self.zone_data)
+        self.reverse_zone = Zone.objects.create(
+            name="0.0.10.in-addr.arpa", **self.zone_data
+        )
+
+    def test_rename_record_fqdns(self):
+        records = (
+            Record(zone=self.zone, name="@", type=RecordTypeChoices.TXT, value="apex"),
+            Record(zone=self.zone, name="name1", type=RecordTypeChoices.TXT, value="1"),
+            Record(
+                zone=self.zone, name="name2.sub", type=RecordTypeChoices.TXT, value="2"
+            ),
+            Record(zone=self.zone, name="*", type=RecordTypeChoices.TXT, value="3"),
+        )
+        for record in records:
+            record.save()
+
+        self.zone.name = "zone2.example.com"
+        self.zone.save()
+
+        for record in records:
+            record.refresh_from_db()
+
+        self.assertEqual(records[0].fqdn, "zone2.example.com.")
+        self.assertEqual(records[0].reversed_fqdn, "com.example.zone2")
+        self.assertEqual(records[1].fqdn, "name1.zone2.example.com.")
+        self.assertEqual(records[1].reversed_fqdn, "com.example.zone2.name1")
+        self.assertEqual(records[2].fqdn, "name2.sub.zone2.example.com.")
+        self.assertEqual(records[2].reversed_fqdn, "com.example.zone2.sub.name2")
+        self.assertEqual(records[3].fqdn, "*.zone2.example.com.")
+        self.assertEqual(records[3].reversed_fqdn, "com.example.zone2.*")
+
+        soa_record = self.zone.records.get(type=RecordTypeChoices.SOA)
+        self.assertEqual(soa_record.fqdn, "zone2.example.com.")
+
+    def test_rename_ptr_values(self):
+        record = Record.objects.create(
+            zone=self.zone, name="name1", type=RecordTypeChoices.A, value="10.0.0.1"
+        )
+        ptr_record = record.ptr_record
+        self.assertEqual(ptr_record.value, "name1.zone1.example.com.")
+
+        self.zone.name = "zone2.example.com"
+        self.zone.save()
+
+        ptr_record.refresh_from_db()
+        self.assertEqual(ptr_record.value, "name1.zone2.example.com.")
+        self.assertEqual(ptr_record.zone, self.reverse_zone)
+
+    def test_rename_serials(self):
+        Record.objects.create(
+            zone=self.zone, name="name1", type=RecordTypeChoices.A, value="10.0.0.1"
+        )
+        self.zone.refresh_from_db()
+        self.reverse_zone.refresh_from_db()
+        zone_serial = self.zone.soa_serial
+        reverse_zone_serial = self.reverse_zone.soa_serial
+
+        self.zone.name = "zone2.example.com"
+        self.zone.save()
+
+        self.zone.refresh_from_db()
+        self.reverse_zone.refresh_from_db()
+        self.assertGreaterEqual(self.zone.soa_serial, zone_serial)
+        self.assertGreaterEqual(self.reverse_zone.soa_serial, reverse_zone_serial)
+
+        soa_record = self.reverse_zone.records.get(type=RecordTypeChoices.SOA)
+        self.assertIn(str(self.reverse_zone.soa_serial), soa_record.value)
+
+    def test_rename_invalid_record_name(self):
+        Record.objects.create(
+            zone=self.zone,
+            name=".".join(["a" * 63] * 3),
+            type=RecordTypeChoices.TXT,
+            value="long",
+        )
+
+        self.zone.name = f"{'b' * 63}.zone1.example.com"
+        with self.assertRaises(ValidationError):
+            self.zone.save()
+
+    def test_rename_change_log(self):
+        record = Record.objects.create(
+            zone=self.zone, name="name1", type=RecordTypeChoices.A, value="10.0.0.1"
+        )
+        ptr_record = record.ptr_record
+
+        request = NetBoxFakeRequest(
+            {
+                "META": {},
+                "POST": {},
+                "GET": {},
+                "FILES": {},
+                "user": get_user_model().objects.create(username="testuser"),
+                "path": "",
+                "id": uuid.uuid4(),
+            }
+        )
+
+        with event_tracking(request):
+            self.zone.name = "zone2.example.com"
+            self.zone.save()
+
+        record_type = ObjectType.objects.get_for_model(Record)
+        record_change = ObjectChange.objects.get(
+            changed_object_type=record_type,
+            changed_object_id=record.pk,
+            action=ObjectChangeActionChoices.ACTION_UPDATE,
+            request_id=request.id,
+        )
+        self.assertEqual(
+            record_change.prechange_data["fqdn"], "name1.zone1.example.com."
+        )
+        self.assertEqual(
+            record_change.postchange_data["fqdn"], "name1.zone2.example.com."
+        )
+
+        ptr_change = ObjectChange.objects.get(
+            changed_object_type=record_type,
+            changed_object_id=ptr_record.pk,
+            action=ObjectChangeActionChoices.ACTION_UPDATE,
+            request_id=request.id,
+        )
+        self.assertEqual(
+            ptr_change.postchange_data["value"], "name1.zone2.example.com."
+        )
@@ -0,0 +1,78 @@
+from django.test import TestCase
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import reverse_name_labels
+
+
+class ZoneReversedNameTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+    def test_reverse_name_labels(self):
+        self.assertEqual(reverse_name_labels("sub.example.com"), "com.example.sub")
+        self.assertEqual(reverse_name_labels("sub.example.com."), "com.example.sub")
+        self.assertEqual(reverse_name_labels("Sub.EXAMPLE.com"), "com.example.sub")
+        self.assertEqual(reverse_name_labels("*.example.com"), "com.example.*")
+        self.assertEqual(reverse_name_labels("."), "")
+
+    def test_zone_reversed_name(self):
+        zone = Zone.objects.create(name="zone1.example.com", **self.zone_data)
+
+        zone.refresh_from_db()
+        self.assertEqual(zone.reversed_name, "com.example.zone1")
+
+    def test_record_reversed_fqdn(self):
+        zone = Zone.objects.create(name="zone1.example.com", **self.zone_data)
+        record = Record.objects.create(
+            zone=zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+        record.refresh_from_db()
+        self.assertEqual(record.reversed_fqdn, "com.example.zone1.name1")
+
+        soa_record = zone.records.get(type=RecordTypeChoices.SOA)
+        self.assertEqual(soa_record.reversed_fqdn, "com.example.zone1")
+
+    def test_rename_zone(self):
+        zone = Zone.objects.create(name="zone1.example.com", **self.zone_data)
+        record = Record.objects.create(
+            zone=zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+        zone.name = "zone2.example.com"
+        zone.save()
+
+        zone.refresh_from_db()
+        self.assertEqual(zone.reversed_name, "com.example.zone2")
+
+        record.refresh_from_db()
+        self.assertEqual(record.fqdn, "name1.zone2.example.com.")
+        self.assertEqual(record.reversed_fqdn, "com.example.zone2.name1")
+
+    def test_descendant_zones(self):
+        zones = (
+            Zone(name="example.com", **self.zone_data),
+            Zone(name="zone1.example.com", **self.zone_data),
+            Zone(name="sub.zone1.example.com", **self.zone_data),
+            Zone(name="zone1example.com", **self.zone_data),
+            Zone(name="example.com.example.org", **self.zone_data),
+        )
+        for zone in zones:
+            zone.save()
+
+        self.assertEqual(set(zones[0].descendant_zones), {zones[1], zones[2]})
+        self.assertEqual(set(zones[0].child_zones), {zones[1]})
+        self.assertEqual(set(zones[2].ancestor_zones), {zones[0], zones[1]})
+        self.assertEqual(zones[2].parent_zone, zones[1])
+        self.assertIsNone(zones[3].parent_zone)
@@ -1,5 +1,7 @@
+from netaddr import IPNetwork
 from rest_framework import status
 
+from ipam.models import IPAddress, Prefix
 from utilities.testing import create_tags, post_data
 from tenancy.models import Tenant
 from netbox.choices import CSVDelimiterChoices, ImportFormatChoices
@@ -935,6 +937,42 @@ class ZoneTemplatingViewTestCase(ModelViewTestCase):
         zones = Zone.objects.filter(name=request_data.get("name"))
         self.assertEqual(zones.count(), 0)
 
+    def test_zone_create_with_conflicting_dnssync_records(self):
+        self.add_permissions(
+            "netbox_dns.add_zone",
+            "netbox_dns.view_zonetemplate",
+            "netbox_dns.view_view",
+            "netbox_dns.view_nameserver",
+        )
+
+        self.zone_template.record_templates.set(self.record_templates[1:2])
+
+        prefix = Prefix.objects.create(prefix=IPNetwork("10.0.0.0/24"))
+        prefix.netbox_dns_views.add(View.get_default_view())
+        IPAddress.objects.create(
+            address=IPNetwork("10.0.0.1/24"), dns_name="www.test.example.com"
+        )
+
+        request_data = {
+            "name": "test.example.com",
+            "template": self.zone_template.pk,
+            **self.zone_form_data,
+        }
+        request = {
+            "path": self._get_url("add"),
+            "data": post_data(request_data),
+        }
+
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 200)
+        self.assertRegex(
+            response.content.decode(),
+            r"There is already an active record .* CNAME is not allowed",
+        )
+
+        zones = Zone.objects.filter(name=request_data.get("name"))
+        self.assertEqual(zones.count(), 0)
+
     def test_zone_update_with_records(self):
         test_templates = self.record_templates[0:4]
 
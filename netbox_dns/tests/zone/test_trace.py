@@ -0,0 +1,203 @@
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.middleware import TRACE_ID_HEADER
+from netbox_dns.utilities import trace
+
+
+def find_steps(step, operation):
+    steps = [step] if step["operation"] == operation else []
+    for child in step["steps"]:
+        steps += find_steps(child, operation)
+
+    return steps
+
+
+class CascadeTraceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+        cls.zone = Zone.objects.create(name="zone1.example.com", **zone_data)
+        cls.reverse_zone = Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data)
+
+        Record.objects.create(
+            zone=cls.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+    def test_trace_zone_rename(self):
+        self.zone.name = "zone2.example.com"
+
+        with trace("rename") as root:
+            self.zone.save()
+
+        data = root.to_dict()
+
+        self.assertEqual(data["operation"], "rename")
+        self.assertGreater(data["queries"], 0)
+        self.assertEqual([step["operation"] for step in data["steps"]], ["Zone.save"])
+
+        zone_save = data["steps"][0]
+        self.assertEqual(len(find_steps(zone_save, "Zone.update_record_fqdns")), 1)
+        self.assertGreaterEqual(
+            zone_save["queries"], sum(step["queries"] for step in zone_save["steps"])
+        )
+        self.assertGreaterEqual(data["duration"], zone_save["duration"])
+
+    def test_trace_record_save(self):
+        record = self.zone.records.get(name="name1")
+        record.value = "10.0.0.2"
+
+        with trace("update") as root:
+            record.save()
+
+        record_save = root.to_dict()["steps"][0]
+
+        self.assertEqual(record_save["operation"], "Record.save")
+        self.assertEqual(len(find_steps(record_save, "Record.update_ptr_record")), 1)
+        self.assertGreaterEqual(len(find_steps(record_save, "Zone.update_serial")), 2)
+
+    def test_no_trace(self):
+        with trace("outer") as root:
+            pass
+
+        self.assertEqual(root.steps, [])
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class CascadeTraceAPITestCase(APITestCase):
+    model = Zone
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+
+    def update_zone(self, **headers):
+        self.add_permissions("netbox_dns.change_zone")
+
+        return self.client.patch(
+            reverse(
+                "plugins-api:netbox_dns-api:zone-detail", kwargs={"pk": self.zone.pk}
+            ),
+            {"description": "Traced"},
+            format="json",
+            **self.header,
+            **headers,
+        )
+
+    def get_trace(self, trace_id):
+        return self.client.get(
+            reverse("plugins-api:netbox_dns-api:trace", kwargs={"trace_id": trace_id}),
+            **self.header,
+        )
+
+    def test_trace_request(self):
+        self.user.is_superuser = True
+        self.user.save()
+
+        response = self.update_zone(HTTP_X_NETBOX_DNS_TRACE="1")
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        trace_id = response.headers[TRACE_ID_HEADER]
+
+        response = self.get_trace(trace_id)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], trace_id)
+        self.assertEqual(len(find_steps(response.data, "Zone.save")), 1)
+        self.assertEqual(find_steps(response.data, "Zone.save")[0]["origin"], "api")
+
+    def test_untraced_request(self):
+        response = self.update_zone()
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotIn(TRACE_ID_HEADER, response.headers)
+
+    def test_trace_request_without_staff(self):
+        response = self.update_zone(HTTP_X_NETBOX_DNS_TRACE="1")
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotIn(TRACE_ID_HEADER, response.headers)
+
+    def test_trace_all_requests(self):
+        with self.settings(
+            PLUGINS_CONFIG={
+                "netbox_dns": settings.PLUGINS_CONFIG["netbox_dns"]
+                | {"cascade_trace": True}
+            }
+        ):
+            response = self.update_zone()
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIn(TRACE_ID_HEADER, response.headers)
+
+    def test_get_trace_staff(self):
+        self.user.is_staff = True
+        self.user.save()
+
+        response = self.update_zone(HTTP_X_NETBOX_DNS_TRACE="1")
+        trace_id = response.headers[TRACE_ID_HEADER]
+
+        response = self.get_trace(trace_id)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], trace_id)
+
+    def test_get_trace_without_permission(self):
+        with self.settings(
+            PLUGINS_CONFIG={
+                "netbox_dns": settings.PLUGINS_CONFIG["netbox_dns"]
+                | {"cascade_trace": True}
+            }
+        ):
+            response = self.update_zone()
+        trace_id = response.headers[TRACE_ID_HEADER]
+
+        response = self.get_trace(trace_id)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_trace_session_request(self):
+        self.user.is_staff = True
+        self.user.save()
+        self.add_permissions("netbox_dns.change_zone")
+        self.client.force_login(self.user)
+
+        response = self.client.patch(
+            reverse(
+                "plugins-api:netbox_dns-api:zone-detail", kwargs={"pk": self.zone.pk}
+            ),
+            {"description": "Traced"},
+            format="json",
+            HTTP_X_NETBOX_DNS_TRACE="1",
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertIn(TRACE_ID_HEADER, response.headers)
+
+    def test_trace_anonymous_request(self):
+        response = self.client.patch(
+            reverse(
+                "plugins-api:netbox_dns-api:zone-detail", kwargs={"pk": self.zone.pk}
+            ),
+            {"description": "Traced"},
+            format="json",
+            HTTP_X_NETBOX_DNS_TRACE="1",
+        )
+        self.assertNotIn(TRACE_ID_HEADER, response.headers)
+
+    def test_get_missing_trace(self):
+        self.user.is_superuser = True
+        self.user.save()
+
+        response = self.get_trace("0" * 32)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
@@ -1,3 +1,7 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+
 from utilities.testing import APIViewTestCases, create_tags
 
 from netbox_dns.tests.custom import (
@@ -6,6 +10,7 @@ from netbox_dns.tests.custom import (
     CustomFieldTargetAPIMixin,
 )
 from netbox_dns.models import (
+    Zone,
     ZoneTemplate,
     RecordTemplate,
     NameServer,
@@ -173,3 +178,70 @@ class ZoneTemplateAPITestCase(
             "billing_c": contacts[0].pk,
             "tags": [t.pk for t in tags],
         }
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], LOGIN_REQUIRED=True)
+class ZoneTemplateActionAPITestCase(APITestCase):
+    model = ZoneTemplate
+
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        cls.zone_template = ZoneTemplate.objects.create(name="Zone Template 1")
+        cls.zone_template.nameservers.set([nameserver])
+
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+
+    def apply_template(self):
+        return self.client.post(
+            reverse(
+                "plugins-api:netbox_dns-api:zonetemplate-apply",
+                kwargs={"pk": self.zone_template.pk},
+            ),
+            {"zones": [self.zone.pk]},
+            format="json",
+            **self.header,
+        )
+
+    def test_apply_without_add_zonetemplate(self):
+        self.add_permissions(
+            "netbox_dns.view_zonetemplate",
+            "netbox_dns.change_zone",
+            "netbox_dns.add_record",
+        )
+
+        response = self.apply_template()
+        self.assertHttpStatus(response, status.HTTP_202_ACCEPTED)
+
+    def test_apply_without_add_record(self):
+        self.add_permissions(
+            "netbox_dns.view_zonetemplate",
+            "netbox_dns.add_zonetemplate",
+            "netbox_dns.change_zone",
+        )
+
+        response = self.apply_template()
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def test_sync_without_change_record(self):
+        self.add_permissions(
+            "netbox_dns.view_zonetemplate",
+            "netbox_dns.change_zone",
+            "netbox_dns.add_record",
+        )
+
+        response = self.client.post(
+            reverse(
+                "plugins-api:netbox_dns-api:zonetemplate-sync",
+                kwargs={"pk": self.zone_template.pk},
+            ),
+            {},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,236 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
+from netbox.context_managers import event_tracking
+from utilities.request import NetBoxFakeRequest
+from utilities.testing import create_tags
+
+from netbox_dns.models import NameServer, RecordTemplate, ZoneTemplate, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+class ZoneTemplateApplyTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.tags = create_tags("Alpha", "Bravo", "Charlie")
+
+        cls.nameservers = (
+            NameServer(name="ns1.example.com"),
+            NameServer(name="ns2.example.com"),
+        )
+        NameServer.objects.bulk_create(cls.nameservers)
+
+        cls.zone_data = {
+            "soa_mname": cls.nameservers[0],
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.record_templates = (
+            RecordTemplate(
+                name="Primary MX",
+                record_name="@",
+                type=RecordTypeChoices.MX,
+                value="10 mx1.example.com.",
+            ),
+            RecordTemplate(
+                name="Strict SPF",
+                record_name="@",
+                type=RecordTypeChoices.TXT,
+                value="v=spf1 +mx -all",
+            ),
+            RecordTemplate(
+                name="WWW",
+                record_name="www",
+                type=RecordTypeChoices.CNAME,
+                value="web.example.com.",
+            ),
+        )
+        RecordTemplate.objects.bulk_create(cls.record_templates)
+        cls.record_templates[1].tags.set(cls.tags[2:3])
+
+        cls.zone_template = ZoneTemplate.objects.create(name="Test Zone Template")
+        cls.zone_template.tags.set(cls.tags[0:2])
+        cls.zone_template.nameservers.set(cls.nameservers)
+        cls.zone_template.record_templates.set(cls.record_templates)
+
+    def setUp(self):
+        self.zones = (
+            Zone(name="zone1.example.com", **self.zone_data),
+            Zone(name="zone2.example.com", **self.zone_data),
+            Zone(name="zone3.example.com", **self.zone_data),
+        )
+        for zone in self.zones:
+            zone.save()
+
+    def test_apply_to_zones(self):
+        result = self.zone_template.apply_to_zones(
+            Zone.objects.filter(pk__in=[zone.pk for zone in self.zones])
+        )
+
+        self.assertEqual(
+            result, {"zones": 3, "nameservers": 3, "tags": 3, "records": 9}
+        )
+
+        for zone in self.zones:
+            self.assertEqual(set(zone.nameservers.all()), set(self.nameservers))
+            self.assertEqual(set(zone.tags.all()), set(self.tags[0:2]))
+            self.assertEqual(
+                set(
+                    zone.records.filter(type=RecordTypeChoices.NS).values_list(
+                        "value", flat=True
+                    )
+                ),
+                {"ns1.example.com.", "ns2.example.com."},
+            )
+
+            for record_template in self.record_templates:
+                record = record_template.matching_records(zone).get()
+                self.assertEqual(
+                    set(record.tags.all()), set(record_template.tags.all())
+                )
+
+            soa_record = zone.records.get(type=RecordTypeChoices.SOA)
+            zone.refresh_from_db()
+            self.assertIn(str(zone.soa_serial), soa_record.value)
+
+        record = Record.objects.get(zone=self.zones[0], name="www")
+        self.assertEqual(record.fqdn, "www.zone1.example.com.")
+
+    def test_apply_existing_records(self):
+        Record.objects.create(
+            zone=self.zones[0],
+            name="@",
+            type=RecordTypeChoices.MX,
+            value="10 mx1.example.com.",
+        )
+        self.zones[1].nameservers.set(self.nameservers[1:2])
+
+        result = self.zone_template.apply_to_zones(self.zones)
+
+        self.assertEqual(
+            result, {"zones": 3, "nameservers": 2, "tags": 3, "records": 8}
+        )
+        self.assertEqual(
+            self.zones[0].records.filter(type=RecordTypeChoices.MX).count(), 1
+        )
+        self.assertEqual(set(self.zones[1].nameservers.all()), {self.nameservers[1]})
+
+    def test_apply_conflicting_record(self):
+        Record.objects.create(
+            zone=self.zones[2],
+            name="www",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+        with self.assertRaises(ValidationError):
+            self.zone_template.apply_to_zones(self.zones)
+
+        for zone in self.zones:
+            self.assertFalse(zone.records.filter(type=RecordTypeChoices.MX).exists())
+
+    def test_validate_records_unsaved_zone(self):
+        zone = Zone(name="zone4.example.com", **self.zone_data)
+
+        self.zone_template.validate_records(zone)
+        self.assertFalse(Zone.objects.filter(name="zone4.example.com").exists())
+
+    def test_validate_records_conflicting_record(self):
+        zone = Zone(name="zone4.example.com", **self.zone_data)
+        records = [
+            Record(zone=zone, name="www", type=RecordTypeChoices.A, value="10.0.0.1")
+        ]
+
+        with self.assertRaises(ValidationError):
+            self.zone_template.validate_records(zone, records)
+
+    def test_apply_ptr_record(self):
+        record_template = RecordTemplate.objects.create(
+            name="PTR",
+            record_name="1",
+            type=RecordTypeChoices.PTR,
+            value="host.example.com.",
+        )
+        zone_template = ZoneTemplate.objects.create(name="Reverse Zone Template")
+        zone_template.record_templates.set([record_template])
+
+        zone = Zone.objects.create(name="0.0.10.in-addr.arpa", **self.zone_data)
+        zone_template.apply_to_zones([zone])
+
+        record = record_template.matching_records(zone).get()
+        self.assertEqual(str(record.ip_address), "10.0.0.1")
+
+    def test_apply_change_log(self):
+        user = get_user_model().objects.create(username="testuser")
+        request = NetBoxFakeRequest(
+            {
+                "META": {},
+                "POST": {},
+                "GET": {},
+                "FILES": {},
+                "user": user,
+                "path": "",
+                "id": uuid.uuid4(),
+            }
+        )
+
+        with event_tracking(request):
+            self.zone_template.apply_to_zones(self.zones[0:1])
+
+        record = self.record_templates[0].matching_records(self.zones[0]).get()
+        self.assertTrue(
+            ObjectChange.objects.filter(
+                changed_object_type=ObjectType.objects.get_for_model(Record),
+                changed_object_id=record.pk,
+                action=ObjectChangeActionChoices.ACTION_CREATE,
+                request_id=request.id,
+                user=user,
+            ).exists()
+        )
+
+    def test_apply_zone_change_log(self):
+        request = NetBoxFakeRequest(
+            {
+                "META": {},
+                "POST": {},
+                "GET": {},
+                "FILES": {},
+                "user": get_user_model().objects.create(username="testuser"),
+                "path": "",
+                "id": uuid.uuid4(),
+            }
+        )
+
+        with event_tracking(request):
+            self.zone_template.apply_to_zones(self.zones[0:1])
+
+        # +
+        # Updating the SOA serial afterwards adds another entry for the zone.
+        # -
+        objectchange = (
+            ObjectChange.objects.filter(
+                changed_object_type=ObjectType.objects.get_for_model(Zone),
+                changed_object_id=self.zones[0].pk,
+                action=ObjectChangeActionChoices.ACTION_UPDATE,
+                request_id=request.id,
+            )
+            .order_by("pk")
+            .first()
+        )
+        self.assertIsNone(objectchange.prechange_data["zone_template"])
+        self.assertEqual(
+            objectchange.postchange_data["zone_template"], self.zone_template.pk
+        )
+        self.assertEqual(
+            set(objectchange.postchange_data["nameservers"]),
+            {nameserver.pk for nameserver in self.nameservers},
+        )
+        self.assertEqual(
+            set(objectchange.postchange_data["tags"]),
+            {tag.name for tag in self.tags[0:2]},
+        )
@@ -0,0 +1,186 @@
+from django.test import TestCase
+
+from netbox_dns.models import NameServer, RecordTemplate, ZoneTemplate, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+class ZoneTemplateSyncTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        cls.zone_data = {
+            "soa_mname": cls.nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.record_templates = (
+            RecordTemplate(
+                name="Primary MX",
+                record_name="@",
+                type=RecordTypeChoices.MX,
+                value="10 mx1.example.com.",
+            ),
+            RecordTemplate(
+                name="Strict SPF",
+                record_name="@",
+                type=RecordTypeChoices.TXT,
+                value="v=spf1 +mx -all",
+            ),
+            RecordTemplate(
+                name="WWW",
+                record_name="www",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            ),
+        )
+        RecordTemplate.objects.bulk_create(cls.record_templates)
+
+        cls.zone_template = ZoneTemplate.objects.create(name="Test Zone Template")
+        cls.zone_template.record_templates.set(cls.record_templates)
+
+    def setUp(self):
+        self.zones = (
+            Zone(name="zone1.example.com", **self.zone_data),
+            Zone(name="zone2.example.com", **self.zone_data),
+        )
+        for zone in self.zones:
+            zone.save()
+
+        self.zone_template.apply_to_zones(self.zones)
+
+    def test_template_links(self):
+        for zone in self.zones:
+            zone.refresh_from_db()
+            self.assertEqual(zone.zone_template, self.zone_template)
+
+            for record_template in self.record_templates:
+                record = record_template.matching_records(zone).get()
+                self.assertEqual(record.record_template, record_template)
+
+    def test_no_drift(self):
+        self.assertEqual(self.zone_template.get_drift(), {})
+
+    def test_drift(self):
+        record_template = self.record_templates[0]
+        record_template.value = "20 mx2.example.com."
+        record_template.save()
+
+        Record.objects.get(zone=self.zones[0], type=RecordTypeChoices.TXT).delete()
+
+        self.zone_template.record_templates.remove(self.record_templates[2])
+
+        drift = self.zone_template.get_drift()
+
+        zone1_records = Record.objects.filter(zone=self.zones[0])
+        zone2_records = Record.objects.filter(zone=self.zones[1])
+        self.assertEqual(
+            drift,
+            {
+                self.zones[0].pk: {
+                    "missing": [self.record_templates[1].pk],
+                    "extra": [zone1_records.get(type=RecordTypeChoices.A).pk],
+                    "divergent": [zone1_records.get(type=RecordTypeChoices.MX).pk],
+                },
+                self.zones[1].pk: {
+                    "missing": [],
+                    "extra": [zone2_records.get(type=RecordTypeChoices.A).pk],
+                    "divergent": [zone2_records.get(type=RecordTypeChoices.MX).pk],
+                },
+            },
+        )
+
+    def test_drift_zones(self):
+        Record.objects.get(zone=self.zones[0], type=RecordTypeChoices.TXT).delete()
+
+        self.assertEqual(self.zone_template.get_drift(self.zones[1:]), {})
+        self.assertIn(self.zones[0].pk, self.zone_template.get_drift(self.zones[0:1]))
+
+    def test_sync_zones(self):
+        record_template = self.record_templates[0]
+        record_template.value = "20 mx2.example.com."
+        record_template.save()
+
+        Record.objects.get(zone=self.zones[0], type=RecordTypeChoices.TXT).delete()
+
+        self.zone_template.record_templates.remove(self.record_templates[2])
+
+        soa_serials = {
+            zone.pk: zone.soa_serial
+            for zone in Zone.objects.filter(pk__in=[zone.pk for zone in self.zones])
+        }
+
+        result = self.zone_template.sync_zones()
+
+        self.assertEqual(result, {"zones": 2, "updated": 2, "created": 1})
+        self.assertEqual(
+            self.zone_template.get_drift(),
+            {
+                zone.pk: {
+                    "missing": [],
+                    "extra": [
+                        Record.objects.get(zone=zone, type=RecordTypeChoices.A).pk
+                    ],
+                    "divergent": [],
+                }
+                for zone in self.zones
+            },
+        )
+
+        for zone in self.zones:
+            self.assertEqual(
+                Record.objects.get(zone=zone, type=RecordTypeChoices.MX).value,
+                "20 mx2.example.com.",
+            )
+            self.assertTrue(
+                Record.objects.filter(zone=zone, type=RecordTypeChoices.TXT).exists()
+            )
+            self.assertTrue(
+                Record.objects.filter(zone=zone, type=RecordTypeChoices.A).exists()
+            )
+
+            zone.refresh_from_db()
+            self.assertNotEqual(zone.soa_serial, soa_serials[zone.pk])
+
+    def test_drift_description(self):
+        record_template = self.record_templates[1]
+        record_template.description = "Sender Policy Framework"
+        record_template.save()
+
+        drift = self.zone_template.get_drift()
+
+        for zone in self.zones:
+            record = Record.objects.get(zone=zone, type=RecordTypeChoices.TXT)
+            self.assertEqual(drift[zone.pk]["divergent"], [record.pk])
+
+        self.zone_template.sync_zones()
+
+        self.assertEqual(self.zone_template.get_drift(), {})
+        for zone in self.zones:
+            self.assertEqual(
+                Record.objects.get(zone=zone, type=RecordTypeChoices.TXT).description,
+                "Sender Policy Framework",
+            )
+
+    def test_drift_other_template(self):
+        other_record_template = RecordTemplate.objects.create(
+            name="Other",
+            record_name="other",
+            type=RecordTypeChoices.A,
+            value="10.0.0.2",
+        )
+        other_zone_template = ZoneTemplate.objects.create(name="Other Zone Template")
+        other_zone_template.record_templates.set([other_record_template])
+
+        other_zone_template.apply_to_zones(self.zones[0:1])
+        self.zone_template.apply_to_zones(self.zones[0:1])
+
+        record = other_record_template.matching_records(self.zones[0]).get()
+        self.assertEqual(
+            self.zone_template.get_drift(),
+            {self.zones[0].pk: {"missing": [], "extra": [record.pk], "divergent": []}},
+        )
+
+        self.zone_template.sync_zones()
+
+        self.assertTrue(Record.objects.filter(pk=record.pk).exists())
@@ -1,3 +1,9 @@
 from .dns import *
 from .conversions import *
 from .ipam_dnssync import *
+from .search import *
+from .zone_deletion import *
+from .cursor import *
+from .changelog import *
+from .metrics import *
+from .dataset import *
@@ -0,0 +1,78 @@
+from netbox.context import current_request
+
+
+__all__ = (
+    "CHANGELOG_COMPACT_FIELDS",
+    "compact_change_data",
+    "log_object_changes",
+)
+
+
+CHANGELOG_COMPACT_FIELDS = (
+    "zone",
+    "name",
+    "type",
+    "value",
+    "ttl",
+    "status",
+    "managed",
+    "tags",
+)
+
+
+def compact_change_data(prechange_data, postchange_data):
+    """
+    Reduce the pre- and post-change data of an object change for a record to
+    the fields that differ. If one of them is missing, e.g. for created and
+    deleted records or for changes without pre-change data, the other one
+    is reduced to the fields in CHANGELOG_COMPACT_FIELDS.
+    """
+    if prechange_data and postchange_data:
+        fields = {
+            field
+            for field in prechange_data.keys() | postchange_data.keys()
+            if prechange_data.get(field) != postchange_data.get(field)
+        }
+    else:
+        fields = CHANGELOG_COMPACT_FIELDS
+
+    def _compact(data):
+        if not data:
+            return data
+
+        return {field: data[field] for field in data if field in fields}
+
+    return _compact(prechange_data), _compact(postchange_data)
+
+
+def log_object_changes(objects, action, request_id=None):
+    """
+    Write the change log entries for objects that were created or updated in
+    bulk, which does not send the signals NetBox creates the entries from.
+
+    As with the signal handlers, entries without changes are skipped. Inside a
+    request the entries are attributed to the user and the ID of the request. Otherwise they are only written if 'request_id' is specified, and
+    no user is recorded.
+    """
+    from core.models import ObjectChange
+
+    user = None
+    if (request := current_request.get()) is not None:
+        user = request.user
+        request_id = request.id
+
+    if request_id is None:
+        return
+
+    objectchanges = []
+    for obj in objects:
+        objectchange = obj.to_objectchange(action)
+        if objectchange is None or not objectchange.has_changes:
+            continue
+
+        objectchange.user = user
+        objectchange.user_name = user.username if user is not None else ""
+        objectchange.request_id = request_id
+        objectchanges.append(objectchange)
+
+    ObjectChange.objects.bulk_create(objectchanges)
@@ -0,0 +1,85 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+
+from django.db.models import Q
+
+
+__all__ = (
+    "encode_record_cursor",
+    "decode_record_cursor",
+    "get_record_cursor_segments",
+    "filter_records_after_cursor",
+)
+
+
+RECORD_CURSOR_ORDERING = ("fqdn", "pk")
+
+
+def encode_record_cursor(record):
+    """
+    Return an opaque cursor for the position of a record in the (fqdn, pk)
+    ordering used for keyset pagination.
+    """
+    return urlsafe_b64encode(json.dumps([record.fqdn, record.pk]).encode()).decode()
+
+
+def decode_record_cursor(cursor):
+    """
+    Return the (fqdn, pk) tuple encoded in a cursor. An empty cursor denotes the
+    position before the first record and is returned as None.
+    """
+    if not cursor:
+        return None
+
+    try:
+        fqdn, pk = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (BinasciiError, UnicodeError, ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor}") from exc
+
+    if not isinstance(pk, int) or not isinstance(fqdn, (str, type(None))):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    return fqdn, pk
+
+
+def get_record_cursor_segments(queryset, cursor):
+    """
+    Order a record queryset by (fqdn, pk) and return the querysets for the
+    records following the position denoted by the cursor, in order: The
+    records with an FQDN after the position, followed by the records without
+    an FQDN, which are sorted last as in PostgreSQL.
+
+    The conditions on the records with an FQDN include a lower bound on the
+    FQDN, so the page is retrieved with an index range scan on the composite
+    index on (fqdn, id) regardless of its position in the table.
+    """
+    queryset = queryset.order_by(*RECORD_CURSOR_ORDERING)
+
+    if (position := decode_record_cursor(cursor)) is None:
+        return [queryset]
+
+    fqdn, pk = position
+    if fqdn is None:
+        return [queryset.filter(fqdn__isnull=True, pk__gt=pk)]
+
+    return [
+        queryset.filter(Q(fqdn__gt=fqdn) | Q(pk__gt=pk), fqdn__gte=fqdn),
+        queryset.filter(fqdn__isnull=True),
+    ]
+
+
+def filter_records_after_cursor(queryset, cursor):
+    """
+    Return the first segment returned by 'get_record_cursor_segments()' that
+    contains any records. A page at the end of the records with an FQDN may
+    therefore be shorter than requested, and the records without an FQDN
+    follow on the next page.
+    """
+    segments = get_record_cursor_segments(queryset, cursor)
+
+    for segment in segments[:-1]:
+        if segment.exists():
+            return segment
+
+    return segments[-1]
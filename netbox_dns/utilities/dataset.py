@@ -0,0 +1,252 @@
+import random
+import re
+from ipaddress import IPv4Address, IPv6Address
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.translation import gettext as _
+
+from ipam.models import IPAddress, Prefix
+
+
+__all__ = (
+    "DATASET_RECORD_TYPES",
+    "generate_dataset",
+    "delete_dataset",
+    "get_dataset_views",
+)
+
+
+DATASET_RECORD_TYPES = {
+    "A": 50,
+    "AAAA": 10,
+    "CNAME": 10,
+    "TXT": 20,
+    "MX": 10,
+}
+
+# +
+# Each view uses its own /16 in 10.0.0.0/8. Addresses for address records are
+# taken from the lower half, addresses for DNSsync from the upper half.
+# -
+MAX_VIEWS = 256
+MAX_ADDRESSES = 2**15 - 2
+MAX_RFC2317_ZONES = 4
+
+
+def get_dataset_views(name):
+    from netbox_dns.models import View
+
+    return View.objects.filter(name__regex=rf"^{re.escape(name)}-[0-9]+$")
+
+
+def _get_zone_name(name, zone_index):
+    return f"zone{zone_index}.{name}.example"
+
+
+def _get_record_data(rng, zone_name, network, record_index, records, addresses):
+    record_type = rng.choices(
+        list(DATASET_RECORD_TYPES), weights=list(DATASET_RECORD_TYPES.values())
+    )[0]
+    record_name = f"host{record_index}"
+
+    match record_type:
+        case "A":
+            value = str(IPv4Address(f"10.{network}.0.0") + next(addresses))
+        case "AAAA":
+            value = str(IPv6Address(f"fd00:{network:x}::") + record_index + 1)
+        case "CNAME":
+            value = f"host{(record_index + 1) % records}"
+        case "TXT":
+            value = f'"benchmark record {record_index} in {zone_name}"'
+        case "MX":
+            value = f"{rng.randrange(1, 100)} mail.{zone_name}."
+
+    return record_name, record_type, value
+
+
+def generate_dataset(
+    name="bench",
+    views=1,
+    zones=10,
+    records=100,
+    reverse_zones=True,
+    rfc2317_zones=0,
+    ip_addresses=0,
+    seed=0,
+    network=0,
+):
+    """
+    Create a reproducible synthetic dataset for benchmarks. The dataset
+    consists of 'views' views named '<name>-<n>', each with 'zones' forward
+    zones named 'zone<n>.<name>.example' containing 'records' records of
+    mixed types. Optionally each view gets a reverse zone for its address
+    space, 'rfc2317_zones' RFC2317 zones and a prefix with 'ip_addresses' IP
+    addresses that are synchronized to DNS records via DNSsync.
+
+    View <n> uses the network 10.<network + n>.0.0/16, so datasets with
+    different values for 'network' can coexist.
+
+    The same arguments always produce the same dataset. Return the number of
+    created objects per object type. The number of records includes SOA and
+    PTR records as well as records created by DNSsync.
+    """
+    from netbox_dns.models import NameServer, View, Zone, Record
+
+    if not re.fullmatch(r"[a-z][a-z0-9-]*", name):
+        raise ValidationError(
+            _("The dataset name must be a lowercase DNS label: {name}").format(
+                name=name
+            )
+        )
+    if network < 0 or network + views > MAX_VIEWS:
+        raise ValidationError(
+            _("A dataset can use at most {count} networks.").format(count=MAX_VIEWS)
+        )
+    if rfc2317_zones > MAX_RFC2317_ZONES:
+        raise ValidationError(
+            _("A dataset can contain at most {count} RFC2317 zones per view.").format(
+                count=MAX_RFC2317_ZONES
+            )
+        )
+    if zones * records > MAX_ADDRESSES or ip_addresses > MAX_ADDRESSES:
+        raise ValidationError(
+            _(
+                "A dataset can contain at most {count} records and IP addresses per view."
+            ).format(count=MAX_ADDRESSES)
+        )
+    if get_dataset_views(name).exists():
+        raise ValidationError(_("Dataset {name} already exists.").format(name=name))
+
+    rng = random.Random(seed)
+    result = {
+        "views": 0,
+        "zones": 0,
+        "records": 0,
+        "prefixes": 0,
+        "ip_addresses": 0,
+    }
+
+    created_views = []
+    with transaction.atomic():
+        nameserver, _created = NameServer.objects.get_or_create(
+            name=f"ns1.{name}.example"
+        )
+        zone_data = {
+            "soa_mname": nameserver,
+            "soa_rname": f"hostmaster.{name}.example",
+        }
+
+        for view_index in range(views):
+            view = View.objects.create(name=f"{name}-{view_index}")
+            created_views.append(view)
+            view_network = network + view_index
+
+            if reverse_zones:
+                Zone.objects.create(
+                    view=view, name=f"{view_network}.10.in-addr.arpa", **zone_data
+                )
+                result["zones"] += 1
+
+            for rfc2317_index in range(rfc2317_zones):
+                start = rfc2317_index * 64
+                Zone.objects.create(
+                    view=view,
+                    name=f"{start}-{start + 63}.0.{view_network}.10.in-addr.arpa",
+                    rfc2317_prefix=f"10.{view_network}.0.{start}/26",
+                    rfc2317_parent_managed=reverse_zones,
+                    **zone_data,
+                )
+                result["zones"] += 1
+
+            addresses = iter(range(1, MAX_ADDRESSES + 1))
+            for zone_index in range(zones):
+                zone = Zone.objects.create(
+                    view=view, name=_get_zone_name(name, zone_index), **zone_data
+                )
+                result["zones"] += 1
+
+                zone_records = [
+                    zone.build_record(name=record_name, type=record_type, value=value)
+                    for record_name, record_type, value in (
+                        _get_record_data(
+                            rng,
+                            zone.name,
+                            view_network,
+                            record_index,
+                            records,
+                            addresses,
+                        )
+                        for record_index in range(records)
+                    )
+                ]
+
+                # +
+                # Records that do not need PTR maintenance are created in bulk,
+                # address records individually.
+                # -
+                updated_zones = {}
+                for batch in (
+                    [record for record in zone_records if not record.is_address_record],
+                    [record for record in zone_records if record.is_address_record],
+                ):
+                    if batch:
+                        updated_zones |= zone._write_rrset([], [], batch)
+
+                for updated_zone in updated_zones.values():
+                    updated_zone.update_serial()
+
+            if ip_addresses:
+                prefix = Prefix.objects.create(prefix=f"10.{view_network}.0.0/16")
+                prefix.netbox_dns_views.add(view)
+                result["prefixes"] += 1
+
+                for address_index in range(ip_addresses):
+                    address = (
+                        IPv4Address(f"10.{view_network}.128.0") + address_index + 1
+                    )
+                    IPAddress.objects.create(
+                        address=f"{address}/16",
+                        dns_name=f"ipam{address_index}."
+                        f"{_get_zone_name(name, address_index % max(zones, 1))}",
+                    )
+                    result["ip_addresses"] += 1
+
+    result["views"] = len(created_views)
+    result["records"] = Record.objects.filter(zone__view__in=created_views).count()
+
+    return result
+
+
+def delete_dataset(name="bench"):
+    """
+    Delete a dataset created by 'generate_dataset()' including its IPAM
+    objects. Return the number of deleted views.
+    """
+    from netbox_dns.models import NameServer, Zone
+
+    from .zone_deletion import ZoneDeletionPlan
+
+    views = list(get_dataset_views(name))
+    if not views:
+        return 0
+
+    with transaction.atomic():
+        prefixes = Prefix.objects.filter(netbox_dns_views__in=views)
+        for prefix in prefixes:
+            IPAddress.objects.filter(
+                address__net_host_contained=prefix.prefix,
+                dns_name__iendswith=f".{name}.example",
+            ).delete()
+        prefixes.delete()
+
+        ZoneDeletionPlan(list(Zone.objects.filter(view__in=views))).apply()
+
+        for view in views:
+            view.delete()
+
+        NameServer.objects.filter(
+            name=f"ns1.{name}.example", zones=None, soa_zones=None
+        ).delete()
+
+    return len(views)
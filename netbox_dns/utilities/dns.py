@@ -1,6 +1,9 @@
 from dns import name as dns_name
 
-__all__ = ("get_parent_zone_names",)
+__all__ = (
+    "get_parent_zone_names",
+    "reverse_name_labels",
+)
 
 
 def get_parent_zone_names(name, min_labels=1, include_self=False):
@@ -9,3 +12,17 @@ def get_parent_zone_names(name, min_labels=1, include_self=False):
         fqdn.split(i)[1].to_text().rstrip(".")
         for i in range(min_labels + 1, len(fqdn.labels) + include_self)
     ]
+
+
+def reverse_name_labels(name):
+    """
+    Return the label-reversed, lowercase representation of a DNS name, e.g.
+    'com.example.sub' for 'sub.example.com'. All names within a subtree share
+    the reversed name of the subtree apex as a common prefix, so hierarchical
+    lookups can be done using indexed prefix scans.
+    """
+    fqdn = dns_name.from_text(name, origin=dns_name.root)
+    return ".".join(
+        dns_name.Name((label,)).to_text().lower()
+        for label in reversed(fqdn.labels[:-1])
+    )
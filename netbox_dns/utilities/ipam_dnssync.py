@@ -12,8 +12,8 @@ from ipam.models import IPAddress, Prefix
 
 from netbox_dns.choices import RecordStatusChoices
 
-from .dns import get_parent_zone_names
-from .conversions import regex_from_list
+from .dns import get_parent_zone_names, reverse_name_labels
+from .metrics import instrumented
 
 
 __all__ = (
@@ -74,6 +74,7 @@ def _match_data(ip_address, record):
     )
 
 
+@instrumented()
 def get_zones(ip_address, view=None, old_zone=None):
     from netbox_dns.models import Zone
 
@@ -91,11 +92,12 @@ def get_zones(ip_address, view=None, old_zone=None):
 
     zones = Zone.objects.filter(
         view__in=views,
-        name__iregex=regex_from_list(
-            get_parent_zone_names(
+        reversed_name__in=[
+            reverse_name_labels(name)
+            for name in get_parent_zone_names(
                 ip_address.dns_name, min_labels=min_labels, include_self=True
             )
-        ),
+        ],
         active=True,
     )
 
@@ -160,6 +162,7 @@ def check_dns_records(ip_address, zone=None, view=None):
             record.clean(new_zone=new_zone)
 
 
+@instrumented()
 def update_dns_records(ip_address, view=None, force=False):
     from netbox_dns.models import Zone, Record
 
@@ -212,6 +215,7 @@ def update_dns_records(ip_address, view=None, force=False):
     return updated
 
 
+@instrumented()
 def delete_dns_records(ip_address, view=None):
     if view is None:
         address_records = ip_address.netbox_dns_records.all()
@@ -0,0 +1,178 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+from prometheus_client import Counter, Histogram
+
+from django.conf import settings
+from django.db import connection
+
+from netbox.context import current_request
+
+
+__all__ = (
+    "ORIGIN_UI",
+    "ORIGIN_API",
+    "ORIGIN_SIGNAL",
+    "ORIGIN_COMMAND",
+    "TraceStep",
+    "get_origin",
+    "instrument",
+    "instrumented",
+    "trace",
+)
+
+
+ORIGIN_UI = "ui"
+ORIGIN_API = "api"
+ORIGIN_SIGNAL = "signal"
+ORIGIN_COMMAND = "command"
+
+OPERATION_DURATION = Histogram(
+    "netbox_dns_operation_duration_seconds",
+    "Duration of NetBox DNS operations including all operations they trigger",
+    ["operation", "origin"],
+)
+OPERATION_QUERIES = Counter(
+    "netbox_dns_operation_queries",
+    "Database queries issued by NetBox DNS operations including all operations they trigger",
+    ["operation", "origin"],
+)
+
+_origin = ContextVar("netbox_dns_origin", default=None)
+_trace_step = ContextVar("netbox_dns_trace_step", default=None)
+
+
+class TraceStep:
+    """
+    A step in a cascade trace with its duration, the number of database
+    queries issued and the steps it triggered.
+    """
+
+    def __init__(self, operation, origin):
+        self.operation = operation
+        self.origin = origin
+        self.duration = None
+        self.queries = 0
+        self.steps = []
+
+    def to_dict(self):
+        return {
+            "operation": self.operation,
+            "origin": self.origin,
+            "duration": self.duration,
+            "queries": self.queries,
+            "steps": [step.to_dict() for step in self.steps],
+        }
+
+
+def get_origin():
+    """
+    Return the origin of the current operation. Operations triggered by another
+    operation inherit its origin, otherwise the origin is determined by the
+    current request. Operations outside of a request, e.g. in management
+    commands, scripts or background jobs, are labelled as commands.
+    """
+    from utilities.api import is_api_request
+
+    if (origin := _origin.get()) is not None:
+        return origin
+
+    if (request := current_request.get()) is not None:
+        return ORIGIN_API if is_api_request(request) else ORIGIN_UI
+
+    return ORIGIN_COMMAND
+
+
+@contextmanager
+def _measure(step=None):
+    """
+    Measure the duration and the number of database queries of the enclosed
+    code. If 'step' is passed, it becomes the current step of the trace.
+    """
+    measurement = {"queries": 0}
+
+    def count_queries(execute, *args):
+        measurement["queries"] += 1
+        return execute(*args)
+
+    token = _trace_step.set(step) if step is not None else None
+    start = perf_counter()
+    try:
+        with connection.execute_wrapper(count_queries):
+            yield measurement
+    finally:
+        measurement["duration"] = perf_counter() - start
+
+        if step is not None:
+            step.duration = measurement["duration"]
+            step.queries = measurement["queries"]
+            _trace_step.reset(token)
+
+
+@contextmanager
+def instrument(operation, origin=None):
+    """
+    Measure the duration of an operation and count the database queries it
+    issues, labelled by operation and origin. The measurement is exported as
+    metrics if METRICS_ENABLED is set and added as a step to the current
+    trace if there is one, otherwise nothing is measured.
+    """
+    parent_step = _trace_step.get()
+    metrics_enabled = settings.METRICS_ENABLED
+
+    if not metrics_enabled and parent_step is None:
+        yield
+        return
+
+    if origin is None:
+        origin = get_origin()
+
+    step = None
+    if parent_step is not None:
+        step = TraceStep(operation, origin)
+        parent_step.steps.append(step)
+
+    token = _origin.set(origin)
+    try:
+        with _measure(step) as measurement:
+            yield
+    finally:
+        _origin.reset(token)
+
+        if metrics_enabled:
+            OPERATION_DURATION.labels(operation, origin).observe(
+                measurement["duration"]
+            )
+            OPERATION_QUERIES.labels(operation, origin).inc(measurement["queries"])
+
+
+def instrumented(operation=None, origin=None):
+    """
+    Decorator that instruments a function with 'instrument()'. The operation
+    defaults to the qualified name of the function, e.g. 'Record.save'.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with instrument(operation or func.__qualname__, origin=origin):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def trace(name):
+    """
+    Record a trace of all instrumented operations in the enclosed code as a
+    tree of steps. The root step named 'name' is returned and contains the
+    total duration and number of queries when the block has been left.
+    """
+    step = TraceStep(name, get_origin())
+
+    with _measure(step):
+        yield step
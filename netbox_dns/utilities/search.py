@@ -0,0 +1,53 @@
+from django.contrib.contenttypes.models import ContentType
+
+from extras.models import CachedValue
+from netbox.search.backends import search_backend
+
+
+__all__ = (
+    "update_search_cache",
+    "delete_search_cache",
+)
+
+
+def update_search_cache(queryset, batch_size=1000):
+    """
+    Rebuild the global search cache entries for all objects in a queryset. This
+    is required for objects that have been modified using queryset updates,
+    which bypass the signal handlers maintaining the cache. Stale entries are
+    removed with one query per batch instead of one query per object.
+    """
+    object_type = ContentType.objects.get_for_model(queryset.model)
+
+    counter = 0
+    batch = []
+
+    def _flush(batch):
+        CachedValue.objects.filter(
+            object_type=object_type,
+            object_id__in=[instance.pk for instance in batch],
+        ).delete()
+        return search_backend.cache(batch, remove_existing=False)
+
+    for instance in queryset.iterator(chunk_size=batch_size):
+        batch.append(instance)
+
+        if len(batch) >= batch_size:
+            counter += _flush(batch)
+            batch = []
+
+    if batch:
+        counter += _flush(batch)
+
+    return counter
+
+
+def delete_search_cache(model, object_ids):
+    """
+    Remove the global search cache entries for objects of a model that have
+    been deleted using queryset deletes, which bypass the signal handlers.
+    """
+    return CachedValue.objects.filter(
+        object_type=ContentType.objects.get_for_model(model),
+        object_id__in=object_ids,
+    ).delete()[0]
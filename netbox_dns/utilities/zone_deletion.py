@@ -0,0 +1,280 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+
+from django.db import transaction
+from django.db.models import Q, Min, OuterRef, Subquery, QuerySet
+from django.utils import timezone
+
+from core.choices import ObjectChangeActionChoices
+from netbox.plugins.utils import get_plugin_config
+from ipam.models import IPAddress
+
+from netbox_dns.choices import RecordTypeChoices
+
+from .dns import get_parent_zone_names, reverse_name_labels
+from .ipam_dnssync import update_dns_records
+from .changelog import log_object_changes
+
+
+__all__ = (
+    "ZoneDeletionPlan",
+    "zone_deletion_plan",
+    "get_zone_deletion_plan",
+)
+
+
+_zone_deletion_plan = ContextVar("netbox_dns_zone_deletion_plan", default=None)
+
+
+class ZoneDeletionPlan:
+    """
+    Delete a set of zones and clean up the objects depending on them.
+
+    The dependent objects (PTR records for address records in the zones,
+    RFC2317 CNAME records for PTR records in the zones, address records with
+    PTR records in the zones and IP addresses with DNSsync records in the zones)
+    are determined before any changes are made. They are then updated using
+    bulk statements, and the SOA serial of each affected zone is updated only
+    once. Records are only saved individually where a new PTR record or DNSsync
+    record can be created in a remaining zone.
+    """
+
+    def __init__(self, zones):
+        self.zones = zones
+        self.applied = False
+
+    @cached_property
+    def zone_pks(self):
+        if isinstance(self.zones, QuerySet):
+            return set(self.zones.values_list("pk", flat=True))
+
+        return {zone.pk for zone in self.zones}
+
+    def _get_fallback_ptr_zone_pks(self, zones):
+        from netbox_dns.models import Zone
+
+        fallback_zone_pks = set()
+        for zone in zones:
+            if (network := zone.arpa_network or zone.rfc2317_prefix) is None:
+                continue
+
+            if (
+                Zone.objects.filter(view_id=zone.view_id)
+                .exclude(pk__in=self.zone_pks)
+                .filter(
+                    Q(arpa_network__net_contains_or_equals=network)
+                    | Q(rfc2317_prefix__net_overlap=network)
+                )
+                .exists()
+            ):
+                fallback_zone_pks.add(zone.pk)
+
+        return fallback_zone_pks
+
+    def _get_dnssync_zone_pks(self, zones):
+        from netbox_dns.models import Zone
+
+        min_labels = get_plugin_config("netbox_dns", "dnssync_minimum_zone_labels")
+
+        ancestor_names = {
+            zone.pk: [
+                reverse_name_labels(name)
+                for name in get_parent_zone_names(zone.name, min_labels=min_labels)
+            ]
+            for zone in zones
+        }
+
+        remaining_ancestors = set(
+            Zone.objects.filter(
+                active=True,
+                view_id__in={zone.view_id for zone in zones},
+                reversed_name__in={
+                    name for names in ancestor_names.values() for name in names
+                },
+            )
+            .exclude(pk__in=self.zone_pks)
+            .values_list("view_id", "reversed_name")
+        )
+
+        return {
+            zone.pk
+            for zone in zones
+            if any(
+                (zone.view_id, name) in remaining_ancestors
+                for name in ancestor_names[zone.pk]
+            )
+        }
+
+    def apply(self):
+        from netbox_dns.models import ChangeFeedEntry, Zone, Record
+
+        # +
+        # Zones deleted by a plan that has already been applied are reported
+        # as not deleted, so every zone is counted only once.
+        # -
+        if self.applied:
+            return 0, {}
+        self.applied = True
+
+        zone_pks = self.zone_pks
+
+        with transaction.atomic():
+            zones = list(Zone.objects.filter(pk__in=zone_pks))
+
+            deleted_records = Q(zone_id__in=zone_pks) | Q(
+                type=RecordTypeChoices.PTR, address_record__zone_id__in=zone_pks
+            )
+
+            # +
+            # PTR records in other zones for address records in the zones
+            # -
+            ptr_records = Record.objects.filter(
+                type=RecordTypeChoices.PTR, address_record__zone_id__in=zone_pks
+            ).exclude(zone_id__in=zone_pks)
+            update_zone_pks = set(
+                ptr_records.values_list("zone_id", flat=True).distinct()
+            )
+
+            # +
+            # RFC2317 CNAME records in other zones for PTR records that are
+            # deleted. CNAME records that are still used by remaining PTR
+            # records are kept and get their TTL updated.
+            # -
+            cname_records = (
+                Record.raw_objects.filter(
+                    rfc2317_ptr_records__in=Record.raw_objects.filter(deleted_records)
+                )
+                .exclude(zone_id__in=zone_pks)
+                .distinct()
+            )
+            cname_pks = set(cname_records.values_list("pk", flat=True))
+            update_zone_pks |= set(
+                cname_records.values_list("zone_id", flat=True).distinct()
+            )
+            keep_cname_pks = set(
+                Record.raw_objects.filter(
+                    pk__in=cname_pks,
+                    rfc2317_ptr_records__in=Record.raw_objects.exclude(deleted_records),
+                ).values_list("pk", flat=True)
+            )
+
+            # +
+            # Address records in other zones with PTR records in the zones. They
+            # only need to be saved if another zone can take over the PTR
+            # records, otherwise deleting the PTR records is sufficient.
+            # -
+            address_record_pks = list(
+                Record.raw_objects.filter(
+                    ptr_record__zone_id__in=self._get_fallback_ptr_zone_pks(zones)
+                )
+                .exclude(zone_id__in=zone_pks)
+                .values_list("pk", flat=True)
+            )
+
+            # +
+            # IP addresses with DNSsync records in the zones. Their records only
+            # need to be updated if there is a remaining parent zone that can
+            # take them over.
+            # -
+            ip_address_pks = list(
+                IPAddress.objects.filter(
+                    netbox_dns_records__zone_id__in=self._get_dnssync_zone_pks(zones)
+                )
+                .distinct()
+                .values_list("pk", flat=True)
+            )
+
+            rfc2317_child_zone_pks = list(
+                Zone.objects.filter(rfc2317_parent_zone_id__in=zone_pks)
+                .exclude(pk__in=zone_pks)
+                .values_list("pk", flat=True)
+            )
+
+            # +
+            # Apply the changes. The CNAME records that are kept are updated
+            # with a queryset update, so they are snapshotted for the change
+            # log first.
+            # -
+            keep_cname_records = list(
+                Record.raw_objects.filter(pk__in=keep_cname_pks).prefetch_related(
+                    "tags"
+                )
+            )
+            for cname_record in keep_cname_records:
+                cname_record.snapshot()
+
+            now = timezone.now()
+            Record.raw_objects.filter(pk__in=keep_cname_pks).update(
+                ttl=Subquery(
+                    Record.raw_objects.filter(rfc2317_cname_record=OuterRef("pk"))
+                    .exclude(deleted_records)
+                    .values("rfc2317_cname_record")
+                    .annotate(min_ttl=Min("ttl"))
+                    .values("min_ttl")
+                ),
+                last_updated=now,
+            )
+
+            cname_ttls = dict(
+                Record.raw_objects.filter(pk__in=keep_cname_pks).values_list(
+                    "pk", "ttl"
+                )
+            )
+            for cname_record in keep_cname_records:
+                cname_record.ttl = cname_ttls[cname_record.pk]
+                cname_record.last_updated = now
+            log_object_changes(
+                keep_cname_records, ObjectChangeActionChoices.ACTION_UPDATE
+            )
+            ChangeFeedEntry.log_queryset(
+                Record.raw_objects.filter(pk__in=keep_cname_pks),
+                ObjectChangeActionChoices.ACTION_UPDATE,
+            )
+
+            ptr_records.delete()
+            Record.objects.filter(pk__in=cname_pks - keep_cname_pks).delete()
+
+            deleted = Zone.objects.filter(pk__in=zone_pks).delete()
+
+            for address_record in Record.objects.filter(
+                pk__in=address_record_pks
+            ).select_related("zone"):
+                address_record.save(
+                    update_fields=["ptr_record"], save_zone_serial=False
+                )
+                update_zone_pks.add(address_record.zone_id)
+                if address_record.ptr_record is not None:
+                    update_zone_pks.add(address_record.ptr_record.zone_id)
+
+            for child_zone in Zone.objects.filter(pk__in=rfc2317_child_zone_pks):
+                child_zone.update_rfc2317_parent_zone()
+                if child_zone.rfc2317_parent_zone_id is not None:
+                    update_zone_pks.add(child_zone.rfc2317_parent_zone_id)
+
+            for ip_address in IPAddress.objects.filter(pk__in=ip_address_pks):
+                update_dns_records(ip_address)
+
+            for zone in Zone.objects.filter(pk__in=update_zone_pks - zone_pks):
+                zone.update_serial()
+
+        return deleted
+
+
+def get_zone_deletion_plan():
+    return _zone_deletion_plan.get()
+
+
+@contextmanager
+def zone_deletion_plan(zones):
+    """
+    Delete all zones in 'zones' using a single deletion plan as soon as the
+    first of them is deleted. This is used by bulk deletion, which calls
+    'delete()' for each zone.
+    """
+    token = _zone_deletion_plan.set(ZoneDeletionPlan(zones))
+
+    try:
+        yield _zone_deletion_plan.get()
+    finally:
+        _zone_deletion_plan.reset(token)
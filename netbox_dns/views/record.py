@@ -19,7 +19,7 @@ from netbox_dns.tables import RecordTable, ManagedRecordTable, RelatedRecordTabl
 from netbox_dns.utilities import (
     value_to_unicode,
     get_parent_zone_names,
-    regex_from_list,
+    reverse_name_labels,
 )
 
 
@@ -78,9 +78,10 @@ class RecordView(generic.ObjectView):
             )
 
         if instance.zone.view.zones.filter(
-            name__iregex=regex_from_list(
-                get_parent_zone_names(instance.value_fqdn, min_labels=1)
-            ),
+            reversed_name__in=[
+                reverse_name_labels(name)
+                for name in get_parent_zone_names(instance.value_fqdn, min_labels=1)
+            ],
             active=True,
         ).exists():
             raise (
@@ -103,9 +104,10 @@ class RecordView(generic.ObjectView):
         )
 
         parent_zones = instance.zone.view.zones.filter(
-            name__iregex=regex_from_list(
-                get_parent_zone_names(instance.fqdn, include_self=True)
-            ),
+            reversed_name__in=[
+                reverse_name_labels(name)
+                for name in get_parent_zone_names(instance.fqdn, include_self=True)
+            ],
         )
 
         for parent_zone in parent_zones:
@@ -156,13 +158,14 @@ class RecordView(generic.ObjectView):
 
                 if Zone.objects.filter(
                     active=True,
-                    name__iregex=regex_from_list(
-                        get_parent_zone_names(
+                    reversed_name__in=[
+                        reverse_name_labels(zone_name)
+                        for zone_name in get_parent_zone_names(
                             instance.fqdn,
                             min_labels=len(fqdn) - len(name),
                             include_self=True,
                         )
-                    ),
+                    ],
                 ).exists():
                     context["mask_warning"] = _(
                         "Record is masked by a child zone and may not be visible in DNS"
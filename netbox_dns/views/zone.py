@@ -14,6 +14,7 @@ from netbox_dns.forms import (
     ZoneBulkEditForm,
 )
 from netbox_dns.models import Record, Zone
+from netbox_dns.utilities import zone_deletion_plan
 from netbox_dns.tables import (
     ZoneTable,
     RecordTable,
@@ -48,7 +49,6 @@ class ZoneView(generic.ObjectView):
         "tags",
         "nameservers",
         "soa_mname",
-        "records",
     )
 
     def get_extra_context(self, request, instance):
@@ -104,6 +104,18 @@ class ZoneBulkDeleteView(generic.BulkDeleteView):
     filterset = ZoneFilterSet
     table = ZoneTable
 
+    def post(self, request, **kwargs):
+        if "_confirm" not in request.POST:
+            return super().post(request, **kwargs)
+
+        if request.POST.get("_all"):
+            zones = self.filterset(request.GET, self.queryset).qs
+        else:
+            zones = self.queryset.filter(pk__in=request.POST.getlist("pk"))
+
+        with zone_deletion_plan(zones):
+            return super().post(request, **kwargs)
+
 
 class RegistrationViewTab(ViewTab):
     def render(self, instance):